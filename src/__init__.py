@@ -9,6 +9,15 @@ __author__ = "Your Name"
 __license__ = "MIT"
 
 from .config import config, get_config
-from .server import mcp
 
 __all__ = ["config", "get_config", "mcp"]
+
+
+def __getattr__(name: str):
+    # Importing the server pulls in mcp, boto3, warcio and every tool module,
+    # so only do it when ``src.mcp`` is actually requested.
+    if name == "mcp":
+        from .server import mcp
+
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
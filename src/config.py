@@ -5,18 +5,29 @@ S3 settings, rate limits, and other operational parameters.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Literal, Optional
 
-from dotenv import load_dotenv
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, Field, model_validator
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
 
-# Load environment variables from .env file
-load_dotenv()
+_dotenv_loaded = False
 
 
-class CacheConfig(BaseSettings):
+def _load_dotenv_once():
+    """Load environment variables from the .env file once per process."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+class CacheConfig(BaseModel):
     """Cache configuration settings."""
 
     cache_dir: Path = Field(
@@ -40,9 +51,13 @@ class CacheConfig(BaseSettings):
         description="Default TTL for cached items in seconds",
         ge=300,  # 5 minutes minimum
     )
+    cache_metadata_backend: Literal["sqlite", "lmdb"] = Field(
+        default="sqlite",
+        description="Disk cache metadata store ('lmdb' requires the lmdb package)",
+    )
 
 
-class S3Config(BaseSettings):
+class S3Config(BaseModel):
     """S3 and Common Crawl specific settings."""
 
     aws_region: str = Field(
@@ -67,7 +82,7 @@ class S3Config(BaseSettings):
     )
 
 
-class RateLimitConfig(BaseSettings):
+class RateLimitConfig(BaseModel):
     """Rate limiting configuration."""
 
     max_concurrent_requests: int = Field(
@@ -96,7 +111,7 @@ class RateLimitConfig(BaseSettings):
     )
 
 
-class CDXConfig(BaseSettings):
+class CDXConfig(BaseModel):
     """CDX Server configuration."""
 
     cdx_server_url: str = Field(
@@ -117,7 +132,7 @@ class CDXConfig(BaseSettings):
     )
 
 
-class RedisConfig(BaseSettings):
+class RedisConfig(BaseModel):
     """Redis configuration for distributed caching."""
 
     redis_url: Optional[str] = Field(
@@ -135,7 +150,7 @@ class RedisConfig(BaseSettings):
     )
 
 
-class ServerConfig(BaseSettings):
+class ServerConfig(BaseModel):
     """MCP server configuration."""
 
     server_name: str = Field(
@@ -156,7 +171,7 @@ class ServerConfig(BaseSettings):
     )
 
 
-class DatabaseConfig(BaseSettings):
+class DatabaseConfig(BaseModel):
     """Database configuration for persistent storage."""
 
     db_path: Path = Field(
@@ -169,26 +184,79 @@ class DatabaseConfig(BaseSettings):
     )
 
 
-class Config:
-    """Main configuration class combining all settings."""
+class _FlatEnvSettingsSource(PydanticBaseSettingsSource):
+    """Read section fields from environment variables.
+
+    Accepts the historical flat names (``CACHE_DIR``, ``REDIS_URL``, ...) and
+    nested names (``CACHE__CACHE_DIR``); nested names take precedence. Bare
+    section names (``CACHE``, ``DATABASE``, ...) are ordinary variables on
+    many hosts and are never read, so pydantic-settings' own environment
+    source (which would parse them as JSON) is not used.
+    """
+
+    def get_field_value(self, field, field_name):
+        # Values are collected per section in __call__
+        return None, field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        env = {key.lower(): value for key, value in os.environ.items()}
+        data: dict[str, Any] = {}
+        for section_name, section_field in self.settings_cls.model_fields.items():
+            section = {}
+            for name in section_field.annotation.model_fields:
+                nested_name = f"{section_name}__{name}"
+                if nested_name in env:
+                    section[name] = env[nested_name]
+                elif name in env:
+                    section[name] = env[name]
+            if section:
+                data[section_name] = section
+        return data
+
+
+class Config(BaseSettings):
+    """Main configuration class combining all settings.
+
+    Environment variables are read once for all sections. Both the flat
+    field names (``CACHE_DIR``) and nested names (``CACHE__CACHE_DIR``) are
+    accepted; nested names take precedence.
+    """
 
-    def __init__(self):
-        """Initialize configuration from environment variables."""
-        self.cache = CacheConfig()
-        self.s3 = S3Config()
-        self.rate_limit = RateLimitConfig()
-        self.cdx = CDXConfig()
-        self.redis = RedisConfig()
-        self.server = ServerConfig()
-        self.database = DatabaseConfig()
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    s3: S3Config = Field(default_factory=S3Config)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    cdx: CDXConfig = Field(default_factory=CDXConfig)
+    redis: RedisConfig = Field(default_factory=RedisConfig)
+    server: ServerConfig = Field(default_factory=ServerConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            init_settings,
+            _FlatEnvSettingsSource(settings_cls),
+            dotenv_settings,
+            file_secret_settings,
+        )
 
-        # Create necessary directories
+    @model_validator(mode="after")
+    def _finalize(self) -> "Config":
+        """Create necessary directories and derive dependent settings."""
         self._create_directories()
 
         # Enable Redis if URL is provided
         if self.redis.redis_url:
             self.redis.redis_enabled = True
 
+        return self
+
     def _create_directories(self):
         """Create necessary directories for cache and data storage."""
         self.cache.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -238,15 +306,17 @@ class Config:
         )
 
 
-# Global configuration instance
-config = Config()
-
-
 # Convenience function for getting config
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get the global configuration instance.
 
     Returns:
         The global Config instance.
     """
-    return config
+    _load_dotenv_once()
+    return Config()
+
+
+# Global configuration instance
+config = get_config()
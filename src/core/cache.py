@@ -8,21 +8,660 @@ This module provides a comprehensive caching layer with:
 The cache reduces S3 costs and improves performance by avoiding redundant downloads.
 """
 
+import asyncio
 import hashlib
+import heapq
 import json
 import logging
+import math
+import os
 import pickle
+import shutil
 import sqlite3
+import struct
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 from ..config import get_config
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 config = get_config()
 
+# Metadata is split across this many SQLite databases by the first hex digit of the key
+_METADATA_SHARDS = 16
+
+# Eviction frees space down to this fraction of the maximum cache size
+_EVICT_TARGET_RATIO = 0.9
+
+# Maximum number of bound parameters per DELETE ... IN (...) statement
+_SQL_BATCH_SIZE = 500
+
+# Access bookkeeping is flushed to SQLite after this many distinct keys or seconds
+_ACCESS_FLUSH_KEYS = 256
+_ACCESS_FLUSH_SECONDS = 5.0
+
+# The append-only access log is folded into cache_metadata this often
+_ACCESS_ROLLUP_SECONDS = 30.0
+
+# Recently missed keys are answered without touching Redis or disk
+_NEGATIVE_CACHE_SIZE = 16384
+_NEGATIVE_TTL_SECONDS = 60
+
+# Lookup table that halves every byte value, used to age sketch counters
+_HALVE = bytes(i >> 1 for i in range(256))
+
+# Serialized values carry a 1-byte codec tag
+_TAG_BYTES = b"B"
+_TAG_JSON = b"J"
+_TAG_PICKLE = b"P"
+
+# Cache metadata SQL
+_SQL_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS cache_metadata (
+        key TEXT PRIMARY KEY,
+        filename TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        last_accessed REAL NOT NULL,
+        access_count INTEGER DEFAULT 0,
+        ttl_seconds INTEGER
+    )
+"""
+_SQL_SELECT_TTL = "SELECT created_at, ttl_seconds FROM cache_metadata WHERE key = ?"
+_SQL_CREATE_ACCESS_LOG = """
+    CREATE TABLE IF NOT EXISTS access_log (
+        key TEXT NOT NULL,
+        ts REAL NOT NULL,
+        hits INTEGER NOT NULL
+    )
+"""
+_SQL_LOG_ACCESS = "INSERT INTO access_log (key, ts, hits) VALUES (?, ?, ?)"
+_SQL_ROLLUP_ACCESS = """
+    UPDATE cache_metadata
+    SET last_accessed = MAX(cache_metadata.last_accessed, agg.ts),
+        access_count = cache_metadata.access_count + agg.hits
+    FROM (
+        SELECT key, MAX(ts) AS ts, SUM(hits) AS hits
+        FROM access_log
+        GROUP BY key
+    ) AS agg
+    WHERE cache_metadata.key = agg.key
+"""
+_SQL_CLEAR_ACCESS_LOG = "DELETE FROM access_log"
+_SQL_UPSERT = """
+    INSERT INTO cache_metadata
+    (key, filename, size_bytes, created_at, last_accessed, ttl_seconds)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        filename = excluded.filename,
+        size_bytes = excluded.size_bytes,
+        created_at = excluded.created_at,
+        last_accessed = excluded.last_accessed,
+        ttl_seconds = excluded.ttl_seconds
+"""
+_SQL_SELECT_SIZE = "SELECT size_bytes FROM cache_metadata WHERE key = ?"
+_SQL_DELETE = "DELETE FROM cache_metadata WHERE key = ? RETURNING size_bytes"
+_SQL_COUNT = "SELECT COUNT(*) FROM cache_metadata"
+_SQL_TOTAL_SIZE = "SELECT COALESCE(SUM(size_bytes), 0) FROM cache_metadata"
+_SQL_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_last_accessed ON cache_metadata(last_accessed)",
+    "CREATE INDEX IF NOT EXISTS idx_size ON cache_metadata(size_bytes)",
+)
+_SQL_SELECT_LRU = """
+    SELECT last_accessed, key, size_bytes FROM cache_metadata ORDER BY last_accessed ASC
+"""
+_SQL_DELETE_ALL = "DELETE FROM cache_metadata"
+_SQL_SELECT_VICTIM = """
+    SELECT last_accessed, key FROM cache_metadata ORDER BY last_accessed ASC LIMIT 1
+"""
+_SQL_SELECT_LEGACY = """
+    SELECT key, filename, size_bytes, created_at, last_accessed, access_count, ttl_seconds
+    FROM cache_metadata
+"""
+_SQL_INSERT_LEGACY = """
+    INSERT OR IGNORE INTO cache_metadata
+    (key, filename, size_bytes, created_at, last_accessed, access_count, ttl_seconds)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+@lru_cache(maxsize=4096)
+def _hash_key(key: str) -> str:
+    """Generate hash for cache key.
+
+    Memoized, since the same URLs and query keys are looked up repeatedly.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        128-bit BLAKE2b hex digest
+    """
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _is_json_native(value: Any) -> bool:
+    """Check that a value round-trips through JSON without changing type.
+
+    Only exact ``dict``/``list``/``str``/``int``/``float``/``bool``/``None``
+    instances qualify; tuples, subclasses and non-finite floats would come
+    back as something else and must go through pickle instead.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is dict:
+            for k, v in item.items():
+                if type(k) is not str:
+                    return False
+                stack.append(v)
+        elif item_type is list:
+            stack.extend(item)
+        elif item_type is float:
+            if not math.isfinite(item):
+                return False
+        elif item_type not in (str, int, bool) and item is not None:
+            return False
+    return True
+
+
+def _encode(value: Any) -> bytes:
+    """Serialize a cache value.
+
+    Raw ``bytes`` (WARC payloads) are stored verbatim, JSON-native dicts and
+    lists (CDX results, tool reports) are encoded with orjson when available,
+    and everything else falls back to pickle.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        Tagged serialized bytes
+    """
+    value_type = type(value)
+    if value_type is bytes:
+        return _TAG_BYTES + value
+
+    if orjson is not None and value_type in (dict, list) and _is_json_native(value):
+        try:
+            return _TAG_JSON + orjson.dumps(value)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+
+    return _TAG_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(data: bytes) -> Any:
+    """Deserialize bytes produced by ``_encode``.
+
+    Untagged data written by older versions is treated as a plain pickle.
+    """
+    tag = data[:1]
+    if tag == _TAG_BYTES:
+        return data[1:]
+    if tag == _TAG_JSON:
+        if orjson is not None:
+            return orjson.loads(memoryview(data)[1:])
+        return json.loads(data[1:])
+    if tag == _TAG_PICKLE:
+        return pickle.loads(memoryview(data)[1:])
+    return pickle.loads(data)
+
+
+class MemoryLRU:
+    """Bounded in-process LRU cache.
+
+    Entries are evicted least-recently-used first once the approximate total
+    size of stored values exceeds ``max_bytes``. Access is guarded by a lock
+    so the cache can be shared between the event loop and worker threads.
+    Values are returned as stored, not copied; store immutable values (the
+    cache manager stores serialized bytes).
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initialize the LRU.
+
+        Args:
+            max_bytes: Approximate upper bound on the size of stored values
+        """
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, tuple[Any, int, float]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value and mark it as most recently used.
+
+        Returns:
+            Stored value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            value, size_bytes, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self._size -= size_bytes
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, size_bytes: int, ttl: float):
+        """Store a value, evicting old entries if over budget.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size_bytes: Approximate size of the value in bytes
+            ttl: Time-to-live in seconds
+        """
+        # Values larger than the whole budget would just flush everything else
+        if size_bytes > self.max_bytes:
+            self.pop(key)
+            return
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+
+            self._data[key] = (value, size_bytes, time.monotonic() + ttl)
+            self._size += size_bytes
+
+            while self._size > self.max_bytes:
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self._size -= evicted_size
+
+    def pop(self, key: str):
+        """Remove a key if present."""
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate size of stored values in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CountMinSketch:
+    """Approximate access-frequency counter for TinyLFU admission.
+
+    Keys are hex digests from ``_hash_key``, so each row index is taken from
+    a slice of the digest rather than rehashing. A doorkeeper bitmap absorbs
+    the first occurrence of every key so one-hit wonders never reach the
+    counters, and all counters are halved every ``10 * width`` increments so
+    stale popularity fades.
+    """
+
+    def __init__(self, width: int = 1 << 16, depth: int = 4):
+        """Initialize the sketch.
+
+        Args:
+            width: Counters per row (power of two)
+            depth: Number of rows (each consumes 8 hex digits of the key)
+        """
+        self.width = width
+        self.depth = depth
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in range(depth)]
+        self._doorkeeper = bytearray(width)
+        self._sample_size = 10 * width
+        self._additions = 0
+        self._lock = threading.Lock()
+
+    def _indexes(self, hash_key: str) -> list[int]:
+        return [int(hash_key[i * 8 : i * 8 + 8], 16) & self._mask for i in range(self.depth)]
+
+    def increment(self, hash_key: str):
+        """Record one access to a key."""
+        idx = self._indexes(hash_key)
+        with self._lock:
+            doorkeeper = self._doorkeeper
+            if not (doorkeeper[idx[0]] and doorkeeper[idx[1]]):
+                doorkeeper[idx[0]] = doorkeeper[idx[1]] = 1
+            else:
+                for row, i in zip(self._rows, idx):
+                    if row[i] < 255:
+                        row[i] += 1
+
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._rows = [row.translate(_HALVE) for row in self._rows]
+                self._doorkeeper = bytearray(self.width)
+                self._additions = 0
+
+    def estimate(self, hash_key: str) -> int:
+        """Estimate how often a key has been accessed recently."""
+        idx = self._indexes(hash_key)
+        with self._lock:
+            count = min(row[i] for row, i in zip(self._rows, idx))
+            if self._doorkeeper[idx[0]] and self._doorkeeper[idx[1]]:
+                count += 1
+        return count
+
+
+class _MetadataShard:
+    """One SQLite database holding metadata for a slice of the disk cache.
+
+    Each shard has its own long-lived WAL-mode connection, lock and running
+    size total, so writers touching different shards never contend.
+    """
+
+    def __init__(self, db_path: Path):
+        """Open the shard database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,  # Autocommit; each statement is its own transaction
+        )
+
+        with self.lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA mmap_size=1073741824")  # 1 GiB
+            self._conn.execute(_SQL_CREATE_TABLE)
+            self._conn.execute(_SQL_CREATE_ACCESS_LOG)
+            for statement in _SQL_CREATE_INDEXES:
+                self._conn.execute(statement)
+
+            # Running total of size_bytes, maintained on every insert/delete
+            self.total_size = self._conn.execute(_SQL_TOTAL_SIZE).fetchone()[0]
+
+    @contextmanager
+    def _transaction(self):
+        """Run statements in one transaction. Caller must hold ``lock``."""
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def get_ttl(self, hash_key: str) -> Optional[tuple[float, Optional[int]]]:
+        """Get (created_at, ttl_seconds) for a key, or None if unknown."""
+        with self.lock:
+            return self._conn.execute(_SQL_SELECT_TTL, (hash_key,)).fetchone()
+
+    def upsert(self, hash_key: str, filename: str, size_bytes: int, ttl: int):
+        """Insert or update the metadata row for a key."""
+        now = time.time()
+        with self.lock:
+            # RETURNING only sees the new row, so read the old size first
+            old = self._conn.execute(_SQL_SELECT_SIZE, (hash_key,)).fetchone()
+            self._conn.execute(_SQL_UPSERT, (hash_key, filename, size_bytes, now, now, ttl))
+            self.total_size += size_bytes - (old[0] if old else 0)
+
+    def delete(self, hash_key: str):
+        """Delete the metadata row for a key."""
+        with self.lock:
+            # fetchall() so the RETURNING statement runs to completion
+            for (size_bytes,) in self._conn.execute(_SQL_DELETE, (hash_key,)).fetchall():
+                self.total_size -= size_bytes
+
+    def delete_keys(self, keys: list[str], freed: int):
+        """Delete several rows in batched statements.
+
+        Args:
+            keys: Keys to delete
+            freed: Total size of the deleted rows
+        """
+        with self.lock, self._transaction() as conn:
+            for i in range(0, len(keys), _SQL_BATCH_SIZE):
+                batch = keys[i : i + _SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                conn.execute(f"DELETE FROM cache_metadata WHERE key IN ({placeholders})", batch)
+            self.total_size -= freed
+
+    def log_access(self, rows: list[tuple[str, float, int]], rollup: bool):
+        """Append hits to the access log, optionally folding it into the entries.
+
+        Args:
+            rows: (key, last_accessed, hit_count) tuples
+            rollup: Fold the access log into cache_metadata and truncate it
+        """
+        with self.lock, self._transaction() as conn:
+            conn.executemany(_SQL_LOG_ACCESS, rows)
+            if rollup:
+                conn.execute(_SQL_ROLLUP_ACCESS)
+                conn.execute(_SQL_CLEAR_ACCESS_LOG)
+
+    def lru_candidates(self, bytes_to_free: int) -> list[tuple[float, str, int]]:
+        """Least recently used rows, oldest first, covering ``bytes_to_free``.
+
+        Returns:
+            (last_accessed, key, size_bytes) tuples
+        """
+        candidates = []
+        covered = 0
+        with self.lock:
+            for row in self._conn.execute(_SQL_SELECT_LRU):
+                candidates.append(row)
+                covered += row[2]
+                if covered >= bytes_to_free:
+                    break
+        return candidates
+
+    def victim(self) -> Optional[tuple[float, str]]:
+        """(last_accessed, key) of the least recently used row, if any."""
+        with self.lock:
+            return self._conn.execute(_SQL_SELECT_VICTIM).fetchone()
+
+    def count(self) -> int:
+        """Number of rows in the shard."""
+        with self.lock:
+            return self._conn.execute(_SQL_COUNT).fetchone()[0]
+
+    def clear(self):
+        """Delete all rows and the access log."""
+        with self.lock:
+            self._conn.execute(_SQL_DELETE_ALL)
+            self._conn.execute(_SQL_CLEAR_ACCESS_LOG)
+            self.total_size = 0
+
+    def import_rows(self, rows: list[tuple]):
+        """Insert rows migrated from the single-database layout."""
+        with self.lock, self._transaction() as conn:
+            conn.executemany(_SQL_INSERT_LEGACY, rows)
+            self.total_size = conn.execute(_SQL_TOTAL_SIZE).fetchone()[0]
+
+    def close(self):
+        """Close the connection."""
+        with self.lock:
+            self._conn.close()
+
+
+class _LmdbMetadataStore:
+    """Disk cache metadata kept in an LMDB environment.
+
+    Drop-in alternative to the sharded SQLite store with the same interface.
+    Entries are fixed-size packed records keyed by hash; a second sub-database
+    keyed by ``(last_accessed, hash)`` gives eviction an ordered cursor walk
+    instead of an indexed query.
+    """
+
+    # created_at, last_accessed, access_count, size_bytes, ttl_seconds (0 = none)
+    _RECORD = struct.Struct("<ddqqq")
+    _ACCESS_KEY = struct.Struct(">d")
+
+    def __init__(self, path: Path):
+        """Open the LMDB environment.
+
+        Args:
+            path: Path to the LMDB data file
+        """
+        import lmdb
+
+        self.db_path = path
+        self.lock = threading.Lock()
+        self._env = lmdb.open(
+            str(path),
+            map_size=1 << 35,  # Address space reservation; the file grows as needed
+            subdir=False,
+            max_dbs=2,
+            sync=False,  # A lost update after a crash is just a cache miss
+            writemap=True,
+        )
+        self._entries = self._env.open_db(b"entries")
+        self._by_access = self._env.open_db(b"by_access")
+
+        unpack = self._RECORD.unpack
+        with self._env.begin(db=self._entries) as txn:
+            self.total_size = sum(unpack(value)[3] for value in txn.cursor().iternext(keys=False))
+
+    def _access_key(self, last_accessed: float, key: bytes) -> bytes:
+        # Big-endian positive doubles sort bytewise in numeric order
+        return self._ACCESS_KEY.pack(last_accessed) + key
+
+    def _put(self, txn, key: bytes, record: tuple, old: Optional[bytes]):
+        if old is not None:
+            txn.delete(self._access_key(self._RECORD.unpack(old)[1], key), db=self._by_access)
+        txn.put(key, self._RECORD.pack(*record), db=self._entries)
+        txn.put(self._access_key(record[1], key), b"", db=self._by_access)
+
+    def _pop(self, txn, key: bytes) -> int:
+        old = txn.pop(key, db=self._entries)
+        if old is None:
+            return 0
+        _, last_accessed, _, size_bytes, _ = self._RECORD.unpack(old)
+        txn.delete(self._access_key(last_accessed, key), db=self._by_access)
+        return size_bytes
+
+    def get_ttl(self, hash_key: str) -> Optional[tuple[float, Optional[int]]]:
+        """Get (created_at, ttl_seconds) for a key, or None if unknown."""
+        with self._env.begin(db=self._entries) as txn:
+            value = txn.get(hash_key.encode())
+        if value is None:
+            return None
+        created_at, _, _, _, ttl = self._RECORD.unpack(value)
+        return created_at, ttl or None
+
+    def upsert(self, hash_key: str, filename: str, size_bytes: int, ttl: int):
+        """Insert or update the record for a key, keeping its access count."""
+        key = hash_key.encode()
+        now = time.time()
+        with self.lock, self._env.begin(write=True) as txn:
+            old = txn.get(key, db=self._entries)
+            access_count = self._RECORD.unpack(old)[2] if old is not None else 0
+            old_size = self._RECORD.unpack(old)[3] if old is not None else 0
+            self._put(txn, key, (now, now, access_count, size_bytes, ttl or 0), old)
+            self.total_size += size_bytes - old_size
+
+    def delete(self, hash_key: str):
+        """Delete the record for a key."""
+        with self.lock, self._env.begin(write=True) as txn:
+            self.total_size -= self._pop(txn, hash_key.encode())
+
+    def delete_keys(self, keys: list[str], freed: int):
+        """Delete several records in one write transaction."""
+        with self.lock, self._env.begin(write=True) as txn:
+            for hash_key in keys:
+                self.total_size -= self._pop(txn, hash_key.encode())
+
+    def log_access(self, rows: list[tuple[str, float, int]], rollup: bool):
+        """Apply batched hits directly; LMDB updates are cheap enough to skip the log."""
+        unpack = self._RECORD.unpack
+        with self.lock, self._env.begin(write=True) as txn:
+            for hash_key, ts, hits in rows:
+                key = hash_key.encode()
+                old = txn.get(key, db=self._entries)
+                if old is None:
+                    continue
+                created_at, last_accessed, access_count, size_bytes, ttl = unpack(old)
+                record = (created_at, max(last_accessed, ts), access_count + hits, size_bytes, ttl)
+                self._put(txn, key, record, old)
+
+    def lru_candidates(self, bytes_to_free: int) -> list[tuple[float, str, int]]:
+        """Least recently used records, oldest first, covering ``bytes_to_free``."""
+        candidates = []
+        covered = 0
+        unpack = self._RECORD.unpack
+        with self._env.begin() as txn:
+            for access_key in txn.cursor(db=self._by_access).iternext(values=False):
+                key = access_key[8:]
+                value = txn.get(key, db=self._entries)
+                if value is None:
+                    continue
+                size_bytes = unpack(value)[3]
+                candidates.append(
+                    (self._ACCESS_KEY.unpack(access_key[:8])[0], key.decode(), size_bytes)
+                )
+                covered += size_bytes
+                if covered >= bytes_to_free:
+                    break
+        return candidates
+
+    def victim(self) -> Optional[tuple[float, str]]:
+        """(last_accessed, key) of the least recently used record, if any."""
+        with self._env.begin(db=self._by_access) as txn:
+            cursor = txn.cursor()
+            if not cursor.first():
+                return None
+            access_key = cursor.key()
+        return self._ACCESS_KEY.unpack(access_key[:8])[0], access_key[8:].decode()
+
+    def count(self) -> int:
+        """Number of records."""
+        with self._env.begin() as txn:
+            return txn.stat(self._entries)["entries"]
+
+    def clear(self):
+        """Delete all records."""
+        with self.lock, self._env.begin(write=True) as txn:
+            txn.drop(self._entries, delete=False)
+            txn.drop(self._by_access, delete=False)
+            self.total_size = 0
+
+    def import_rows(self, rows: list[tuple]):
+        """Insert rows migrated from the single-database SQLite layout."""
+        with self.lock, self._env.begin(write=True) as txn:
+            for key, _, size_bytes, created_at, last_accessed, access_count, ttl in rows:
+                encoded = key.encode()
+                old = txn.get(encoded, db=self._entries)
+                if old is not None:
+                    continue
+                record = (created_at, last_accessed, access_count or 0, size_bytes, ttl or 0)
+                self._put(txn, encoded, record, None)
+                self.total_size += size_bytes
+
+    def close(self):
+        """Close the environment."""
+        with self.lock:
+            self._env.close()
+
 
 class CacheManager:
     """Multi-tier cache manager.
@@ -42,76 +681,144 @@ class CacheManager:
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize disk cache metadata database
-        self.db_path = self.cache_dir / "cache_metadata.db"
+        # In-process LRU for hot data
+        self._mem = MemoryLRU(config.cache.memory_cache_size_mb * 1024**2)
+
+        # Known-missing keys (each entry counts as one "byte" of the budget)
+        self._neg = MemoryLRU(_NEGATIVE_CACHE_SIZE)
+
+        # Initialize disk cache metadata databases
+        self.meta_dir = self.cache_dir / "meta"
         self._init_db()
 
-        # Optional Redis client
-        self.redis_client = None
-        if config.redis.redis_enabled:
-            try:
-                import redis
+        # Pending disk hits: hash_key -> (last_accessed, hit_count)
+        self._pending_access: dict[str, tuple[float, int]] = {}
+        self._pending_lock = threading.Lock()
+        self._last_access_flush = time.monotonic()
+        self._last_access_rollup = time.monotonic()
 
-                self.redis_client = redis.from_url(
-                    config.redis.redis_url,
-                    decode_responses=False,  # Keep binary data
-                )
-                logger.info("Redis cache enabled")
-            except Exception as e:
-                logger.warning(f"Redis not available: {e}")
+        # Optional Redis client, created on first use
+        self._redis_client = None
+        self._redis_initialized = False
 
         # Statistics
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._admissions = 0
+        self._admission_rejections = 0
+        self._negative_hits = 0
+
+        # Access frequencies for disk admission
+        self._sketch = CountMinSketch()
+
+        # Pre-bound methods for the get() hot path
+        self._sketch_increment = self._sketch.increment
+        self._neg_get = self._neg.get
+        self._mem_get = self._mem.get
+
+    @property
+    def redis_client(self):
+        """Redis client, or None if Redis is disabled or unavailable.
+
+        The redis package is only imported the first time a cache operation
+        reaches the Redis tier.
+        """
+        if not self._redis_initialized:
+            self._redis_initialized = True
+            if config.redis.redis_enabled:
+                try:
+                    import redis.asyncio as aioredis
+
+                    self._redis_client = aioredis.from_url(
+                        config.redis.redis_url,
+                        decode_responses=False,  # Keep binary data
+                    )
+                    logger.info("Redis cache enabled")
+                except Exception as e:
+                    logger.warning(f"Redis not available: {e}")
+        return self._redis_client
 
     def _init_db(self):
-        """Initialize SQLite database for cache metadata."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS cache_metadata (
-                key TEXT PRIMARY KEY,
-                filename TEXT NOT NULL,
-                size_bytes INTEGER NOT NULL,
-                created_at REAL NOT NULL,
-                last_accessed REAL NOT NULL,
-                access_count INTEGER DEFAULT 0,
-                ttl_seconds INTEGER
-            )
+        """Open the disk cache metadata store.
+
+        By default keys are assigned to one of ``_METADATA_SHARDS`` SQLite
+        databases by the first hex digit of their hash. With
+        ``cache_metadata_backend = "lmdb"`` a single LMDB environment is used
+        instead. Metadata from the older single-database layout is migrated
+        on first start.
         """
-        )
+        self.meta_dir.mkdir(parents=True, exist_ok=True)
+        self._shards = None
 
-        conn.commit()
-        conn.close()
+        if config.cache.cache_metadata_backend == "lmdb":
+            try:
+                self._shards = [_LmdbMetadataStore(self.meta_dir / "cache_metadata.lmdb")]
+                logger.info("LMDB cache metadata enabled")
+            except ImportError as e:
+                logger.warning(f"LMDB not available, using SQLite cache metadata: {e}")
+
+        if self._shards is None:
+            self._shards = [
+                _MetadataShard(self.meta_dir / f"cache_metadata_{i:x}.db")
+                for i in range(_METADATA_SHARDS)
+            ]
+
+        legacy_path = self.cache_dir / "cache_metadata.db"
+        if legacy_path.exists():
+            self._migrate_legacy_db(legacy_path)
+
+    def _migrate_legacy_db(self, legacy_path: Path):
+        """Move rows from the single metadata database into the shards."""
+        conn = sqlite3.connect(legacy_path)
+        try:
+            rows = conn.execute(_SQL_SELECT_LEGACY).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not migrate legacy cache metadata: {e}")
+            rows = []
+        finally:
+            conn.close()
 
-    def _hash_key(self, key: str) -> str:
-        """Generate hash for cache key.
+        by_shard: list[list[tuple]] = [[] for _ in self._shards]
+        for row in rows:
+            by_shard[self._shard_index(row[0])].append(row)
+        for shard, shard_rows in zip(self._shards, by_shard):
+            if shard_rows:
+                shard.import_rows(shard_rows)
 
-        Args:
-            key: Cache key
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{legacy_path}{suffix}").unlink(missing_ok=True)
+        logger.info(f"Migrated {len(rows)} cache metadata rows to sharded databases")
 
-        Returns:
-            SHA256 hash
-        """
-        return hashlib.sha256(key.encode()).hexdigest()
+    def _shard_index(self, hash_key: str) -> int:
+        """Get the index of the metadata shard responsible for a key."""
+        return int(hash_key[0], 16) % len(self._shards)
+
+    def _shard(self, hash_key: str) -> _MetadataShard:
+        """Get the metadata shard responsible for a key."""
+        return self._shards[self._shard_index(hash_key)]
+
+    def close(self):
+        """Flush pending bookkeeping and close the metadata databases."""
+        self._flush_access(rollup=True)
+        for shard in self._shards:
+            shard.close()
 
-    def _get_cache_path(self, hash_key: str) -> Path:
+    def _get_cache_path(self, hash_key: str, create: bool = True) -> Path:
         """Get file path for cached item.
 
         Uses directory sharding: {hash[:2]}/{hash[2:4]}/{hash}.cache
 
         Args:
             hash_key: Hashed cache key
+            create: Create the shard directories if missing
 
         Returns:
             Path to cache file
         """
-        dir1 = self.cache_dir / hash_key[:2]
-        dir2 = dir1 / hash_key[2:4]
-        dir2.mkdir(parents=True, exist_ok=True)
+        dir2 = self.cache_dir / hash_key[:2] / hash_key[2:4]
+        if create:
+            dir2.mkdir(parents=True, exist_ok=True)
         return dir2 / f"{hash_key}.cache"
 
     async def get(self, key: str) -> Optional[Any]:
@@ -128,123 +835,276 @@ class CacheManager:
         Returns:
             Cached value or None
         """
-        hash_key = self._hash_key(key)
+        hash_key = _hash_key(key)
+        self._sketch_increment(hash_key)
 
-        # Check memory cache (via LRU function cache)
-        memory_value = self._memory_get(hash_key)
-        if memory_value is not None:
+        # Recently confirmed miss
+        if self._neg_get(hash_key):
+            self._misses += 1
+            self._negative_hits += 1
+            return None
+
+        # Check memory cache
+        memory_data = self._mem_get(hash_key)
+        if memory_data is not None:
             self._hits += 1
-            logger.debug(f"Cache HIT (memory): {key}")
-            return memory_value
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache HIT (memory): {key}")
+            return _decode(memory_data)
 
         # Check Redis cache
         if self.redis_client:
             try:
-                redis_value = self.redis_client.get(f"cc:{hash_key}")
+                redis_value = await self.redis_client.get(f"cc:{hash_key}")
                 if redis_value:
-                    value = pickle.loads(redis_value)
+                    value = _decode(redis_value)
                     # Populate memory cache
-                    self._memory_set(hash_key, value)
+                    self._memory_set(hash_key, redis_value)
                     self._hits += 1
-                    logger.debug(f"Cache HIT (redis): {key}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Cache HIT (redis): {key}")
                     return value
             except Exception as e:
                 logger.warning(f"Redis get error: {e}")
 
-        # Check disk cache
-        disk_value = self._disk_get(hash_key)
-        if disk_value is not None:
-            # Populate higher-tier caches
-            self._memory_set(hash_key, disk_value)
-            if self.redis_client:
-                try:
-                    self.redis_client.setex(
-                        f"cc:{hash_key}",
-                        config.redis.redis_ttl_seconds,
-                        pickle.dumps(disk_value),
-                    )
-                except Exception as e:
-                    logger.warning(f"Redis set error: {e}")
-
-            self._hits += 1
-            logger.debug(f"Cache HIT (disk): {key}")
-            return disk_value
+        # Check disk cache (blocking file + SQLite I/O runs in a worker thread)
+        disk_data = await asyncio.to_thread(self._disk_get, hash_key)
+        if disk_data is not None:
+            try:
+                disk_value = _decode(disk_data)
+            except Exception as e:
+                logger.error(f"Error loading from disk cache: {e}")
+            else:
+                # Populate higher-tier caches
+                self._memory_set(hash_key, disk_data)
+                if self.redis_client:
+                    try:
+                        await self.redis_client.setex(
+                            f"cc:{hash_key}",
+                            config.redis.redis_ttl_seconds,
+                            disk_data,
+                        )
+                    except Exception as e:
+                        logger.warning(f"Redis set error: {e}")
+
+                self._hits += 1
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache HIT (disk): {key}")
+                return disk_value
 
         # Cache miss
+        self._neg.set(hash_key, True, 1, _NEGATIVE_TTL_SECONDS)
         self._misses += 1
-        logger.debug(f"Cache MISS: {key}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache MISS: {key}")
         return None
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None):
         """Set item in cache.
 
-        Stores in all cache tiers.
+        Stores in all cache tiers. The value is serialized once and the same
+        bytes are shared by the Redis and disk tiers.
 
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (None for default)
         """
-        hash_key = self._hash_key(key)
+        hash_key = _hash_key(key)
         ttl = ttl or self.ttl_seconds
+        self._neg.pop(hash_key)
+
+        try:
+            data = _encode(value)
+        except Exception as e:
+            logger.error(f"Error serializing cache value for {key}: {e}")
+            return
 
         # Set in memory cache
-        self._memory_set(hash_key, value)
+        self._memory_set(hash_key, data, ttl)
 
         # Set in Redis
         if self.redis_client:
             try:
-                self.redis_client.setex(
-                    f"cc:{hash_key}",
-                    ttl,
-                    pickle.dumps(value),
-                )
+                await self.redis_client.setex(f"cc:{hash_key}", ttl, data)
             except Exception as e:
                 logger.warning(f"Redis set error: {e}")
 
         # Set in disk cache
-        self._disk_set(hash_key, value, ttl)
+        await asyncio.to_thread(self._disk_set, hash_key, data, ttl)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cached: {key}")
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several items from cache at once.
+
+        Same tier order as ``get``, but all Redis lookups and disk promotions
+        are sent as one pipeline each, and disk reads share a single worker
+        thread hop.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of key -> cached value for keys that were found
+        """
+        found: dict[str, Any] = {}
+        pending: dict[str, str] = {}
+
+        # Check memory cache
+        negative_hits = 0
+        for key in keys:
+            hash_key = _hash_key(key)
+            self._sketch.increment(hash_key)
+            if self._neg.get(hash_key):
+                negative_hits += 1
+                continue
+            value = self._memory_get(hash_key)
+            if value is not None:
+                found[key] = value
+            else:
+                pending[key] = hash_key
+
+        # Check Redis cache
+        if pending and self.redis_client:
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for hash_key in pending.values():
+                        pipe.get(f"cc:{hash_key}")
+                    redis_values = await pipe.execute()
+
+                for (key, hash_key), redis_value in zip(list(pending.items()), redis_values):
+                    if redis_value:
+                        value = _decode(redis_value)
+                        self._memory_set(hash_key, redis_value)
+                        found[key] = value
+                        del pending[key]
+            except Exception as e:
+                logger.warning(f"Redis get error: {e}")
+
+        # Check disk cache
+        if pending:
+            disk_hits = await asyncio.to_thread(
+                lambda: {key: self._disk_get(hash_key) for key, hash_key in pending.items()}
+            )
+            promote: dict[str, bytes] = {}
+            for key, disk_data in disk_hits.items():
+                if disk_data is None:
+                    continue
+                try:
+                    value = _decode(disk_data)
+                except Exception as e:
+                    logger.error(f"Error loading from disk cache: {e}")
+                    continue
+                hash_key = pending.pop(key)
+                self._memory_set(hash_key, disk_data)
+                promote[hash_key] = disk_data
+                found[key] = value
+
+            if promote and self.redis_client:
+                try:
+                    async with self.redis_client.pipeline(transaction=False) as pipe:
+                        for hash_key, disk_data in promote.items():
+                            pipe.setex(f"cc:{hash_key}", config.redis.redis_ttl_seconds, disk_data)
+                        await pipe.execute()
+                except Exception as e:
+                    logger.warning(f"Redis set error: {e}")
+
+        for hash_key in pending.values():
+            self._neg.set(hash_key, True, 1, _NEGATIVE_TTL_SECONDS)
+
+        self._hits += len(found)
+        self._misses += len(pending) + negative_hits
+        self._negative_hits += negative_hits
+        logger.debug(f"Cache get_many: {len(found)} hits, {len(pending)} misses")
+        return found
+
+    async def set_many(self, items: dict[str, Any], ttl: Optional[int] = None):
+        """Set several items in cache at once.
 
-        logger.debug(f"Cached: {key}")
+        Redis writes go out as one pipeline and disk writes share a single
+        worker thread hop.
+
+        Args:
+            items: Dictionary of key -> value to cache
+            ttl: Time-to-live in seconds (None for default)
+        """
+        ttl = ttl or self.ttl_seconds
+        encoded: dict[str, bytes] = {}
+
+        for key, value in items.items():
+            try:
+                data = _encode(value)
+            except Exception as e:
+                logger.error(f"Error serializing cache value for {key}: {e}")
+                continue
+            hash_key = _hash_key(key)
+            self._neg.pop(hash_key)
+            self._memory_set(hash_key, data, ttl)
+            encoded[hash_key] = data
+
+        if not encoded:
+            return
+
+        # Set in Redis
+        if self.redis_client:
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for hash_key, data in encoded.items():
+                        pipe.setex(f"cc:{hash_key}", ttl, data)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Redis set error: {e}")
+
+        # Set in disk cache
+        def write_all():
+            for hash_key, data in encoded.items():
+                self._disk_set(hash_key, data, ttl)
+
+        await asyncio.to_thread(write_all)
+
+        logger.debug(f"Cached {len(encoded)} items")
 
-    @lru_cache(maxsize=1024)
     def _memory_get(self, hash_key: str) -> Optional[Any]:
-        """Memory cache get (LRU)."""
-        # This function is cached itself via @lru_cache
-        # Actual data is stored in disk/redis, this just tracks what's in memory
-        return None
+        """Memory cache get (LRU).
 
-    def _memory_set(self, hash_key: str, value: Any):
+        Returns a freshly decoded copy, so callers may modify it without
+        affecting the cached value.
+        """
+        data = self._mem.get(hash_key)
+        return _decode(data) if data is not None else None
+
+    def _memory_set(self, hash_key: str, data: bytes, ttl: Optional[int] = None):
         """Memory cache set.
 
-        Uses function result caching to simulate memory cache.
+        The serialized form is stored rather than the value itself, so later
+        changes to the caller's object (or to values handed out by ``get``)
+        never reach the cache.
+
+        Args:
+            hash_key: Hashed cache key
+            data: Serialized value (from ``_encode``)
+            ttl: Time-to-live in seconds (None for default)
         """
-        # Store reference in LRU cache by calling the cached function
-        self._memory_get(hash_key)
+        self._mem.set(hash_key, data, len(data), ttl or self.ttl_seconds)
 
-    def _disk_get(self, hash_key: str) -> Optional[Any]:
+    def _disk_get(self, hash_key: str) -> Optional[bytes]:
         """Get item from disk cache.
 
         Args:
             hash_key: Hashed cache key
 
         Returns:
-            Cached value or None
+            Serialized cached value or None
         """
-        cache_path = self._get_cache_path(hash_key)
+        cache_path = self._get_cache_path(hash_key, create=False)
 
         if not cache_path.exists():
             return None
 
         # Check TTL
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT created_at, ttl_seconds FROM cache_metadata WHERE key = ?",
-            (hash_key,),
-        )
-        row = cursor.fetchone()
+        row = self._shard(hash_key).get_ttl(hash_key)
 
         if row:
             created_at, ttl = row
@@ -252,70 +1112,128 @@ class CacheManager:
 
             if ttl and age > ttl:
                 # Expired
-                conn.close()
                 self._disk_delete(hash_key)
                 return None
 
-            # Update access metadata
-            cursor.execute(
-                """
-                UPDATE cache_metadata
-                SET last_accessed = ?, access_count = access_count + 1
-                WHERE key = ?
-                """,
-                (time.time(), hash_key),
-            )
-            conn.commit()
+            # Update access metadata (batched)
+            self._record_access(hash_key)
 
-        conn.close()
-
-        # Load from file
+        # Load from file in a single read
         try:
-            with open(cache_path, "rb") as f:
-                return pickle.load(f)
+            with open(cache_path, "rb", buffering=0) as f:
+                return f.readall()
         except Exception as e:
             logger.error(f"Error loading from disk cache: {e}")
             return None
 
-    def _disk_set(self, hash_key: str, value: Any, ttl: int):
+    def _record_access(self, hash_key: str):
+        """Record a disk hit, flushing accumulated hits when due.
+
+        Eviction only needs approximate recency, so hits are accumulated in
+        memory rather than issuing an UPDATE per read.
+        """
+        with self._pending_lock:
+            _, count = self._pending_access.get(hash_key, (0.0, 0))
+            self._pending_access[hash_key] = (time.time(), count + 1)
+            due = (
+                len(self._pending_access) >= _ACCESS_FLUSH_KEYS
+                or time.monotonic() - self._last_access_flush >= _ACCESS_FLUSH_SECONDS
+            )
+
+        if due:
+            self._flush_access()
+
+    def _flush_access(self, rollup: bool = False):
+        """Write accumulated access bookkeeping in a single transaction.
+
+        Hits are appended to ``access_log`` rather than updating
+        ``cache_metadata`` in place; the log is folded into the entries table
+        every ``_ACCESS_ROLLUP_SECONDS`` or when ``rollup`` is set (before
+        eviction and stats, which need current recency).
+
+        Args:
+            rollup: Fold the access log into cache_metadata now
+        """
+        now = time.monotonic()
+        with self._pending_lock:
+            pending = self._pending_access
+            self._pending_access = {}
+            self._last_access_flush = now
+            rollup = rollup or now - self._last_access_rollup >= _ACCESS_ROLLUP_SECONDS
+            if rollup:
+                self._last_access_rollup = now
+
+        if not pending and not rollup:
+            return
+
+        by_shard: list[list[tuple[str, float, int]]] = [[] for _ in self._shards]
+        for key, (ts, count) in pending.items():
+            by_shard[self._shard_index(key)].append((key, ts, count))
+
+        for shard, rows in zip(self._shards, by_shard):
+            if rows or rollup:
+                shard.log_access(rows, rollup)
+
+    def _admit(self, hash_key: str, size_bytes: int) -> bool:
+        """TinyLFU admission check for the disk tier.
+
+        While there is room every entry is admitted. Once the cache is full, a
+        new entry is only written if it has been requested more often than
+        the entry eviction would remove next, so scans of cold keys cannot
+        flush the hot set.
+
+        Args:
+            hash_key: Hashed cache key
+            size_bytes: Serialized size of the candidate
+
+        Returns:
+            True if the entry should be written to disk
+        """
+        if self.get_cache_size() + size_bytes <= self.max_size_bytes:
+            self._admissions += 1
+            return True
+
+        victims = [victim for shard in self._shards if (victim := shard.victim())]
+        victim_key = min(victims)[1] if victims else None
+
+        if (
+            victim_key is None
+            or victim_key == hash_key
+            or self._sketch.estimate(hash_key) > self._sketch.estimate(victim_key)
+        ):
+            self._admissions += 1
+            return True
+
+        self._admission_rejections += 1
+        logger.debug(f"Disk cache admission rejected: {hash_key}")
+        return False
+
+    def _disk_set(self, hash_key: str, data: bytes, ttl: int):
         """Set item in disk cache.
 
         Args:
             hash_key: Hashed cache key
-            value: Value to cache
+            data: Serialized value to cache
             ttl: Time-to-live in seconds
         """
+        if not self._admit(hash_key, len(data)):
+            # Drop any older version so it can't be served once the new value
+            # leaves the memory tier
+            self._disk_delete(hash_key)
+            return
+
         cache_path = self._get_cache_path(hash_key)
 
         try:
-            # Serialize and write
-            with open(cache_path, "wb") as f:
-                pickle.dump(value, f)
-
-            size_bytes = cache_path.stat().st_size
+            # Write to a temp file and rename so readers never see a partial entry
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb", buffering=0) as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+            size_bytes = len(data)
 
             # Update metadata
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO cache_metadata
-                (key, filename, size_bytes, created_at, last_accessed, ttl_seconds)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    hash_key,
-                    cache_path.name,
-                    size_bytes,
-                    time.time(),
-                    time.time(),
-                    ttl,
-                ),
-            )
-
-            conn.commit()
-            conn.close()
+            self._shard(hash_key).upsert(hash_key, cache_path.name, size_bytes, ttl)
 
             # Check if we need to evict old entries
             self._maybe_evict()
@@ -325,16 +1243,29 @@ class CacheManager:
 
     def _disk_delete(self, hash_key: str):
         """Delete item from disk cache."""
-        cache_path = self._get_cache_path(hash_key)
+        self._get_cache_path(hash_key, create=False).unlink(missing_ok=True)
+
+        self._shard(hash_key).delete(hash_key)
 
-        if cache_path.exists():
-            cache_path.unlink()
+    def _disk_clear(self):
+        """Delete all items from disk cache.
+
+        Drops all metadata in one statement and removes the shard directories
+        wholesale instead of unlinking entries one by one.
+        """
+        with self._pending_lock:
+            self._pending_access.clear()
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM cache_metadata WHERE key = ?", (hash_key,))
-        conn.commit()
-        conn.close()
+        for shard in self._shards:
+            shard.clear()
+
+        shards = [
+            entry.path
+            for entry in os.scandir(self.cache_dir)
+            if entry.is_dir(follow_symlinks=False) and len(entry.name) == 2
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda path: shutil.rmtree(path, ignore_errors=True), shards))
 
     def _maybe_evict(self):
         """Evict old entries if cache is too large."""
@@ -342,57 +1273,58 @@ class CacheManager:
 
         if current_size > self.max_size_bytes:
             logger.info(f"Cache size {current_size:,} exceeds max {self.max_size_bytes:,}")
-            self._evict_lru()
-
-    def _evict_lru(self):
-        """Evict least recently used entries."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Find entries to evict (10% of total)
-        cursor.execute("SELECT COUNT(*) FROM cache_metadata")
-        total = cursor.fetchone()[0]
-        to_evict = max(1, total // 10)
-
-        # Get LRU entries
-        cursor.execute(
-            """
-            SELECT key FROM cache_metadata
-            ORDER BY last_accessed ASC
-            LIMIT ?
-            """,
-            (to_evict,),
-        )
+            self._evict_lru(current_size - int(self.max_size_bytes * _EVICT_TARGET_RATIO))
+
+    def _evict_lru(self, bytes_to_free: int):
+        """Evict least recently used entries.
 
-        keys_to_evict = [row[0] for row in cursor.fetchall()]
-        conn.close()
+        Each shard walks its ``last_accessed`` index for enough candidates to
+        cover the whole amount on its own; merging those lists gives the global
+        LRU order. The selected rows are removed with batched DELETEs per shard
+        and their files unlinked.
+
+        Args:
+            bytes_to_free: Number of bytes to reclaim
+        """
+        self._flush_access(rollup=True)
+
+        candidates = heapq.merge(*(shard.lru_candidates(bytes_to_free) for shard in self._shards))
+
+        keys_to_evict = []
+        shard_keys: list[list[str]] = [[] for _ in self._shards]
+        shard_freed = [0] * len(self._shards)
+        freed = 0
+        for _, key, size_bytes in candidates:
+            index = self._shard_index(key)
+            keys_to_evict.append(key)
+            shard_keys[index].append(key)
+            shard_freed[index] += size_bytes
+            freed += size_bytes
+            if freed >= bytes_to_free:
+                break
+
+        for shard, keys, shard_bytes in zip(self._shards, shard_keys, shard_freed):
+            if keys:
+                shard.delete_keys(keys, shard_bytes)
 
-        # Evict
         for key in keys_to_evict:
-            self._disk_delete(key)
-            self._evictions += 1
+            self._get_cache_path(key, create=False).unlink(missing_ok=True)
 
-        logger.info(f"Evicted {len(keys_to_evict)} cache entries")
+        self._evictions += len(keys_to_evict)
+        logger.info(f"Evicted {len(keys_to_evict)} cache entries ({freed:,} bytes)")
 
     def get_cache_size(self) -> int:
         """Get total cache size in bytes."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT SUM(size_bytes) FROM cache_metadata")
-        result = cursor.fetchone()[0]
-        conn.close()
-        return result or 0
+        return sum(shard.total_size for shard in self._shards)
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
         total_requests = self._hits + self._misses
         hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM cache_metadata")
-        entry_count = cursor.fetchone()[0]
-        conn.close()
+        self._flush_access(rollup=True)
+
+        entry_count = sum(shard.count() for shard in self._shards)
 
         return {
             "hits": self._hits,
@@ -403,33 +1335,36 @@ class CacheManager:
             "size_bytes": self.get_cache_size(),
             "size_gb": round(self.get_cache_size() / 1024**3, 2),
             "max_size_gb": config.cache.cache_max_size_gb,
+            "memory_entries": len(self._mem),
+            "memory_size_mb": round(self._mem.size_bytes / 1024**2, 2),
+            "admissions": self._admissions,
+            "admission_rejections": self._admission_rejections,
+            "negative_hits": self._negative_hits,
+            "key_hash_hits": _hash_key.cache_info().hits,
         }
 
     async def clear(self):
         """Clear all cache tiers."""
         # Clear disk cache
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT key FROM cache_metadata")
-        keys = [row[0] for row in cursor.fetchall()]
-        conn.close()
-
-        for key in keys:
-            self._disk_delete(key)
+        await asyncio.to_thread(self._disk_clear)
 
         # Clear Redis
         if self.redis_client:
             try:
-                self.redis_client.flushdb()
+                await self.redis_client.flushdb()
             except Exception as e:
                 logger.warning(f"Redis flush error: {e}")
 
-        # Reset memory cache
-        self._memory_get.cache_clear()
+        # Reset memory caches
+        self._mem.clear()
+        self._neg.clear()
 
         # Reset stats
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._admissions = 0
+        self._admission_rejections = 0
+        self._negative_hits = 0
 
         logger.info("Cache cleared")
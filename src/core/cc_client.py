@@ -8,18 +8,138 @@ CDX API Documentation: https://index.commoncrawl.org/
 
 import asyncio
 import logging
+import sys
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import AsyncIterator, Optional
 from urllib.parse import quote, urlencode
 
 import httpx
+from pydantic import ValidationError
 
 from ..config import get_config
-from ..models.schemas import CrawlInfo, CrawlStatus, IndexRecord
+from ..models.internal import IndexEntry
+from ..models.schemas import CrawlInfo, CrawlStatus
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _json_loads
+
+# httpx only decodes brotli when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:  # pragma: no cover - optional speedup
+    _ACCEPT_ENCODING = "gzip, deflate"
 
 logger = logging.getLogger(__name__)
 config = get_config()
 
+# The crawl list changes a few times a year; cache it in-process
+_CRAWLS_TTL_SECONDS = 3600
+_LATEST_CRAWL_TTL_SECONDS = 600
+
+
+def _parse_cdx_line(line: bytes) -> Optional[IndexEntry]:
+    """Parse one CDX JSON output line into an index record.
+
+    Lines are parsed straight from the response bytes, without decoding the
+    body to a str first.
+
+    Args:
+        line: Raw response line (one JSON array)
+
+    Returns:
+        Index record, or None if the line is empty or malformed.
+    """
+    if not line:
+        return None
+
+    try:
+        data = _json_loads(line)
+
+        # Format: [urlkey, timestamp, original_url, mime_type, status_code,
+        #          digest, length, offset, filename]
+        if len(data) >= 9:
+            # MIME types and WARC filenames repeat across rows; intern them so
+            # each distinct value is stored once
+            return IndexEntry(
+                url=data[2],
+                mime_type=sys.intern(data[3]),
+                status_code=int(data[4]),
+                digest=data[5],
+                timestamp=data[1],
+                length=int(data[6]),
+                offset=int(data[7]),
+                filename=sys.intern(data[8]),
+            )
+    except Exception as e:
+        logger.warning(f"Error parsing CDX record: {e}")
+    return None
+
+
+async def _aiter_byte_lines(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield newline-separated lines of a streamed response as bytes.
+
+    Unlike ``Response.aiter_lines`` this skips decoding to str, since the
+    JSON parser accepts bytes directly.
+    """
+    pending = b""
+    async for chunk in response.aiter_bytes():
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so
+    short bursts go through immediately while the long-run rate is capped.
+    A caller that finds the bucket empty reserves its token up front (the
+    balance goes negative) and sleeps for its share, so concurrent waiters
+    are spaced out rather than all waking at the same instant.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second's worth)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+
+    def consume(self) -> float:
+        """Take one token.
+
+        Returns:
+            Seconds to wait before proceeding (0.0 if a token was available).
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= 1
+
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    async def acquire(self):
+        """Wait until a token is available."""
+        pause = self.consume()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
 
 class CDXClient:
     """Client for Common Crawl CDX Server API.
@@ -34,18 +154,27 @@ class CDXClient:
         self.timeout = config.cdx.cdx_timeout_seconds
         self.max_results = config.cdx.cdx_max_results
 
-        # HTTP client with connection pooling
+        # HTTP client with connection pooling; CDX responses are NDJSON and
+        # compress well, and httpx decodes them transparently (also when
+        # streaming)
         self.client = httpx.AsyncClient(
             timeout=self.timeout,
+            headers={"Accept-Encoding": _ACCEPT_ENCODING},
             limits=httpx.Limits(
                 max_keepalive_connections=config.rate_limit.max_concurrent_requests,
                 max_connections=config.rate_limit.max_concurrent_requests * 2,
             ),
         )
 
-        # Rate limiting
+        # Rate limiting: the bucket caps requests per second, the semaphore
+        # caps requests in flight
+        self._bucket = TokenBucket(config.rate_limit.requests_per_second)
         self._rate_limiter = asyncio.Semaphore(config.rate_limit.max_concurrent_requests)
-        self._last_request_time = 0.0
+
+        # (expiry, crawls newest first) and (expiry, latest crawl ID)
+        self._crawls_cache: Optional[tuple[float, list[CrawlInfo]]] = None
+        self._latest_crawl_cache: Optional[tuple[float, str]] = None
+        self._crawls_lock = asyncio.Lock()
 
     async def close(self):
         """Close the HTTP client."""
@@ -66,29 +195,84 @@ class CDXClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with self._rate_limiter:
-            # Enforce requests per second limit
-            current_time = asyncio.get_event_loop().time()
-            time_since_last = current_time - self._last_request_time
-            min_interval = 1.0 / config.rate_limit.requests_per_second
-
-            if time_since_last < min_interval:
-                await asyncio.sleep(min_interval - time_since_last)
+        # Wait for a token before taking a concurrency slot, so throttled
+        # callers don't hold the semaphore while sleeping
+        await self._bucket.acquire()
 
+        async with self._rate_limiter:
             try:
                 response = await self.client.get(url, params=params)
                 response.raise_for_status()
-                self._last_request_time = asyncio.get_event_loop().time()
                 return response
             except httpx.HTTPError as e:
                 logger.error(f"HTTP error querying CDX: {e}")
                 raise
 
+    @asynccontextmanager
+    async def _rate_limited_stream(
+        self, url: str, params: Optional[dict] = None
+    ) -> AsyncIterator[httpx.Response]:
+        """Make a rate-limited streaming HTTP request.
+
+        The body is not read up front; iterate it with ``_aiter_byte_lines``
+        inside the ``async with`` block.
+
+        Args:
+            url: URL to request
+            params: Query parameters
+
+        Yields:
+            HTTP response with an unread body
+
+        Raises:
+            httpx.HTTPError: If request fails
+        """
+        await self._bucket.acquire()
+
+        async with self._rate_limiter:
+            try:
+                async with self.client.stream("GET", url, params=params) as response:
+                    response.raise_for_status()
+                    yield response
+            except httpx.HTTPError as e:
+                logger.error(f"HTTP error querying CDX: {e}")
+                raise
+
+    def invalidate_crawls(self):
+        """Drop the cached crawl list and latest crawl ID."""
+        self._crawls_cache = None
+        self._latest_crawl_cache = None
+
     async def list_crawls(self) -> list[CrawlInfo]:
         """List all available Common Crawl crawls.
 
+        Results are cached in-process for an hour; concurrent callers share
+        a single request to the CDX server.
+
         Returns:
-            List of crawl information.
+            List of crawl information, newest first.
+        """
+        cached = self._crawls_cache
+        if cached and cached[0] > time.monotonic():
+            return list(cached[1])
+
+        async with self._crawls_lock:
+            cached = self._crawls_cache
+            if cached and cached[0] > time.monotonic():
+                return list(cached[1])
+
+            crawls = await self._fetch_crawls()
+            if crawls:
+                # CC-MAIN-YYYY-WW IDs sort chronologically as strings
+                crawls.sort(key=lambda c: c.id, reverse=True)
+                self._crawls_cache = (time.monotonic() + _CRAWLS_TTL_SECONDS, crawls)
+            return list(crawls)
+
+    async def _fetch_crawls(self) -> list[CrawlInfo]:
+        """Fetch the crawl list from the CDX server.
+
+        Returns:
+            List of crawl information (empty on error).
         """
         url = f"{self.base_url}/collinfo.json"
 
@@ -100,28 +284,28 @@ class CDXClient:
             for crawl_data in data:
                 crawl_id = crawl_data.get("id", "")
 
-                # Parse date from crawl ID (e.g., CC-MAIN-2024-10)
+                # Parse date from crawl ID (e.g., CC-MAIN-2024-10 is ISO week 10;
+                # early crawls such as CC-MAIN-2012 have no week part)
                 try:
-                    # Extract year and week number
                     parts = crawl_id.split("-")
-                    if len(parts) >= 3:
-                        year = int(parts[2])
-                        week = int(parts[3]) if len(parts) > 3 else 1
-                        # Approximate date (first day of year + week offset)
-                        crawl_date = datetime(year, 1, 1) + timedelta(weeks=week - 1)
-                    else:
-                        crawl_date = datetime.now()
+                    week = int(parts[3]) if len(parts) > 3 else 1
+                    crawl_date = datetime.fromisocalendar(int(parts[2]), week, 1)
                 except (ValueError, IndexError):
                     crawl_date = datetime.now()
 
-                crawls.append(
-                    CrawlInfo(
-                        id=crawl_id,
-                        name=crawl_data.get("name", crawl_id),
-                        date=crawl_date,
-                        status=CrawlStatus.COMPLETE,  # All listed crawls are complete
+                # Skip entries that don't fit the model (e.g. an unexpected
+                # ID scheme) rather than losing the whole listing
+                try:
+                    crawls.append(
+                        CrawlInfo(
+                            id=crawl_id,
+                            name=crawl_data.get("name", crawl_id),
+                            date=crawl_date,
+                            status=CrawlStatus.COMPLETE,  # All listed crawls are complete
+                        )
                     )
-                )
+                except ValidationError as e:
+                    logger.warning(f"Skipping crawl {crawl_id!r} from collinfo: {e}")
 
             logger.info(f"Retrieved {len(crawls)} crawls from CDX server")
             return crawls
@@ -136,7 +320,7 @@ class CDXClient:
         crawl_id: Optional[str] = None,
         limit: int = 100,
         match_type: str = "exact",
-    ) -> list[IndexRecord]:
+    ) -> list[IndexEntry]:
         """Search the CDX index for URLs matching a query.
 
         Args:
@@ -165,36 +349,12 @@ class CDXClient:
             params["matchType"] = match_type
 
         try:
-            response = await self._rate_limited_request(url, params=params)
-            lines = response.text.strip().split("\n")
-
             records = []
-            for line in lines:
-                if not line:
-                    continue
-
-                try:
-                    data = httpx._utils.json.loads(line)
-
-                    # Parse CDX format
-                    # Format: [urlkey, timestamp, original_url, mime_type, status_code,
-                    #          digest, length, offset, filename]
-                    if len(data) >= 9:
-                        records.append(
-                            IndexRecord(
-                                url=data[2],
-                                mime_type=data[3],
-                                status_code=int(data[4]),
-                                digest=data[5],
-                                timestamp=data[1],
-                                length=int(data[6]),
-                                offset=int(data[7]),
-                                filename=data[8],
-                            )
-                        )
-                except Exception as e:
-                    logger.warning(f"Error parsing CDX record: {e}")
-                    continue
+            async with self._rate_limited_stream(url, params=params) as response:
+                async for line in _aiter_byte_lines(response):
+                    record = _parse_cdx_line(line)
+                    if record is not None:
+                        records.append(record)
 
             logger.info(f"Found {len(records)} index records for query: {query}")
             return records
@@ -208,7 +368,7 @@ class CDXClient:
         domain: str,
         crawl_id: str,
         limit: Optional[int] = None,
-    ) -> AsyncIterator[IndexRecord]:
+    ) -> AsyncIterator[IndexEntry]:
         """Get all URLs from a domain, paginated.
 
         Args:
@@ -233,52 +393,58 @@ class CDXClient:
             "limit": page_size,
         }
 
+        # Double-buffer pages: the next page is requested while the caller
+        # consumes the current one, keeping at most one request outstanding
         page = 0
-        while True:
-            if limit and fetched >= limit:
-                break
-
-            params["page"] = page
+        next_page: Optional[asyncio.Task] = asyncio.create_task(
+            self._fetch_page(url, {**params, "page": page})
+        )
 
-            try:
-                response = await self._rate_limited_request(url, params=params)
-                lines = response.text.strip().split("\n")
+        try:
+            while next_page is not None:
+                try:
+                    records = await next_page
+                except Exception as e:
+                    logger.error(f"Error fetching page {page}: {e}")
+                    break
 
-                if not lines or lines == [""]:
+                next_page = None
+                if not records:
                     break
 
-                for line in lines:
-                    if not line:
-                        continue
-
-                    try:
-                        data = httpx._utils.json.loads(line)
-                        if len(data) >= 9:
-                            record = IndexRecord(
-                                url=data[2],
-                                mime_type=data[3],
-                                status_code=int(data[4]),
-                                digest=data[5],
-                                timestamp=data[1],
-                                length=int(data[6]),
-                                offset=int(data[7]),
-                                filename=data[8],
-                            )
-                            yield record
-                            fetched += 1
-
-                            if limit and fetched >= limit:
-                                return
-
-                    except Exception as e:
-                        logger.warning(f"Error parsing CDX record: {e}")
-                        continue
+                if not (limit and fetched + len(records) >= limit):
+                    next_page = asyncio.create_task(
+                        self._fetch_page(url, {**params, "page": page + 1})
+                    )
+
+                for record in records:
+                    yield record
+                    fetched += 1
+                    if limit and fetched >= limit:
+                        return
 
                 page += 1
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _fetch_page(self, url: str, params: dict) -> list[IndexEntry]:
+        """Fetch and parse one page of CDX results.
 
-            except Exception as e:
-                logger.error(f"Error fetching page {page}: {e}")
-                break
+        Args:
+            url: Index URL
+            params: Query parameters, including the page number
+
+        Returns:
+            Index records on the page.
+        """
+        records = []
+        async with self._rate_limited_stream(url, params=params) as response:
+            async for line in _aiter_byte_lines(response):
+                record = _parse_cdx_line(line)
+                if record is not None:
+                    records.append(record)
+        return records
 
     async def get_latest_crawl(self) -> Optional[str]:
         """Get the ID of the most recent crawl.
@@ -286,14 +452,15 @@ class CDXClient:
         Returns:
             Crawl ID (e.g., "CC-MAIN-2024-10") or None.
         """
+        cached = self._latest_crawl_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
         crawls = await self.list_crawls()
         if not crawls:
             return None
 
-        # Sort by date and return most recent
-        crawls.sort(key=lambda c: c.date, reverse=True)
-        return crawls[0].id
-
-
-# Import timedelta for date calculations
-from datetime import timedelta
+        # CC-MAIN-YYYY-WW IDs sort chronologically as strings
+        latest = max(crawl.id for crawl in crawls)
+        self._latest_crawl_cache = (time.monotonic() + _LATEST_CRAWL_TTL_SECONDS, latest)
+        return latest
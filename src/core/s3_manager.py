@@ -7,10 +7,10 @@ Common Crawl S3 Bucket: s3://commoncrawl/ (public, us-east-1)
 """
 
 import asyncio
-import gzip
+import io
 import logging
 from pathlib import Path
-from typing import AsyncIterator, Callable, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Optional, Union
 
 import boto3
 from botocore import UNSIGNED
@@ -19,15 +19,87 @@ from botocore.exceptions import ClientError
 
 from ..config import get_config
 
+if TYPE_CHECKING:
+    from ..models.schemas import WarcRecord
+    from .warc_parser import WarcParser
+
+try:
+    from isal import igzip as gzip
+    from isal import isal_zlib as zlib
+except ImportError:  # pragma: no cover - optional speedup
+    import gzip
+    import zlib
+
 logger = logging.getLogger(__name__)
 config = get_config()
 
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class _DecompressingReader(io.RawIOBase):
+    """Readable stream that gunzips a blocking body as it is read.
+
+    Wraps a boto3 ``StreamingBody`` (or any object with ``read(n)``) and
+    yields decompressed bytes, restarting the decoder at each gzip member
+    boundary. Objects that are not gzipped are passed through unchanged.
+    Only one compressed chunk is held in memory at a time.
+    """
+
+    def __init__(self, raw: Any, chunk_size: int = 1024 * 1024):
+        self._raw = raw
+        self._chunk_size = chunk_size
+        self._decompressor = zlib.decompressobj(31)  # 31 = gzip header
+        self._pending = memoryview(b"")
+        self._gzipped: Optional[bool] = None
+        self._eof = False
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            if self._eof:
+                return 0
+            self._pending = memoryview(self._fill())
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def _fill(self) -> bytes:
+        """Read and decompress the next chunk of the raw body."""
+        chunk = self._raw.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return self._decompressor.flush() if self._gzipped else b""
+
+        self.bytes_read += len(chunk)
+        if self._gzipped is None:
+            self._gzipped = chunk[:2] == _GZIP_MAGIC
+        if not self._gzipped:
+            return chunk
+
+        parts = []
+        while chunk:
+            parts.append(self._decompressor.decompress(chunk))
+            if not self._decompressor.eof:
+                break
+            # Start of the next gzip member
+            chunk = self._decompressor.unused_data
+            self._decompressor = zlib.decompressobj(31)
+        return b"".join(parts)
+
 
 class S3Manager:
     """Manage S3 access to Common Crawl bucket.
 
     Provides efficient downloading and streaming of WARC/WAT/WET files
     with automatic gzip decompression and progress tracking.
+
+    boto3 is blocking, so every S3 call and body read runs in a worker
+    thread via ``asyncio.to_thread``; the client itself is thread-safe.
     """
 
     def __init__(self):
@@ -79,6 +151,11 @@ class S3Manager:
     ) -> bytes:
         """Download a file from S3.
 
+        The object size comes from the GET response itself, and chunks are
+        written into a buffer preallocated to that size, so the download is
+        a single request and a single pass with no final join. The buffer is
+        copied once into immutable ``bytes`` on return.
+
         Args:
             key: S3 object key (e.g., "crawl-data/CC-MAIN-2024-10/...")
             local_path: Optional path to save file
@@ -94,36 +171,38 @@ class S3Manager:
             try:
                 logger.info(f"Downloading s3://{self.bucket}/{key}")
 
-                # Get file size first (using our fixed method)
-                total_size = await self.get_file_size(key)
-
-                # Download object
-                response = self.client.get_object(Bucket=self.bucket, Key=key)
+                # Download object; its headers carry the size
+                response = await asyncio.to_thread(
+                    self.client.get_object, Bucket=self.bucket, Key=key
+                )
                 body = response["Body"]
+                total_size = int(response.get("ContentLength", 0))
 
-                # Read content in chunks
-                chunks = []
+                # Read content in chunks straight into the buffer
+                content = bytearray(total_size)
                 bytes_read = 0
 
-                chunk_size = 64 * 1024  # 64KB chunks
+                chunk_size = 1024 * 1024  # 1MB chunks amortize the thread hop
                 while True:
-                    chunk = body.read(chunk_size)
+                    chunk = await asyncio.to_thread(body.read, chunk_size)
                     if not chunk:
                         break
 
-                    chunks.append(chunk)
-                    bytes_read += len(chunk)
-                    self._bytes_downloaded += len(chunk)
+                    size = len(chunk)
+                    content[bytes_read : bytes_read + size] = chunk
+                    bytes_read += size
+                    self._bytes_downloaded += size
 
                     if progress_callback:
                         progress_callback(bytes_read, total_size)
 
-                content = b"".join(chunks)
+                # Trim if the body was shorter than ContentLength
+                content = bytes(memoryview(content)[:bytes_read])
 
                 # Save to file if requested
                 if local_path:
                     local_path.parent.mkdir(parents=True, exist_ok=True)
-                    local_path.write_bytes(content)
+                    await asyncio.to_thread(local_path.write_bytes, content)
                     logger.info(f"Saved to {local_path}")
 
                 logger.info(f"Downloaded {len(content):,} bytes from {key}")
@@ -133,6 +212,105 @@ class S3Manager:
                 logger.error(f"S3 download error for {key}: {e}")
                 raise
 
+    async def download_file_parallel(
+        self,
+        key: str,
+        parts: int = 8,
+        local_path: Optional[Path] = None,
+    ) -> bytes:
+        """Download a file from S3 using concurrent Range GETs.
+
+        A single GET is limited by one TCP connection; splitting a large
+        object into ranges fetched in parallel saturates the link and hides
+        per-request latency. Each part is written in place into a
+        preallocated buffer, and each part holds the rate limiter so the
+        total number of in-flight requests stays bounded.
+
+        Args:
+            key: S3 object key
+            parts: Number of ranges to fetch concurrently
+            local_path: Optional path to save file
+
+        Returns:
+            File contents as bytes
+
+        Raises:
+            ClientError: If S3 download fails
+        """
+        total_size = await self.get_file_size(key)
+        if total_size <= 0 or parts <= 1:
+            return await self.download_file(key, local_path=local_path)
+
+        logger.info(f"Downloading s3://{self.bucket}/{key} in {parts} parts")
+
+        part_size = -(-total_size // parts)
+        buffer = bytearray(total_size)
+
+        async def fetch_part(start: int) -> None:
+            end = min(start + part_size, total_size) - 1
+            data = await self._get_range(key, start, end)
+            buffer[start : start + len(data)] = data
+
+        await asyncio.gather(*(fetch_part(start) for start in range(0, total_size, part_size)))
+
+        if local_path:
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(local_path.write_bytes, buffer)
+            logger.info(f"Saved to {local_path}")
+
+        logger.info(f"Downloaded {total_size:,} bytes from {key}")
+        return bytes(buffer)
+
+    async def get_record_bytes(self, key: str, offset: int, length: int) -> bytes:
+        """Fetch a single WARC record with one Range GET.
+
+        CDX index records give the offset and length of a record inside its
+        WARC file; the returned bytes are that record's gzip member, which
+        can be parsed with ``WarcParser.parse_record_at``.
+
+        Args:
+            key: S3 object key of the WARC file
+            offset: Record offset in the WARC file
+            length: Compressed record length in bytes
+
+        Returns:
+            The record's gzip member
+
+        Example:
+            >>> data = await s3.get_record_bytes(record.filename, record.offset, record.length)
+            >>> warc_record = parser.parse_record_at(data)
+        """
+        logger.info(f"Fetching s3://{self.bucket}/{key} bytes {offset}-{offset + length - 1}")
+        return await self._get_range(key, offset, offset + length - 1)
+
+    async def _get_range(self, key: str, start: int, end: int) -> bytes:
+        """Fetch an inclusive byte range of an S3 object.
+
+        Args:
+            key: S3 object key
+            start: First byte offset
+            end: Last byte offset (inclusive)
+
+        Returns:
+            Bytes in the requested range
+        """
+
+        def read_range() -> bytes:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=key, Range=f"bytes={start}-{end}"
+            )
+            return response["Body"].read()
+
+        async with self._rate_limiter:
+            try:
+                data = await asyncio.to_thread(read_range)
+            except ClientError as e:
+                logger.error(f"S3 range error for {key} bytes {start}-{end}: {e}")
+                raise
+
+        self._bytes_downloaded += len(data)
+        return data
+
     async def stream_file(
         self,
         key: str,
@@ -151,11 +329,13 @@ class S3Manager:
             try:
                 logger.info(f"Streaming s3://{self.bucket}/{key}")
 
-                response = self.client.get_object(Bucket=self.bucket, Key=key)
+                response = await asyncio.to_thread(
+                    self.client.get_object, Bucket=self.bucket, Key=key
+                )
                 body = response["Body"]
 
                 while True:
-                    chunk = body.read(chunk_size)
+                    chunk = await asyncio.to_thread(body.read, chunk_size)
                     if not chunk:
                         break
 
@@ -170,26 +350,81 @@ class S3Manager:
         self,
         key: str,
         progress_callback: Optional[Callable[[int, int], None]] = None,
-    ) -> bytes:
+        stream: bool = False,
+    ) -> Union[bytes, AsyncIterator[bytes]]:
         """Download a gzipped file and decompress it.
 
         Args:
             key: S3 object key (should end with .gz)
             progress_callback: Optional progress callback
+            stream: If True, return an async iterator of decompressed chunks
+                instead of the whole decompressed content
 
         Returns:
-            Decompressed content
+            Decompressed content, or an async iterator of chunks in stream mode
+
+        Example:
+            >>> async for chunk in await s3.download_and_decompress(key, stream=True):
+            ...     handle(chunk)
         """
+        if stream:
+            return self.stream_and_decompress(key)
+
         compressed_data = await self.download_file(key, progress_callback=progress_callback)
 
         try:
-            decompressed_data = gzip.decompress(compressed_data)
+            decompressed_data = await asyncio.to_thread(gzip.decompress, compressed_data)
             logger.info(f"Decompressed {len(compressed_data):,} → {len(decompressed_data):,} bytes")
             return decompressed_data
         except gzip.BadGzipFile:
             logger.warning(f"File {key} is not gzipped, returning as-is")
             return compressed_data
 
+    async def download_and_decompress_to_parser(
+        self,
+        key: str,
+        parser: "WarcParser",
+        load_payload: bool = True,
+    ) -> list["WarcRecord"]:
+        """Stream a gzipped WARC file from S3 straight into the parser.
+
+        The body is decompressed as warcio reads it, so neither the
+        compressed nor the decompressed file is ever held in memory; only
+        the parsed records are. Reading and parsing run in a worker thread.
+
+        Args:
+            key: S3 object key of the WARC file
+            parser: WarcParser used to parse records
+            load_payload: Whether to read record payloads
+
+        Returns:
+            Parsed WarcRecord objects in file order
+
+        Example:
+            >>> records = await s3.download_and_decompress_to_parser(key, parser, False)
+        """
+        async with self._rate_limiter:
+            try:
+                logger.info(f"Streaming s3://{self.bucket}/{key} into WARC parser")
+
+                response = await asyncio.to_thread(
+                    self.client.get_object, Bucket=self.bucket, Key=key
+                )
+                reader = _DecompressingReader(response["Body"])
+                stream = io.BufferedReader(reader, buffer_size=1024 * 1024)
+
+                records = await asyncio.to_thread(
+                    lambda: list(parser.parse_stream(stream, load_payload=load_payload))
+                )
+                self._bytes_downloaded += reader.bytes_read
+
+                logger.info(f"Parsed {len(records):,} records from {key}")
+                return records
+
+            except ClientError as e:
+                logger.error(f"S3 streaming error for {key}: {e}")
+                raise
+
     async def stream_and_decompress(
         self,
         key: str,
@@ -197,6 +432,10 @@ class S3Manager:
     ) -> AsyncIterator[bytes]:
         """Stream a gzipped file and decompress it.
 
+        Decompression is incremental, so memory use is bounded by the chunk
+        size rather than the file size. Multi-member gzip files (as used for
+        WARC files) are decoded member by member.
+
         Args:
             key: S3 object key (should end with .gz)
             chunk_size: Chunk size for reading
@@ -204,18 +443,38 @@ class S3Manager:
         Yields:
             Decompressed chunks
         """
-        decompressor = gzip.GzipFile(fileobj=None)
+        decompressor = zlib.decompressobj(31)  # 31 = gzip header
+        passthrough = False
+        started = False
 
         async for chunk in self.stream_file(key, chunk_size):
+            if passthrough:
+                yield chunk
+                continue
+
             try:
-                decompressed = decompressor.decompress(chunk)
-                if decompressed:
-                    yield decompressed
-            except Exception as e:
-                logger.warning(f"Decompression error: {e}")
-                # If not gzipped, yield raw chunk
+                while chunk:
+                    decompressed = decompressor.decompress(chunk)
+                    started = True
+                    if decompressed:
+                        yield decompressed
+                    if not decompressor.eof:
+                        break
+                    # Start of the next gzip member
+                    chunk = decompressor.unused_data
+                    decompressor = zlib.decompressobj(31)
+            except zlib.error as e:
+                if started:
+                    raise
+                logger.warning(f"File {key} is not gzipped, streaming as-is: {e}")
+                passthrough = True
                 yield chunk
 
+        if not passthrough:
+            tail = decompressor.flush()
+            if tail:
+                yield tail
+
     async def file_exists(self, key: str) -> bool:
         """Check if a file exists in S3.
 
@@ -232,8 +491,11 @@ class S3Manager:
         try:
             # For anonymous access, use get_object with Range to avoid auth issues
             # This only fetches metadata, not actual content
-            self.client.get_object(
-                Bucket=self.bucket, Key=key, Range="bytes=0-0"  # Just check if file exists
+            await asyncio.to_thread(
+                self.client.get_object,
+                Bucket=self.bucket,
+                Key=key,
+                Range="bytes=0-0",  # Just check if file exists
             )
             return True
         except ClientError as e:
@@ -263,7 +525,9 @@ class S3Manager:
         """
         try:
             # Use Range request to get metadata including ContentLength
-            response = self.client.get_object(Bucket=self.bucket, Key=key, Range="bytes=0-0")
+            response = await asyncio.to_thread(
+                self.client.get_object, Bucket=self.bucket, Key=key, Range="bytes=0-0"
+            )
             # ContentRange header format: "bytes 0-0/12345" where 12345 is total size
             content_range = response.get("ContentRange", "")
             if content_range and "/" in content_range:
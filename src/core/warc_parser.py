@@ -6,9 +6,9 @@ used by Common Crawl to store archived web pages.
 WARC Specification: https://iipc.github.io/warc-specifications/
 """
 
-import gzip
 import io
 import logging
+import time
 from datetime import datetime
 from typing import Any, Iterator, Optional
 
@@ -16,8 +16,111 @@ from warcio.archiveiterator import ArchiveIterator
 
 from ..models.schemas import WarcRecord
 
+try:
+    from isal import igzip as gzip
+    from isal import isal_zlib as zlib
+except ImportError:  # pragma: no cover - optional speedup
+    import gzip
+    import zlib
+
+try:
+    import httptools
+except ImportError:  # pragma: no cover - optional speedup
+    httptools = None
+
 logger = logging.getLogger(__name__)
 
+_GZIP_MAGIC = b"\x1f\x8b"
+_MEMBER_READ_SIZE = 64 * 1024
+
+
+class _HttpResponseCollector:
+    """httptools callback target collecting headers and body."""
+
+    def __init__(self):
+        self.headers: dict[str, str] = {}
+        self.body = bytearray()
+
+    def on_header(self, name: bytes, value: bytes):
+        self.headers[name.decode("latin-1")] = value.decode("latin-1")
+
+    def on_body(self, body: bytes):
+        self.body += body
+
+
+def _parse_http_response(data: bytes) -> tuple[int, dict[str, str], bytes]:
+    """Parse a raw HTTP response message from bytes.
+
+    Uses httptools (llhttp) when installed, otherwise splits the bytes
+    directly. The body is never decoded.
+
+    Args:
+        data: Raw HTTP response (status line, headers and body)
+
+    Returns:
+        Tuple of (status code, headers, body)
+    """
+    if httptools is not None:
+        collector = _HttpResponseCollector()
+        parser = httptools.HttpResponseParser(collector)
+        try:
+            parser.feed_data(data)
+            return parser.get_status_code(), collector.headers, bytes(collector.body)
+        except httptools.HttpParserError:
+            pass
+
+    header_section, separator, body = data.partition(b"\r\n\r\n")
+    if not separator:
+        header_section, separator, body = data.partition(b"\n\n")
+
+    lines = header_section.split(b"\n")
+    status_code = 200
+    status_parts = lines[0].split()
+    if len(status_parts) >= 2 and status_parts[1].isdigit():
+        status_code = int(status_parts[1])
+
+    headers = {}
+    for line in lines[1:]:
+        name, colon, value = line.partition(b":")
+        if colon:
+            headers[name.strip().decode("latin-1")] = value.strip().decode("latin-1")
+
+    return status_code, headers, body
+
+
+def _iter_gzip_members(content: bytes, offset: int = 0) -> Iterator[tuple[int, int, bytes]]:
+    """Decompress concatenated gzip members one at a time.
+
+    Common Crawl WARC files hold one gzip member per record, so each member
+    can be located and decompressed independently.
+
+    Args:
+        content: Gzipped content
+        offset: Offset of the first member to read
+
+    Yields:
+        Tuples of (member offset, compressed length, decompressed bytes)
+    """
+    view = memoryview(content)
+    size = len(content)
+
+    while offset < size:
+        decompressor = zlib.decompressobj(31)  # 31 = gzip header
+        parts = []
+        position = offset
+        while not decompressor.eof and position < size:
+            block = view[position : position + _MEMBER_READ_SIZE]
+            parts.append(decompressor.decompress(block))
+            position += len(block)
+
+        if not decompressor.eof:
+            logger.warning(f"Truncated gzip member at offset {offset}")
+            return
+
+        end = position - len(decompressor.unused_data)
+        yield offset, end - offset, b"".join(parts)
+        offset = end
+
 
 class WarcParser:
     """Parser for WARC (Web ARChive) files.
@@ -30,16 +133,132 @@ class WarcParser:
         """Initialize WARC parser."""
         pass
 
-    def parse_file(self, content: bytes, decompress: bool = True) -> Iterator[WarcRecord]:
+    def parse_file(
+        self, content: bytes, decompress: bool = True, load_payload: bool = True
+    ) -> Iterator[WarcRecord]:
         """Parse a WARC file from bytes.
 
         Args:
             content: WARC file content (may be gzipped)
             decompress: Whether to attempt gzip decompression
+            load_payload: Whether to read record payloads; pass False when
+                only headers are needed
 
         Yields:
             WarcRecord objects
         """
+        for record in ArchiveIterator(self._open_stream(content, decompress)):
+            try:
+                warc_record = self._parse_record(record, load_payload=load_payload)
+                if warc_record:
+                    yield warc_record
+            except Exception as e:
+                logger.warning(f"Error parsing WARC record: {e}")
+                continue
+
+    def parse_file_soa(self, content: bytes) -> dict[str, list]:
+        """Parse WARC record headers into columns.
+
+        Payloads are skipped entirely. Offsets and lengths refer to the raw
+        (possibly gzipped) content, so a single record can be re-read later
+        from ``content[offset:offset + length]``.
+
+        Args:
+            content: WARC file content (may be gzipped)
+
+        Returns:
+            Dictionary with parallel ``target_uris``, ``record_types``,
+            ``offsets`` and ``lengths`` lists
+
+        Example:
+            >>> columns = parser.parse_file_soa(warc_bytes)
+            >>> i = columns["target_uris"].index("https://example.com/")
+            >>> print(columns["offsets"][i], columns["lengths"][i])
+        """
+        target_uris: list[str] = []
+        record_types: list[str] = []
+        offsets: list[int] = []
+        lengths: list[int] = []
+
+        iterator = ArchiveIterator(io.BytesIO(content))
+        for record in iterator:
+            target_uris.append(record.rec_headers.get_header("WARC-Target-URI", ""))
+            record_types.append(record.rec_type or "")
+            offsets.append(iterator.get_record_offset())
+            iterator.read_to_end(record)
+            lengths.append(iterator.get_record_length())
+
+        return {
+            "target_uris": target_uris,
+            "record_types": record_types,
+            "offsets": offsets,
+            "lengths": lengths,
+        }
+
+    def parse_file_multimember(self, content: bytes) -> Iterator[tuple[int, WarcRecord]]:
+        """Parse a multi-member gzipped WARC file member by member.
+
+        Each gzip member is decompressed on its own, so records are yielded
+        with the offset of their member in the raw file; these match the
+        offsets in CDX index records.
+
+        Args:
+            content: Gzipped WARC file content
+
+        Yields:
+            Tuples of (member offset, WarcRecord)
+        """
+        if content[:2] != _GZIP_MAGIC:
+            for record in self.parse_file(content, decompress=False):
+                yield 0, record
+            return
+
+        for offset, _length, data in _iter_gzip_members(content):
+            for record in ArchiveIterator(io.BytesIO(data)):
+                warc_record = self._parse_record(record)
+                if warc_record:
+                    yield offset, warc_record
+
+    def parse_record_at(
+        self, content: bytes, offset: int = 0, length: Optional[int] = None
+    ) -> Optional[WarcRecord]:
+        """Parse the single record stored at a byte offset.
+
+        Only the gzip member at ``offset`` is decompressed, so a record can
+        be read from a full WARC file (or from a ranged download of just
+        that record) without touching the records before it.
+
+        Args:
+            content: WARC content (gzipped, one member per record)
+            offset: Offset of the record's gzip member
+            length: Compressed length of the member, if known
+
+        Returns:
+            WarcRecord or None if no record is found
+
+        Example:
+            >>> record = parser.parse_record_at(warc_bytes, index.offset, index.length)
+        """
+        if length is not None:
+            content = memoryview(content)[offset : offset + length]
+            offset = 0
+
+        for _offset, _length, data in _iter_gzip_members(content, offset):
+            for record in ArchiveIterator(io.BytesIO(data)):
+                return self._parse_record(record)
+            break
+        return None
+
+    def _open_stream(self, content: bytes, decompress: bool = True) -> io.BytesIO:
+        """Wrap WARC content in a stream, decompressing it if gzipped.
+
+        Args:
+            content: WARC file content (may be gzipped)
+            decompress: Whether to attempt gzip decompression
+
+        Returns:
+            Stream positioned at the first record
+        """
         # Try to decompress if gzipped
         if decompress and content[:2] == b"\x1f\x8b":  # Gzip magic number
             try:
@@ -48,41 +267,35 @@ class WarcParser:
             except Exception as e:
                 logger.warning(f"Failed to decompress WARC: {e}")
 
-        # Parse WARC records
-        stream = io.BytesIO(content)
-
-        for record in ArchiveIterator(stream):
-            try:
-                warc_record = self._parse_record(record)
-                if warc_record:
-                    yield warc_record
-            except Exception as e:
-                logger.warning(f"Error parsing WARC record: {e}")
-                continue
+        return io.BytesIO(content)
 
-    def parse_stream(self, stream: io.BytesIO) -> Iterator[WarcRecord]:
+    def parse_stream(
+        self, stream: io.IOBase, load_payload: bool = True
+    ) -> Iterator[WarcRecord]:
         """Parse a WARC file from a stream.
 
         Args:
             stream: IO stream containing WARC data
+            load_payload: Whether to read record payloads
 
         Yields:
             WarcRecord objects
         """
         for record in ArchiveIterator(stream):
             try:
-                warc_record = self._parse_record(record)
+                warc_record = self._parse_record(record, load_payload=load_payload)
                 if warc_record:
                     yield warc_record
             except Exception as e:
                 logger.warning(f"Error parsing WARC record: {e}")
                 continue
 
-    def _parse_record(self, record: Any) -> Optional[WarcRecord]:
+    def _parse_record(self, record: Any, load_payload: bool = True) -> Optional[WarcRecord]:
         """Parse a single WARC record.
 
         Args:
             record: WARC record from warcio
+            load_payload: Whether to read the record payload
 
         Returns:
             WarcRecord or None if parsing fails
@@ -98,18 +311,21 @@ class WarcParser:
 
             # Parse date
             try:
-                date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                date_epoch = int(datetime.fromisoformat(date_str.replace("Z", "+00:00")).timestamp())
             except Exception:
-                date = datetime.now()
+                date_epoch = int(time.time())
 
             # Extract HTTP headers if this is a response record
             http_headers = None
-            if record_type == "response" and hasattr(record, "http_headers"):
+            http_status = None
+            if record_type == "response" and getattr(record, "http_headers", None) is not None:
                 http_headers = dict(record.http_headers.headers)
+                status = record.http_headers.get_statuscode()
+                http_status = int(status) if status and status.isdigit() else None
 
             # Extract payload
             payload = None
-            if record.content_stream():
+            if load_payload:
                 try:
                     payload = record.content_stream().read()
                 except Exception as e:
@@ -119,10 +335,11 @@ class WarcParser:
                 record_id=record_id,
                 record_type=record_type,
                 target_uri=target_uri,
-                date=date,
+                date_epoch=date_epoch,
                 content_type=content_type,
                 content_length=content_length,
                 http_headers=http_headers,
+                http_status=http_status,
                 payload=payload,
             )
 
@@ -133,11 +350,15 @@ class WarcParser:
     def extract_http_response(self, record: WarcRecord) -> Optional[dict]:
         """Extract HTTP response from a WARC record.
 
+        warcio already separates the HTTP headers from the payload of
+        response records; payloads that still carry the status line and
+        headers are parsed from bytes. The body is returned undecoded.
+
         Args:
             record: WarcRecord to extract from
 
         Returns:
-            Dictionary with status_code, headers, and body
+            Dictionary with status_code, headers, and body (bytes)
         """
         if record.record_type != "response":
             return None
@@ -146,40 +367,16 @@ class WarcParser:
             return None
 
         try:
-            # Parse HTTP response
-            payload_str = record.payload.decode("utf-8", errors="replace")
-
-            # Split headers and body
-            parts = payload_str.split("\r\n\r\n", 1)
-            if len(parts) < 2:
-                parts = payload_str.split("\n\n", 1)
-
-            if len(parts) < 2:
-                logger.warning("Could not split HTTP headers and body")
-                return {
-                    "status_code": 200,  # Assume success
-                    "headers": record.http_headers or {},
-                    "body": payload_str,
-                }
-
-            header_section, body = parts
-
-            # Parse status line
-            lines = header_section.split("\n")
-            status_line = lines[0] if lines else ""
-
-            # Extract status code
-            status_code = 200
-            try:
-                status_parts = status_line.split()
-                if len(status_parts) >= 2:
-                    status_code = int(status_parts[1])
-            except Exception:
-                pass
+            if record.payload.startswith(b"HTTP/"):
+                status_code, headers, body = _parse_http_response(record.payload)
+            else:
+                status_code = record.http_status or 200
+                headers = {}
+                body = record.payload
 
             return {
                 "status_code": status_code,
-                "headers": record.http_headers or {},
+                "headers": record.http_headers or headers,
                 "body": body,
             }
 
@@ -201,9 +398,10 @@ class WarcParser:
         Returns:
             First matching WarcRecord or None
         """
-        for record in self.parse_file(content):
-            if record.target_uri == url:
-                return record
+        # Compare headers first; only the matching record is fully parsed
+        for record in ArchiveIterator(self._open_stream(content)):
+            if record.rec_headers.get_header("WARC-Target-URI", "") == url:
+                return self._parse_record(record)
         return None
 
     def count_records(self, content: bytes) -> dict[str, int]:
@@ -217,7 +415,7 @@ class WarcParser:
         """
         counts: dict[str, int] = {}
 
-        for record in self.parse_file(content):
+        for record in self.parse_file(content, load_payload=False):
             record_type = record.record_type
             counts[record_type] = counts.get(record_type, 0) + 1
 
@@ -0,0 +1,23 @@
+"""Lightweight record types for the internal CDX pipeline.
+
+These slotted dataclasses mirror the Pydantic models in ``schemas`` for
+values that are created in bulk and only read by our own code. They skip
+validation and have no per-instance ``__dict__``; convert to the Pydantic
+model (e.g. ``IndexRecord.from_internal``) when a value leaves the server.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class IndexEntry:
+    """Record from the CDX index (internal twin of ``IndexRecord``)."""
+
+    url: str
+    mime_type: str
+    status_code: int
+    digest: str
+    timestamp: str
+    length: int
+    offset: int
+    filename: str
@@ -4,11 +4,103 @@ This module defines all data models used throughout the server for type safety
 and validation.
 """
 
-from datetime import datetime
+import re
+from calendar import timegm
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Annotated, Any, Optional, TypeVar
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+from .internal import IndexEntry
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class BaseSchema(BaseModel):
+    """Base class for the server's models.
+
+    Core schemas are built on first use instead of at import time, so
+    importing this module only pays for the models that are actually used.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class FrozenSchema(BaseSchema):
+    """Base class for immutable, high-count models (one per CDX row, detection, etc.).
+
+    Instances are never modified after construction, and unknown fields are
+    rejected instead of being stored in ``__pydantic_extra__``.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+def construct_trusted(model: type[ModelT], **data: Any) -> ModelT:
+    """Build a model from data this server produced itself, without validation.
+
+    Validation walks every element of list and dict fields, which dominates
+    the cost of large results such as link graphs and parsed pages. Only use
+    this for values built by our own parsing code with the declared types;
+    tool arguments and cached data go through normal validation. Flat
+    models with scalar fields validate as fast as they construct, so keep
+    regular instantiation for those.
+
+    Args:
+        model: Model class to build
+        **data: Field values
+
+    Returns:
+        Model instance
+    """
+    return model.model_construct(**data)
+
+
+# URL fields are plain str rather than HttpUrl: URLs from the CDX index and
+# parsed pages are passed through as-is, without parsing each one.
+
+# Pattern-constrained strings. Each pattern is compiled once here and shared
+# by every field using the type, rather than compiled again per field.
+_CDX_TIMESTAMP_RE = re.compile(r"\d{14}")
+_CRAWL_ID_RE = re.compile(r"CC-MAIN-\d{4}(?:-\d{2}|-\d{4})?")
+
+
+def _check_cdx_timestamp(value: str) -> str:
+    if not _CDX_TIMESTAMP_RE.fullmatch(value):
+        raise ValueError(f"Invalid CDX timestamp (expected YYYYMMDDhhmmss): {value!r}")
+    return value
+
+
+def _check_crawl_id(value: str) -> str:
+    if not _CRAWL_ID_RE.fullmatch(value):
+        raise ValueError(f"Invalid crawl ID (expected CC-MAIN-YYYY-WW): {value!r}")
+    return value
+
+
+CdxTimestamp = Annotated[str, AfterValidator(_check_cdx_timestamp)]
+CrawlId = Annotated[str, AfterValidator(_check_crawl_id)]
+
+
+def cdx_timestamp_to_epoch(timestamp: str) -> int:
+    """Convert a CDX ``YYYYMMDDhhmmss`` timestamp to epoch seconds (UTC).
+
+    Args:
+        timestamp: CDX timestamp string
+
+    Returns:
+        Seconds since the Unix epoch
+    """
+    return timegm(
+        (
+            int(timestamp[0:4]),
+            int(timestamp[4:6]),
+            int(timestamp[6:8]),
+            int(timestamp[8:10]),
+            int(timestamp[10:12]),
+            int(timestamp[12:14]),
+        )
+    )
 
 
 # Enums
@@ -33,17 +125,17 @@ class ContentType(str, Enum):
 
 
 # Crawl Models
-class CrawlInfo(BaseModel):
+class CrawlInfo(BaseSchema):
     """Information about a Common Crawl crawl."""
 
-    id: str = Field(..., description="Crawl identifier (e.g., CC-MAIN-2024-10)")
+    id: CrawlId = Field(..., description="Crawl identifier (e.g., CC-MAIN-2024-10)")
     name: str = Field(..., description="Human-readable crawl name")
     date: datetime = Field(..., description="Crawl date")
     status: CrawlStatus = Field(default=CrawlStatus.UNKNOWN, description="Crawl status")
     approximate_size_gb: Optional[float] = Field(None, description="Approximate size in gigabytes")
 
 
-class CrawlStats(BaseModel):
+class CrawlStats(BaseSchema):
     """Detailed statistics for a crawl."""
 
     crawl_id: str
@@ -58,21 +150,26 @@ class CrawlStats(BaseModel):
 
 
 # Index Models
-class IndexRecord(BaseModel):
+class IndexRecord(FrozenSchema):
     """Record from the CDX index."""
 
     url: str = Field(..., description="URL of the page")
     mime_type: str = Field(..., description="MIME type")
     status_code: int = Field(..., description="HTTP status code")
     digest: str = Field(..., description="Content digest (hash)")
-    timestamp: str = Field(..., description="Crawl timestamp (YYYYMMDDhhmmss)")
+    timestamp: CdxTimestamp = Field(..., description="Crawl timestamp (YYYYMMDDhhmmss)")
     length: int = Field(..., description="Content length in bytes")
     offset: int = Field(..., description="Offset in WARC file")
     filename: str = Field(..., description="WARC filename")
 
+    @classmethod
+    def from_internal(cls, entry: IndexEntry) -> "IndexRecord":
+        """Build an index record from an internal ``IndexEntry``."""
+        return cls.model_validate(entry, from_attributes=True)
+
 
 # Domain Models
-class DomainStats(BaseModel):
+class DomainStats(FrozenSchema):
     """Statistics for a specific domain."""
 
     domain: str
@@ -84,7 +181,7 @@ class DomainStats(BaseModel):
     last_seen: Optional[datetime] = Field(None, description="Last crawl date")
 
 
-class ComparisonResult(BaseModel):
+class ComparisonResult(BaseSchema):
     """Result of comparing domain across crawls."""
 
     domain: str
@@ -95,7 +192,7 @@ class ComparisonResult(BaseModel):
 
 
 # Page Content Models
-class PageContent(BaseModel):
+class PageContent(BaseSchema):
     """Content and metadata for a fetched page."""
 
     url: str
@@ -106,34 +203,50 @@ class PageContent(BaseModel):
     headers: dict[str, str] = Field(default_factory=dict)
     mime_type: str
     length: int
-    timestamp: datetime
+    timestamp_epoch: int = Field(..., description="Crawl time in epoch seconds (UTC)")
     fetch_time: Optional[datetime] = Field(None, description="When we fetched it")
 
+    @property
+    def timestamp(self) -> datetime:
+        """Crawl time as a UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_epoch, tz=timezone.utc)
 
-class WarcRecord(BaseModel):
+
+class WarcRecord(BaseSchema):
     """Raw WARC record."""
 
     record_id: str
     record_type: str = Field(..., description="response, request, metadata, etc.")
     target_uri: str
-    date: datetime
+    date_epoch: int = Field(..., description="WARC-Date in epoch seconds (UTC)")
     content_type: str
     content_length: int
     http_headers: Optional[dict[str, str]] = None
+    http_status: Optional[int] = None
     payload: Optional[bytes] = None
 
+    @property
+    def date(self) -> datetime:
+        """WARC-Date as a UTC datetime."""
+        return datetime.fromtimestamp(self.date_epoch, tz=timezone.utc)
+
 
-class WatMetadata(BaseModel):
+class WatMetadata(BaseSchema):
     """Metadata from WAT files."""
 
     url: str
-    timestamp: datetime
+    timestamp_epoch: int = Field(..., description="Crawl time in epoch seconds (UTC)")
     envelope: dict[str, Any] = Field(default_factory=dict)
     http_response_metadata: Optional[dict[str, Any]] = None
 
+    @property
+    def timestamp(self) -> datetime:
+        """Crawl time as a UTC datetime."""
+        return datetime.fromtimestamp(self.timestamp_epoch, tz=timezone.utc)
+
 
 # Parsing Models
-class ParsedHtml(BaseModel):
+class ParsedHtml(BaseSchema):
     """Structured HTML parsing result."""
 
     url: str
@@ -141,13 +254,14 @@ class ParsedHtml(BaseModel):
     meta_tags: dict[str, str] = Field(default_factory=dict)
     headings: dict[str, list[str]] = Field(default_factory=dict, description="h1-h6 headings")
     links: list[str] = Field(default_factory=list)
+    external_link_count: int = Field(0, description="Links pointing to other hosts")
     scripts: list[str] = Field(default_factory=list, description="Script sources")
     styles: list[str] = Field(default_factory=list, description="Stylesheet sources")
     images: list[str] = Field(default_factory=list)
     text_content: Optional[str] = None
 
 
-class LinkAnalysis(BaseModel):
+class LinkAnalysis(BaseSchema):
     """Link structure analysis."""
 
     url: str
@@ -157,7 +271,7 @@ class LinkAnalysis(BaseModel):
     total_links: int = 0
 
 
-class Technology(BaseModel):
+class Technology(FrozenSchema):
     """Detected technology."""
 
     name: str
@@ -167,7 +281,7 @@ class Technology(BaseModel):
     evidence: list[str] = Field(default_factory=list, description="Detection evidence")
 
 
-class TechStack(BaseModel):
+class TechStack(BaseSchema):
     """Complete technology stack for a page."""
 
     url: str
@@ -177,17 +291,20 @@ class TechStack(BaseModel):
     )
 
 
-class StructuredData(BaseModel):
+class StructuredData(BaseSchema):
     """Structured data from page."""
 
     url: str
     json_ld: list[dict[str, Any]] = Field(default_factory=list)
+    schema_types: list[str] = Field(
+        default_factory=list, description="Schema.org @type values found in the JSON-LD"
+    )
     microdata: list[dict[str, Any]] = Field(default_factory=list)
     open_graph: dict[str, str] = Field(default_factory=dict)
     twitter_card: dict[str, str] = Field(default_factory=dict)
 
 
-class SeoIssue(BaseModel):
+class SeoIssue(FrozenSchema):
     """SEO issue or recommendation."""
 
     severity: str = Field(..., description="error, warning, info")
@@ -196,7 +313,7 @@ class SeoIssue(BaseModel):
     recommendation: Optional[str] = None
 
 
-class SeoAnalysis(BaseModel):
+class SeoAnalysis(BaseSchema):
     """SEO analysis result."""
 
     url: str
@@ -209,7 +326,7 @@ class SeoAnalysis(BaseModel):
     robots_meta: Optional[str] = None
 
 
-class LanguageInfo(BaseModel):
+class LanguageInfo(BaseSchema):
     """Language detection result."""
 
     url: str
@@ -219,7 +336,7 @@ class LanguageInfo(BaseModel):
 
 
 # Aggregation Models
-class TechReport(BaseModel):
+class TechReport(BaseSchema):
     """Domain technology report."""
 
     domain: str
@@ -232,7 +349,7 @@ class TechReport(BaseModel):
     )
 
 
-class LinkGraph(BaseModel):
+class LinkGraph(BaseSchema):
     """Link graph structure."""
 
     domain: str
@@ -243,7 +360,7 @@ class LinkGraph(BaseModel):
     pagerank: Optional[dict[str, float]] = None
 
 
-class KeywordStats(BaseModel):
+class KeywordStats(BaseSchema):
     """Keyword frequency analysis."""
 
     keywords: list[str]
@@ -252,7 +369,7 @@ class KeywordStats(BaseModel):
     tfidf_scores: Optional[dict[str, dict[str, float]]] = None
 
 
-class Timeline(BaseModel):
+class Timeline(BaseSchema):
     """Domain evolution timeline."""
 
     domain: str
@@ -265,7 +382,7 @@ class Timeline(BaseModel):
     )
 
 
-class HeaderReport(BaseModel):
+class HeaderReport(BaseSchema):
     """HTTP header analysis."""
 
     domain: str
@@ -279,7 +396,7 @@ class HeaderReport(BaseModel):
 
 
 # Export Models
-class ExportResult(BaseModel):
+class ExportResult(BaseSchema):
     """Result of export operation."""
 
     output_path: str = Field(..., description="Path to the exported file")
@@ -292,7 +409,7 @@ class ExportResult(BaseModel):
     )
 
 
-class Dataset(BaseModel):
+class Dataset(BaseSchema):
     """Saved dataset."""
 
     dataset_id: str
@@ -305,7 +422,7 @@ class Dataset(BaseModel):
 
 
 # Query Models
-class SizeEstimate(BaseModel):
+class SizeEstimate(BaseSchema):
     """Size estimate for a query."""
 
     estimated_pages: int
@@ -316,7 +433,7 @@ class SizeEstimate(BaseModel):
 
 
 # Advanced Analysis Models (Phase 9)
-class ContentClassification(BaseModel):
+class ContentClassification(BaseSchema):
     """Web page classification result.
 
     Classifies web pages by type using composition of multiple analysis tools.
@@ -334,7 +451,7 @@ class ContentClassification(BaseModel):
     content_quality_score: float = Field(..., ge=0.0, le=100.0, description="SEO quality score")
 
 
-class SpamAnalysis(BaseModel):
+class SpamAnalysis(BaseSchema):
     """Spam detection analysis result.
 
     Analyzes content quality signals to detect spam or low-quality pages.
@@ -354,7 +471,7 @@ class SpamAnalysis(BaseModel):
     )
 
 
-class Trend(BaseModel):
+class Trend(FrozenSchema):
     """Individual trend metric detected."""
 
     metric: str = Field(..., description="Metric name: page_count, technology_adoption, etc.")
@@ -363,7 +480,7 @@ class Trend(BaseModel):
     confidence: float = Field(..., ge=0.0, le=1.0, description="Trend confidence")
 
 
-class TrendAnalysis(BaseModel):
+class TrendAnalysis(BaseSchema):
     """Domain trend analysis result.
 
     Analyzes domain evolution trends across multiple crawls.
@@ -0,0 +1,30 @@
+"""Shared helpers for MCP prompt modules."""
+
+from functools import lru_cache
+
+from mcp import types
+
+
+@lru_cache(maxsize=None)
+def _user_messages(text: str) -> tuple[types.PromptMessage, ...]:
+    return (
+        types.PromptMessage(
+            role="user",
+            content=types.TextContent(type="text", text=text),
+        ),
+    )
+
+
+def user_prompt(text: str) -> list[types.PromptMessage]:
+    """Build the message list for a single-message user prompt.
+
+    Prompt texts are constants, so the messages are built once per text and
+    reused on every prompt fetch.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        List containing one user message
+    """
+    return list(_user_messages(text))
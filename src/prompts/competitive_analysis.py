@@ -4,30 +4,15 @@ This module provides an MCP prompt that guides users through analyzing
 and comparing technology stacks across multiple competitor domains.
 """
 
+from typing import Final
+
 from mcp import types
-from mcp.server.fastmcp import FastMCP
 
 # Access the global mcp instance from server
 from ..server import mcp
+from .common import user_prompt
 
-
-@mcp.prompt()
-async def competitive_analysis() -> list[types.PromptMessage]:
-    """Compare technology stacks across multiple competitor domains.
-
-    This prompt helps you:
-    - Analyze multiple domains simultaneously
-    - Compare technology adoption
-    - Identify competitive advantages
-
-    Example: Compare Shopify vs WooCommerce vs Magento sites
-    """
-    return [
-        types.PromptMessage(
-            role="user",
-            content=types.TextContent(
-                type="text",
-                text="""Let's compare competitor domains' technology stacks.
+_PROMPT_TEXT: Final[str] = """Let's compare competitor domains' technology stacks.
 
 **Step 1: Define Competitors**
 List the domains you want to compare:
@@ -77,7 +62,18 @@ Use tool: create_dataset(
 ```
 
 Replace the competitor list with your actual target domains.
-""",
-            ),
-        ),
-    ]
+"""
+
+
+@mcp.prompt()
+async def competitive_analysis() -> list[types.PromptMessage]:
+    """Compare technology stacks across multiple competitor domains.
+
+    This prompt helps you:
+    - Analyze multiple domains simultaneously
+    - Compare technology adoption
+    - Identify competitive advantages
+
+    Example: Compare Shopify vs WooCommerce vs Magento sites
+    """
+    return user_prompt(_PROMPT_TEXT)
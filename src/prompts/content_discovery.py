@@ -5,34 +5,15 @@ and analyzing content patterns across a domain, including keyword analysis,
 structured data extraction, and content theme identification.
 """
 
+from typing import Final
+
 from mcp import types
-from mcp.server.fastmcp import FastMCP
 
 # Access the global mcp instance from server
 from ..server import mcp
+from .common import user_prompt
 
-
-@mcp.prompt()
-async def content_discovery() -> list[types.PromptMessage]:
-    """Discover and analyze content patterns across a domain.
-
-    This prompt helps you:
-    - Find pages containing specific keywords
-    - Extract structured data (JSON-LD, microdata)
-    - Analyze keyword frequency
-    - Identify content themes
-
-    Example usage:
-    1. Run this prompt
-    2. Provide domain and keywords when asked
-    3. Tools will be orchestrated automatically
-    """
-    return [
-        types.PromptMessage(
-            role="user",
-            content=types.TextContent(
-                type="text",
-                text="""Let's discover content patterns in Common Crawl data.
+_PROMPT_TEXT: Final[str] = """Let's discover content patterns in Common Crawl data.
 
 **Step 1: Search for Pages**
 Find pages containing your keywords:
@@ -82,7 +63,22 @@ Use tool: export_to_jsonl(
 ```
 
 Replace "example.com" and keyword list with your targets.
-""",
-            ),
-        ),
-    ]
+"""
+
+
+@mcp.prompt()
+async def content_discovery() -> list[types.PromptMessage]:
+    """Discover and analyze content patterns across a domain.
+
+    This prompt helps you:
+    - Find pages containing specific keywords
+    - Extract structured data (JSON-LD, microdata)
+    - Analyze keyword frequency
+    - Identify content themes
+
+    Example usage:
+    1. Run this prompt
+    2. Provide domain and keywords when asked
+    3. Tools will be orchestrated automatically
+    """
+    return user_prompt(_PROMPT_TEXT)
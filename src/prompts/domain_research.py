@@ -4,34 +4,15 @@ This module provides an MCP prompt that guides users through analyzing
 a domain's technology stack, site structure, security posture, and content patterns.
 """
 
+from typing import Final
+
 from mcp import types
-from mcp.server.fastmcp import FastMCP
 
 # Access the global mcp instance from server
 from ..server import mcp
+from .common import user_prompt
 
-
-@mcp.prompt()
-async def domain_research() -> list[types.PromptMessage]:
-    """Comprehensive domain analysis workflow.
-
-    This prompt guides you through analyzing a domain's:
-    - Technology stack
-    - Site structure (link graph)
-    - Security posture
-    - Content patterns
-
-    Example usage:
-    1. Run this prompt
-    2. Provide domain when asked (e.g., "example.com")
-    3. Tools will be orchestrated automatically
-    """
-    return [
-        types.PromptMessage(
-            role="user",
-            content=types.TextContent(
-                type="text",
-                text="""Let's conduct a comprehensive domain analysis.
+_PROMPT_TEXT: Final[str] = """Let's conduct a comprehensive domain analysis.
 
 **Step 1: Select Crawl**
 First, let's see available crawls:
@@ -80,7 +61,22 @@ Use tool: generate_report(
 ```
 
 Please replace "example.com" with your target domain.
-""",
-            ),
-        ),
-    ]
+"""
+
+
+@mcp.prompt()
+async def domain_research() -> list[types.PromptMessage]:
+    """Comprehensive domain analysis workflow.
+
+    This prompt guides you through analyzing a domain's:
+    - Technology stack
+    - Site structure (link graph)
+    - Security posture
+    - Content patterns
+
+    Example usage:
+    1. Run this prompt
+    2. Provide domain when asked (e.g., "example.com")
+    3. Tools will be orchestrated automatically
+    """
+    return user_prompt(_PROMPT_TEXT)
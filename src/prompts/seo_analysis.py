@@ -5,35 +5,15 @@ through analyzing a domain's on-page SEO, link structure, and security posture
 using archived Common Crawl data.
 """
 
+from typing import Final
+
 from mcp import types
-from mcp.server.fastmcp import FastMCP
 
 # Access the global mcp instance from server
 from ..server import mcp
+from .common import user_prompt
 
-
-@mcp.prompt()
-async def seo_analysis() -> list[types.PromptMessage]:
-    """Perform comprehensive SEO audit using Common Crawl data.
-
-    This prompt helps you:
-    - Analyze on-page SEO factors
-    - Check internal linking structure
-    - Evaluate security headers
-    - Generate actionable recommendations
-
-    The workflow guides through a 5-step SEO audit process using
-    archived web data from Common Crawl.
-
-    Returns:
-        List of prompt messages for the SEO analysis workflow
-    """
-    return [
-        types.PromptMessage(
-            role="user",
-            content=types.TextContent(
-                type="text",
-                text="""Let's perform an SEO audit using archived web data.
+_PROMPT_TEXT: Final[str] = """Let's perform an SEO audit using archived web data.
 
 **Step 1: Sample Representative Pages**
 Get diverse page types:
@@ -106,7 +86,23 @@ Use tool: generate_report(
 ```
 
 Replace "example.com" with your target domain.
-""",
-            ),
-        ),
-    ]
+"""
+
+
+@mcp.prompt()
+async def seo_analysis() -> list[types.PromptMessage]:
+    """Perform comprehensive SEO audit using Common Crawl data.
+
+    This prompt helps you:
+    - Analyze on-page SEO factors
+    - Check internal linking structure
+    - Evaluate security headers
+    - Generate actionable recommendations
+
+    The workflow guides through a 5-step SEO audit process using
+    archived web data from Common Crawl.
+
+    Returns:
+        List of prompt messages for the SEO analysis workflow
+    """
+    return user_prompt(_PROMPT_TEXT)
@@ -4,14 +4,50 @@ This module provides resource providers for accessing crawl information
 through the MCP resource URI scheme.
 """
 
-import json
 import logging
+import time
 from typing import Any
 
 from ..server import mcp
+from ..utils.json_encoding import dumps
 
 logger = logging.getLogger(__name__)
 
+# Rendered get_crawl_info payloads: crawl ID -> (expiry, JSON). Only found
+# crawls are stored; error responses are always built fresh.
+_RENDERED_TTL_SECONDS = 3600
+_RENDERED_MAX_ENTRIES = 256
+_rendered_crawl_info: dict[str, tuple[float, str]] = {}
+
+
+def _dumps(data: Any) -> str:
+    """Encode a resource payload as indented JSON."""
+    return dumps(data, indent=True)
+
+
+def _error_template(**fields: Any) -> tuple[str, str]:
+    """Pre-encode an error payload, split around its ``error`` message.
+
+    Args:
+        **fields: The payload's other (constant) fields
+
+    Returns:
+        (prefix, suffix) to join around the JSON-encoded message
+    """
+    slot = _dumps("__message__")
+    prefix, suffix = _dumps({"error": "__message__", **fields}).split(slot)
+    return prefix, suffix
+
+
+_LIST_FAILED = _error_template(total_crawls=0, crawls=[])
+
+
+def _remember_rendered(crawl_id: str, payload: str):
+    """Store a rendered crawl info payload, dropping the oldest entry when full."""
+    if crawl_id not in _rendered_crawl_info and len(_rendered_crawl_info) >= _RENDERED_MAX_ENTRIES:
+        del _rendered_crawl_info[next(iter(_rendered_crawl_info))]
+    _rendered_crawl_info[crawl_id] = (time.monotonic() + _RENDERED_TTL_SECONDS, payload)
+
 
 @mcp.resource("commoncrawl://crawl/{crawl_id}")
 async def get_crawl_info(crawl_id: str) -> str:
@@ -34,26 +70,26 @@ async def get_crawl_info(crawl_id: str) -> str:
     try:
         logger.info(f"Fetching crawl info for: {crawl_id}")
 
+        rendered = _rendered_crawl_info.get(crawl_id)
+        if rendered and rendered[0] > time.monotonic():
+            return rendered[1]
+
         # Import discovery tools to avoid circular imports
         from ..tools import discovery
 
-        # Use existing list_crawls tool to get all crawls
-        crawls_result = await discovery.list_crawls()
+        # Use the shared crawl listing and its ID lookup table
+        crawls_result, crawls_by_id = await discovery.crawl_index()
 
         # Find matching crawl
-        matching_crawl = next(
-            (c for c in crawls_result.get("crawls", []) if c["id"] == crawl_id),
-            None,
-        )
+        matching_crawl = crawls_by_id.get(crawl_id)
 
         if not matching_crawl:
             logger.warning(f"Crawl not found: {crawl_id}")
-            return json.dumps(
+            return _dumps(
                 {
                     "error": f"Crawl not found: {crawl_id}",
                     "available_crawls": [c["id"] for c in crawls_result.get("crawls", [])[:5]],
-                },
-                indent=2,
+                }
             )
 
         # Get detailed stats for the crawl
@@ -75,17 +111,19 @@ async def get_crawl_info(crawl_id: str) -> str:
             "formats_available": ["WARC", "WAT", "WET"],
         }
 
+        payload = _dumps(info)
+        _remember_rendered(crawl_id, payload)
+
         logger.info(f"Successfully retrieved info for crawl: {crawl_id}")
-        return json.dumps(info, indent=2)
+        return payload
 
     except Exception as e:
         logger.error(f"Error fetching crawl info: {e}", exc_info=True)
-        return json.dumps(
+        return _dumps(
             {
                 "error": f"Failed to fetch crawl info: {str(e)}",
                 "crawl_id": crawl_id if "crawl_id" in locals() else "unknown",
-            },
-            indent=2,
+            }
         )
 
 
@@ -128,15 +166,9 @@ async def list_all_crawls() -> str:
         }
 
         logger.info(f"Successfully listed {len(crawls)} crawls")
-        return json.dumps(info, indent=2)
+        return _dumps(info)
 
     except Exception as e:
         logger.error(f"Error listing crawls: {e}", exc_info=True)
-        return json.dumps(
-            {
-                "error": f"Failed to list crawls: {str(e)}",
-                "total_crawls": 0,
-                "crawls": [],
-            },
-            indent=2,
-        )
+        prefix, suffix = _LIST_FAILED
+        return prefix + _dumps(f"Failed to list crawls: {str(e)}") + suffix
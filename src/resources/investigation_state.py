@@ -5,25 +5,31 @@ allowing users to track queries, cache results, and maintain analysis context ac
 multiple interactions.
 """
 
-import json
+import asyncio
 import logging
 import sqlite3
+import threading
 import uuid
-from datetime import datetime, timezone
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ..models.schemas import BaseSchema
 from ..server import mcp
+from ..utils.json_encoding import dumps
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Database configuration
 DB_PATH = Path("./data/commoncrawl.db")
 
 
-class InvestigationSession(BaseModel):
+class InvestigationSession(BaseSchema):
     """Investigation session state.
 
     An investigation session maintains state across multiple queries and analyses,
@@ -54,26 +60,191 @@ class InvestigationSession(BaseModel):
 
 # Database schema extension for investigation sessions
 INVESTIGATION_SCHEMA_SQL = """
+BEGIN IMMEDIATE;
+
+-- created_at/updated_at are UTC microseconds since the Unix epoch
 CREATE TABLE IF NOT EXISTS investigation_sessions (
     id TEXT PRIMARY KEY,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
     state JSON NOT NULL
 );
 
 CREATE INDEX IF NOT EXISTS idx_investigation_sessions_created_at
 ON investigation_sessions(created_at DESC);
+
+-- Sessions stored before timestamps were integers hold ISO 8601 text;
+-- convert them (to millisecond precision, all SQLite parses) so they sort
+-- together with newer sessions
+UPDATE investigation_sessions
+SET created_at = CAST(ROUND((julianday(created_at) - 2440587.5) * 86400000) AS INTEGER) * 1000
+WHERE typeof(created_at) = 'text';
+
+UPDATE investigation_sessions
+SET updated_at = CAST(ROUND((julianday(updated_at) - 2440587.5) * 86400000) AS INTEGER) * 1000
+WHERE typeof(updated_at) = 'text';
+
+COMMIT;
+"""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(value: datetime) -> int:
+    """Convert an aware datetime to the stored timestamp (epoch microseconds)."""
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _iso_sql(column: str) -> str:
+    """SQL expression rendering an epoch-microseconds column like ``datetime.isoformat()``."""
+    return (
+        f"strftime('%Y-%m-%dT%H:%M:%S', {column} / 1000000, 'unixepoch')"
+        f" || CASE WHEN {column} % 1000000 THEN printf('.%06d', {column} % 1000000) ELSE '' END"
+        " || '+00:00'"
+    )
+
+
+# Session CRUD statements. With the shared connection below, sqlite3's
+# per-connection statement cache prepares each of these once per process.
+INSERT_SESSION_SQL = (
+    "INSERT INTO investigation_sessions (id, created_at, updated_at, state) VALUES (?, ?, ?, ?)"
+)
+UPDATE_SESSION_SQL = "UPDATE investigation_sessions SET updated_at = ?, state = ? WHERE id = ?"
+SELECT_SESSION_SQL = "SELECT state FROM investigation_sessions WHERE id = ?"
+SELECT_ALL_SESSIONS_SQL = "SELECT id, state FROM investigation_sessions ORDER BY created_at DESC"
+SELECT_SESSION_SUMMARIES_SQL = f"""
+SELECT id, {_iso_sql("created_at")}, {_iso_sql("updated_at")},
+       IFNULL(json_array_length(state, '$.queries_run'), 0),
+       IFNULL(json_extract(state, '$.cached_results') != '{{}}', 0),
+       IFNULL(json_extract(state, '$.analysis_summary') != '{{}}', 0)
+FROM investigation_sessions
+ORDER BY created_at DESC
+LIMIT ? OFFSET ?
 """
+DELETE_SESSION_SQL = "DELETE FROM investigation_sessions WHERE id = ?"
+
+# The whole commoncrawl://investigations document, built by SQLite in one pass
+LIST_INVESTIGATIONS_SQL = f"""
+SELECT json_object(
+    'total_sessions', COUNT(*),
+    'sessions', json_group_array(json_object(
+        'id', id,
+        'created_at', {_iso_sql("created_at")},
+        'updated_at', {_iso_sql("updated_at")},
+        'queries_count', IFNULL(json_array_length(state, '$.queries_run'), 0),
+        'has_cached_results', json(CASE WHEN IFNULL(json_extract(state, '$.cached_results'), '{{}}')
+                                            != '{{}}' THEN 'true' ELSE 'false' END),
+        'has_analysis', json(CASE WHEN IFNULL(json_extract(state, '$.analysis_summary'), '{{}}')
+                                      != '{{}}' THEN 'true' ELSE 'false' END)
+    ))
+)
+FROM (SELECT * FROM investigation_sessions ORDER BY created_at DESC)
+"""
+
+# WAL lets readers proceed while a write is in progress, and with
+# synchronous=NORMAL commits no longer fsync the main database file.
+# journal_mode is stored in the database; the rest apply per connection.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64MB
+    "PRAGMA mmap_size=268435456",  # 256MB
+)
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a connection to the sessions database with tuned pragmas."""
+    # The connection is handed between worker threads, always under _db_lock
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Process-wide connection shared by the session CRUD functions. Keeping it
+# open keeps SQLite's page cache warm between calls.
+_connection: Optional[sqlite3.Connection] = None
+
+# Guards the shared connection and writes to the session cache. Reentrant so
+# that _get_connection can (re)initialize the database while holding it.
+_db_lock = threading.RLock()
+
+# Recently used sessions: session ID -> serialized state, most recent last.
+# Writes go through this process, so entries are refreshed on create/update
+# and evicted on delete. The JSON rather than the parsed model is kept so
+# every get_session caller gets its own mutable copy.
+_SESSION_CACHE_MAXSIZE = 128
+_session_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _touch_cached_session(session_id: str) -> Optional[str]:
+    """Get a session's cached state, marking it as most recently used."""
+    state = _session_cache.get(session_id)
+    if state is not None:
+        try:
+            _session_cache.move_to_end(session_id)
+        except KeyError:  # evicted by a worker thread in the meantime
+            pass
+    return state
+
+
+def _cache_session(session_id: str, state: str) -> None:
+    """Store a session's serialized state, evicting the least recently used entry when full."""
+    _session_cache[session_id] = state
+    _session_cache.move_to_end(session_id)
+    if len(_session_cache) > _SESSION_CACHE_MAXSIZE:
+        _session_cache.popitem(last=False)
 
 
 def _init_database() -> None:
-    """Initialize the investigation sessions database schema."""
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.executescript(INVESTIGATION_SCHEMA_SQL)
-    conn.commit()
-    conn.close()
+    """Initialize the investigation sessions database schema.
+
+    Closes the shared connection first, so that it is reopened against the
+    (re)initialized database on next use.
+    """
+    global _connection
+    with _db_lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+        _session_cache.clear()
+
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = _connect()
+        cursor = conn.cursor()
+        cursor.executescript(INVESTIGATION_SCHEMA_SQL)
+        conn.close()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get the shared sessions database connection, initializing on first use."""
+    global _connection
+    with _db_lock:
+        if _connection is None:
+            _init_database()
+            _connection = _connect()
+        return _connection
+
+
+def _with_connection(work: Callable[[sqlite3.Connection], T]) -> T:
+    """Call ``work`` with the shared connection while holding the database lock."""
+    with _db_lock:
+        return work(_get_connection())
+
+
+async def _run_db(work: Callable[[sqlite3.Connection], T]) -> T:
+    """Run blocking database work on a worker thread, off the event loop.
+
+    Args:
+        work: Function taking the shared connection; it runs under the
+            database lock, so it may also update the session cache
+
+    Returns:
+        Whatever ``work`` returns
+    """
+    return await asyncio.to_thread(_with_connection, work)
 
 
 async def create_session() -> InvestigationSession:
@@ -86,42 +257,43 @@ async def create_session() -> InvestigationSession:
         >>> session = await create_session()
         >>> print(f"Created session: {session.id}")
     """
-    # Initialize database
-    _init_database()
-
     # Create new session
+    now = datetime.now(timezone.utc)
     session = InvestigationSession(
         id=str(uuid.uuid4()),
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=now,
+        updated_at=now,
     )
 
     # Store in database
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    state = session.model_dump_json()
+
+    def insert(conn: sqlite3.Connection) -> None:
+        try:
+            conn.execute(
+                INSERT_SESSION_SQL,
+                (
+                    session.id,
+                    _epoch_us(session.created_at),
+                    _epoch_us(session.updated_at),
+                    state,
+                ),
+            )
+            conn.commit()
+            _cache_session(session.id, state)
+
+        except Exception:
+            conn.rollback()
+            raise
 
     try:
-        cursor.execute(
-            """INSERT INTO investigation_sessions (id, created_at, updated_at, state)
-               VALUES (?, ?, ?, ?)""",
-            (
-                session.id,
-                session.created_at.isoformat(),
-                session.updated_at.isoformat(),
-                session.model_dump_json(),
-            ),
-        )
-        conn.commit()
+        await _run_db(insert)
         logger.info(f"Created investigation session: {session.id}")
 
     except Exception as e:
-        conn.rollback()
         logger.error(f"Failed to create session: {e}")
         raise
 
-    finally:
-        conn.close()
-
     return session
 
 
@@ -139,36 +311,151 @@ async def update_session(session: InvestigationSession) -> None:
         >>> session.queries_run.append({"query": "example.com", "timestamp": "..."})
         >>> await update_session(session)
     """
-    # Initialize database
-    _init_database()
-
     # Update timestamp
     session.updated_at = datetime.now(timezone.utc)
 
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    state = session.model_dump_json()
 
-    try:
-        result = cursor.execute(
-            """UPDATE investigation_sessions
-               SET updated_at = ?, state = ?
-               WHERE id = ?""",
-            (session.updated_at.isoformat(), session.model_dump_json(), session.id),
-        )
+    def update(conn: sqlite3.Connection) -> None:
+        try:
+            result = conn.execute(
+                UPDATE_SESSION_SQL,
+                (_epoch_us(session.updated_at), state, session.id),
+            )
+
+            if result.rowcount == 0:
+                raise ValueError(f"Session not found: {session.id}")
 
-        if result.rowcount == 0:
-            raise ValueError(f"Session not found: {session.id}")
+            conn.commit()
+            _cache_session(session.id, state)
 
-        conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    try:
+        await _run_db(update)
         logger.info(f"Updated investigation session: {session.id}")
 
     except Exception as e:
-        conn.rollback()
         logger.error(f"Failed to update session {session.id}: {e}")
         raise
 
-    finally:
-        conn.close()
+
+async def bulk_update_sessions(sessions: list[InvestigationSession]) -> None:
+    """Update several investigation sessions in a single transaction.
+
+    Either every session is written or, if any of them does not exist,
+    none are.
+
+    Args:
+        sessions: Session objects with updated state
+
+    Raises:
+        ValueError: If any session does not exist
+
+    Example:
+        >>> for session in sessions:
+        ...     session.analysis_summary["reviewed"] = True
+        >>> await bulk_update_sessions(sessions)
+    """
+    if not sessions:
+        return
+
+    now = datetime.now(timezone.utc)
+    for session in sessions:
+        session.updated_at = now
+
+    updated_at = _epoch_us(now)
+    rows = [(updated_at, session.model_dump_json(), session.id) for session in sessions]
+
+    def update_all(conn: sqlite3.Connection) -> None:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            result = conn.executemany(UPDATE_SESSION_SQL, rows)
+
+            if result.rowcount != len(rows):
+                raise ValueError(f"{len(rows) - result.rowcount} of {len(rows)} sessions not found")
+
+            conn.commit()
+
+        except Exception:
+            conn.rollback()
+            raise
+
+        for _, state, session_id in rows:
+            _cache_session(session_id, state)
+
+    try:
+        await _run_db(update_all)
+        logger.info(f"Updated {len(rows)} investigation sessions")
+
+    except Exception as e:
+        logger.error(f"Failed to update {len(rows)} sessions: {e}")
+        raise
+
+
+async def mutate_session(
+    session_id: str, mutate: Callable[[InvestigationSession], None]
+) -> InvestigationSession:
+    """Apply a change to a stored session atomically.
+
+    The session is read, passed to ``mutate`` and written back in a single
+    transaction, so concurrent changes to the same session are not lost as
+    they can be with ``get_session`` followed by ``update_session``. Prefer
+    this for read-modify-write updates.
+
+    ``mutate`` runs on a worker thread while the database is locked, so it
+    should only change the session in place: no I/O, no awaiting.
+
+    Args:
+        session_id: UUID of the session to change
+        mutate: Function that modifies the session it is given
+
+    Returns:
+        The updated session
+
+    Raises:
+        ValueError: If session does not exist
+
+    Example:
+        >>> session = await mutate_session(
+        ...     session_id, lambda s: s.queries_run.append({"query": "example.com"})
+        ... )
+    """
+
+    def read_modify_write(conn: sqlite3.Connection) -> InvestigationSession:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(SELECT_SESSION_SQL, (session_id,)).fetchone()
+
+            if not row:
+                raise ValueError(f"Session not found: {session_id}")
+
+            session = InvestigationSession.model_validate_json(row[0])
+            mutate(session)
+            session.updated_at = datetime.now(timezone.utc)
+            state = session.model_dump_json()
+
+            conn.execute(UPDATE_SESSION_SQL, (_epoch_us(session.updated_at), state, session_id))
+            conn.commit()
+
+        except Exception:
+            conn.rollback()
+            raise
+
+        _cache_session(session_id, state)
+        return session
+
+    try:
+        session = await _run_db(read_modify_write)
+        logger.info(f"Updated investigation session: {session_id}")
+
+    except Exception as e:
+        logger.error(f"Failed to update session {session_id}: {e}")
+        raise
+
+    return session
 
 
 async def get_session(session_id: str) -> Optional[InvestigationSession]:
@@ -185,46 +472,37 @@ async def get_session(session_id: str) -> Optional[InvestigationSession]:
         >>> if session:
         ...     print(f"Session has {len(session.queries_run)} queries")
     """
-    # Initialize database
-    _init_database()
+    state = _touch_cached_session(session_id)
 
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    if state is None:
 
-    try:
-        row = cursor.execute(
-            """SELECT id, created_at, updated_at, state
-               FROM investigation_sessions
-               WHERE id = ?""",
-            (session_id,),
-        ).fetchone()
-
-        if not row:
-            logger.warning(f"Session not found: {session_id}")
-            return None
+        def select(conn: sqlite3.Connection) -> Optional[str]:
+            row = conn.execute(SELECT_SESSION_SQL, (session_id,)).fetchone()
+            if not row:
+                return None
+            _cache_session(session_id, row[0])
+            return row[0]
 
-        # Parse state from JSON
-        state = json.loads(row[3])
+        state = await _run_db(select)
 
-        session = InvestigationSession(
-            id=row[0],
-            created_at=datetime.fromisoformat(row[1]),
-            updated_at=datetime.fromisoformat(row[2]),
-            queries_run=state.get("queries_run", []),
-            cached_results=state.get("cached_results", {}),
-            analysis_summary=state.get("analysis_summary", {}),
-        )
+        if state is None:
+            logger.warning(f"Session not found: {session_id}")
+            return None
 
-        logger.debug(f"Retrieved session: {session_id}")
-        return session
+    # The state column holds the full serialized session, so validate it
+    # straight from JSON
+    session = InvestigationSession.model_validate_json(state)
 
-    finally:
-        conn.close()
+    logger.debug(f"Retrieved session: {session_id}")
+    return session
 
 
 async def get_all_sessions() -> list[InvestigationSession]:
     """Retrieve all investigation sessions.
 
+    This parses every session's full state; listings that only need counts
+    should use ``get_all_sessions_summary`` instead.
+
     Returns:
         List of all sessions ordered by creation date (newest first)
 
@@ -232,43 +510,58 @@ async def get_all_sessions() -> list[InvestigationSession]:
         >>> sessions = await get_all_sessions()
         >>> print(f"Found {len(sessions)} active sessions")
     """
-    # Initialize database
-    _init_database()
+    rows = await _run_db(lambda conn: conn.execute(SELECT_ALL_SESSIONS_SQL).fetchall())
 
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    sessions = []
+    for row in rows:
+        try:
+            sessions.append(InvestigationSession.model_validate_json(row[1]))
 
-    try:
-        rows = cursor.execute(
-            """SELECT id, created_at, updated_at, state
-               FROM investigation_sessions
-               ORDER BY created_at DESC"""
+        except Exception as e:
+            logger.error(f"Error parsing session {row[0]}: {e}")
+            continue
+
+    logger.debug(f"Retrieved {len(sessions)} investigation sessions")
+    return sessions
+
+
+async def get_all_sessions_summary(
+    limit: Optional[int] = None, offset: int = 0
+) -> list[dict[str, Any]]:
+    """Retrieve session metadata and state counts without loading full states.
+
+    The counts are computed by SQLite's JSON functions, so no session state
+    is parsed in Python.
+
+    Args:
+        limit: Maximum number of sessions to return (None for all)
+        offset: Number of sessions to skip
+
+    Returns:
+        List of session summaries ordered by creation date (newest first)
+
+    Example:
+        >>> summaries = await get_all_sessions_summary(limit=20)
+        >>> print(summaries[0]["queries_count"])
+    """
+    rows = await _run_db(
+        lambda conn: conn.execute(
+            SELECT_SESSION_SUMMARIES_SQL,
+            (-1 if limit is None else limit, offset),
         ).fetchall()
+    )
 
-        sessions = []
-        for row in rows:
-            try:
-                state = json.loads(row[3])
-
-                session = InvestigationSession(
-                    id=row[0],
-                    created_at=datetime.fromisoformat(row[1]),
-                    updated_at=datetime.fromisoformat(row[2]),
-                    queries_run=state.get("queries_run", []),
-                    cached_results=state.get("cached_results", {}),
-                    analysis_summary=state.get("analysis_summary", {}),
-                )
-                sessions.append(session)
-
-            except Exception as e:
-                logger.error(f"Error parsing session {row[0]}: {e}")
-                continue
-
-        logger.debug(f"Retrieved {len(sessions)} investigation sessions")
-        return sessions
-
-    finally:
-        conn.close()
+    return [
+        {
+            "id": row[0],
+            "created_at": row[1],
+            "updated_at": row[2],
+            "queries_count": row[3],
+            "has_cached_results": bool(row[4]),
+            "has_analysis": bool(row[5]),
+        }
+        for row in rows
+    ]
 
 
 async def delete_session(session_id: str) -> bool:
@@ -285,27 +578,32 @@ async def delete_session(session_id: str) -> bool:
         >>> if deleted:
         ...     print("Session deleted successfully")
     """
-    # Initialize database
-    _init_database()
 
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    def delete(conn: sqlite3.Connection) -> int:
+        try:
+            result = conn.execute(DELETE_SESSION_SQL, (session_id,))
+            conn.commit()
+            _session_cache.pop(session_id, None)
 
-    try:
-        result = cursor.execute("DELETE FROM investigation_sessions WHERE id = ?", (session_id,))
+        except Exception:
+            conn.rollback()
+            raise
 
-        conn.commit()
-        deleted = result.rowcount > 0
+        return result.rowcount
 
-        if deleted:
-            logger.info(f"Deleted investigation session: {session_id}")
-        else:
-            logger.warning(f"Session not found for deletion: {session_id}")
+    try:
+        deleted = await _run_db(delete) > 0
 
-        return deleted
+    except Exception as e:
+        logger.error(f"Failed to delete session {session_id}: {e}")
+        raise
 
-    finally:
-        conn.close()
+    if deleted:
+        logger.info(f"Deleted investigation session: {session_id}")
+    else:
+        logger.warning(f"Session not found for deletion: {session_id}")
+
+    return deleted
 
 
 # MCP Resource Providers
@@ -322,24 +620,10 @@ async def list_investigations() -> str:
     Example URI:
         commoncrawl://investigations
     """
-    sessions = await get_all_sessions()
-
-    info = {
-        "total_sessions": len(sessions),
-        "sessions": [
-            {
-                "id": session.id,
-                "created_at": session.created_at.isoformat(),
-                "updated_at": session.updated_at.isoformat(),
-                "queries_count": len(session.queries_run),
-                "has_cached_results": len(session.cached_results) > 0,
-                "has_analysis": len(session.analysis_summary) > 0,
-            }
-            for session in sessions
-        ],
-    }
-
-    return json.dumps(info, indent=2)
+    # SQLite aggregates the summaries and encodes the JSON itself, so no
+    # session state is parsed and no per-session objects are built here
+    (document,) = await _run_db(lambda conn: conn.execute(LIST_INVESTIGATIONS_SQL).fetchone())
+    return document
 
 
 @mcp.resource("commoncrawl://investigation/{session_id}")
@@ -361,17 +645,21 @@ async def get_investigation_state(session_id: str) -> str:
 
     session = await get_session(session_id)
 
+    # Session states can be large; only pretty-print them when debugging
+    indent = logger.isEnabledFor(logging.DEBUG)
+
     if not session:
-        return json.dumps(
+        return dumps(
             {
                 "error": f"Session not found: {session_id}",
-                "uri": uri,
+                "uri": f"commoncrawl://investigation/{session_id}",
                 "suggestion": "Use commoncrawl://investigations to list available sessions",
             },
-            indent=2,
+            indent=indent,
         )
 
     # Return full session state
+    now = datetime.now(timezone.utc)
     info = {
         "id": session.id,
         "created_at": session.created_at.isoformat(),
@@ -382,16 +670,12 @@ async def get_investigation_state(session_id: str) -> str:
         "metadata": {
             "queries_count": len(session.queries_run),
             "cached_results_count": len(session.cached_results),
-            "session_age_seconds": (
-                datetime.now(timezone.utc) - session.created_at
-            ).total_seconds(),
-            "last_activity_seconds": (
-                datetime.now(timezone.utc) - session.updated_at
-            ).total_seconds(),
+            "session_age_seconds": (now - session.created_at).total_seconds(),
+            "last_activity_seconds": (now - session.updated_at).total_seconds(),
         },
     }
 
-    return json.dumps(info, indent=2)
+    return dumps(info, indent=indent)
 
 
 # Export public API
@@ -399,8 +683,11 @@ __all__ = [
     "InvestigationSession",
     "create_session",
     "update_session",
+    "bulk_update_sessions",
+    "mutate_session",
     "get_session",
     "get_all_sessions",
+    "get_all_sessions_summary",
     "delete_session",
     "list_investigations",
     "get_investigation_state",
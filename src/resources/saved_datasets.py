@@ -3,13 +3,16 @@
 This module provides resource access to saved datasets through URIs.
 """
 
-import json
 import logging
 
 from ..server import mcp
+from ..utils.json_encoding import dumps
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of records returned by the dataset records resource
+RECORDS_RESOURCE_LIMIT = 100
+
 
 @mcp.resource("commoncrawl://datasets")
 async def list_datasets() -> str:
@@ -39,7 +42,7 @@ async def list_datasets() -> str:
         ],
     }
 
-    return json.dumps(info, indent=2)
+    return dumps(info)
 
 
 @mcp.resource("commoncrawl://dataset/{dataset_id}")
@@ -60,7 +63,7 @@ async def get_dataset_info(dataset_id: str) -> str:
     dataset = await get_dataset_by_id(dataset_id)
 
     if not dataset:
-        return json.dumps({"error": f"Dataset not found: {dataset_id}"})
+        return dumps({"error": f"Dataset not found: {dataset_id}"})
 
     info = {
         "id": dataset.id,
@@ -73,7 +76,7 @@ async def get_dataset_info(dataset_id: str) -> str:
         "records_uri": f"commoncrawl://dataset/{dataset.id}/records",
     }
 
-    return json.dumps(info, indent=2)
+    return dumps(info)
 
 
 @mcp.resource("commoncrawl://dataset/{dataset_id}/records")
@@ -89,15 +92,17 @@ async def get_dataset_records_resource(dataset_id: str) -> str:
         JSON string with dataset records (limited to first 100 for performance)
     """
 
-    from ..tools.export import get_dataset_records
+    from ..tools.export import get_dataset_by_id, get_dataset_records
 
-    records = await get_dataset_records(dataset_id)
+    # Fetch one record past the limit to tell whether the list is truncated
+    records = await get_dataset_records(dataset_id, limit=RECORDS_RESOURCE_LIMIT + 1)
+    dataset = await get_dataset_by_id(dataset_id) if records else None
 
     info = {
         "dataset_id": dataset_id,
-        "total_records": len(records),
-        "records": records[:100],  # Limit to first 100 for performance
-        "truncated": len(records) > 100,
+        "total_records": dataset.records_count if dataset else len(records),
+        "records": records[:RECORDS_RESOURCE_LIMIT],
+        "truncated": len(records) > RECORDS_RESOURCE_LIMIT,
     }
 
-    return json.dumps(info, indent=2)
+    return dumps(info)
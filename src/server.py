@@ -5,13 +5,19 @@ resources, and prompts for Common Crawl analysis.
 """
 
 import asyncio
+import functools
 import logging
 import sys
-from typing import Any, Optional
+import time
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Optional
 
 from mcp.server.fastmcp import FastMCP
+from pydantic import BaseModel
+from pydantic_core import SchemaSerializer
 
 from .config import get_config
+from .utils.json_encoding import dumps
 
 # Initialize configuration
 config = get_config()
@@ -27,51 +33,90 @@ logger = logging.getLogger(__name__)
 mcp = FastMCP(name=config.server.server_name)
 
 
-# Import core infrastructure
-from .core.cache import CacheManager
-from .core.cc_client import CDXClient
-from .core.s3_manager import S3Manager
-from .core.warc_parser import WarcParser
+# Core infrastructure is imported on first use (boto3, warcio and friends are
+# slow to import and not every session needs them)
+if TYPE_CHECKING:
+    from .core.cache import CacheManager
+    from .core.cc_client import CDXClient
+    from .core.s3_manager import S3Manager
+    from .core.warc_parser import WarcParser
 
 # Initialize core components (lazy)
-_cache_manager: Optional[CacheManager] = None
-_cdx_client: Optional[CDXClient] = None
-_s3_manager: Optional[S3Manager] = None
-_warc_parser: Optional[WarcParser] = None
+_cache_manager: Optional["CacheManager"] = None
+_cdx_client: Optional["CDXClient"] = None
+_s3_manager: Optional["S3Manager"] = None
+_warc_parser: Optional["WarcParser"] = None
 
 
-def get_cache() -> CacheManager:
+def get_cache() -> "CacheManager":
     """Get cache manager instance."""
     global _cache_manager
     if _cache_manager is None:
+        from .core.cache import CacheManager
+
         _cache_manager = CacheManager()
     return _cache_manager
 
 
-def get_cdx_client() -> CDXClient:
+def get_cdx_client() -> "CDXClient":
     """Get CDX client instance."""
     global _cdx_client
     if _cdx_client is None:
+        from .core.cc_client import CDXClient
+
         _cdx_client = CDXClient()
     return _cdx_client
 
 
-def get_s3_manager() -> S3Manager:
+def get_s3_manager() -> "S3Manager":
     """Get S3 manager instance."""
     global _s3_manager
     if _s3_manager is None:
+        from .core.s3_manager import S3Manager
+
         _s3_manager = S3Manager()
     return _s3_manager
 
 
-def get_warc_parser() -> WarcParser:
+def get_warc_parser() -> "WarcParser":
     """Get WARC parser instance."""
     global _warc_parser
     if _warc_parser is None:
+        from .core.warc_parser import WarcParser
+
         _warc_parser = WarcParser()
     return _warc_parser
 
 
+# Configuration is fixed once loaded, so the config sections of the health
+# report are built once. validate() checks filesystem permissions, so its
+# result is reused for a short while rather than re-checked on every call.
+_HEALTH_CONFIG = {
+    "server": {
+        "name": config.server.server_name,
+        "version": config.server.server_version,
+    },
+    "cache": {
+        "directory": str(config.cache.cache_dir),
+        "max_size_gb": config.cache.cache_max_size_gb,
+    },
+    "redis": {
+        "enabled": config.redis.redis_enabled,
+    },
+}
+_VALIDATION_TTL_SECONDS = 30
+_validation: Optional[tuple[float, list[str]]] = None
+
+
+def _config_warnings() -> list[str]:
+    """Get configuration warnings, re-validating at most every _VALIDATION_TTL_SECONDS."""
+    global _validation
+    now = time.monotonic()
+    if _validation is None or _validation[0] <= now:
+        _validation = (now + _VALIDATION_TTL_SECONDS, config.validate())
+    return _validation[1]
+
+
 # Diagnostic & monitoring tools
 @mcp.tool()
 def health_check() -> dict[str, Any]:
@@ -80,28 +125,20 @@ def health_check() -> dict[str, Any]:
     Returns:
         Dictionary containing health status and configuration info.
     """
-    warnings = config.validate()
+    warnings = _config_warnings()
 
     return {
         "status": "healthy" if not warnings else "degraded",
-        "server": {
-            "name": config.server.server_name,
-            "version": config.server.server_version,
-        },
+        "server": _HEALTH_CONFIG["server"],
         "infrastructure": {
             "cdx_client": "initialized" if _cdx_client else "not initialized",
             "s3_manager": "initialized" if _s3_manager else "not initialized",
             "cache_manager": "initialized" if _cache_manager else "not initialized",
             "warc_parser": "initialized" if _warc_parser else "not initialized",
         },
-        "cache": {
-            "directory": str(config.cache.cache_dir),
-            "max_size_gb": config.cache.cache_max_size_gb,
-        },
-        "redis": {
-            "enabled": config.redis.redis_enabled,
-        },
-        "warnings": warnings,
+        "cache": _HEALTH_CONFIG["cache"],
+        "redis": _HEALTH_CONFIG["redis"],
+        "warnings": list(warnings),
     }
 
 
@@ -185,24 +222,92 @@ async def test_s3_connection() -> dict[str, Any]:
 from .prompts import (competitive_analysis, content_discovery, domain_research,
                       seo_analysis)
 # MCP Resources (Phase 7)
-from .resources import (get_crawl_info, get_dataset_info,
-                        get_dataset_records_resource, get_investigation_state,
-                        list_all_crawls, list_datasets, list_investigations)
-# Aggregation & Statistics Tools (Phase 5)
-# HTML Parsing & Analysis Tools (Phase 4)
-# Data Fetching & Extraction Tools (Phase 3)
-# Discovery & Metadata Tools (Phase 2)
-from .tools import aggregation, discovery, fetching, parsing
+# (import the submodules directly so this also works while src.resources is
+# still initializing, e.g. when a resource module is the first thing imported)
+from .resources import crawl_info, investigation_state, saved_datasets
+
+# Serializers of the result models returned by the tool wrappers, bound on
+# first use (the models build their schemas lazily)
+_serializers: dict[type[BaseModel], SchemaSerializer] = {}
+
+
+def _to_dict(result: BaseModel) -> dict[str, Any]:
+    """Convert a tool result model to a dict, like ``result.model_dump()``.
+
+    Calls the model's pre-bound core serializer directly, skipping the
+    argument handling ``model_dump`` does on every call.
+
+    Args:
+        result: Result model returned by a tool function
+
+    Returns:
+        Dictionary with the model's fields
+    """
+    serializer = _serializers.get(type(result))
+    if serializer is None:
+        # model_dump builds the deferred serializer if needed
+        data = result.model_dump()
+        _serializers[type(result)] = type(result).__pydantic_serializer__
+        return data
+    return serializer.to_python(result)
+
+
+# Tool modules are imported on the first call of one of their wrappers; the
+# cached accessors keep later calls from going back through the import system.
+@functools.cache
+def _discovery_tools() -> ModuleType:
+    from .tools import discovery
+
+    return discovery
+
+
+@functools.cache
+def _fetching_tools() -> ModuleType:
+    from .tools import fetching
 
+    return fetching
 
+
+@functools.cache
+def _parsing_tools() -> ModuleType:
+    from .tools import parsing
+
+    return parsing
+
+
+@functools.cache
+def _aggregation_tools() -> ModuleType:
+    from .tools import aggregation
+
+    return aggregation
+
+
+@functools.cache
+def _export_tools() -> ModuleType:
+    from .tools import export
+
+    return export
+
+
+@functools.cache
+def _advanced_tools() -> ModuleType:
+    from .tools import advanced
+
+    return advanced
+
+
+# Discovery & Metadata Tools
 @mcp.tool()
-async def list_crawls() -> dict[str, Any]:
+async def list_crawls(force_refresh: bool = False) -> dict[str, Any]:
     """List all available Common Crawl datasets.
 
+    Args:
+        force_refresh: Bypass cached results and re-fetch from the CDX server
+
     Returns:
         Dictionary with list of crawls and metadata.
     """
-    return await discovery.list_crawls()
+    return await _discovery_tools().list_crawls(force_refresh)
 
 
 @mcp.tool()
@@ -215,7 +320,7 @@ async def get_crawl_stats(crawl_id: str) -> dict[str, Any]:
     Returns:
         Dictionary with crawl statistics and metadata.
     """
-    return await discovery.get_crawl_stats(crawl_id)
+    return await _discovery_tools().get_crawl_stats(crawl_id)
 
 
 @mcp.tool()
@@ -236,7 +341,7 @@ async def search_index(
     Returns:
         Dictionary with search results.
     """
-    return await discovery.search_index(query, crawl_id, limit, match_type)
+    return await _discovery_tools().search_index(query, crawl_id, limit, match_type)
 
 
 @mcp.tool()
@@ -255,7 +360,7 @@ async def get_domain_stats(
     Returns:
         Dictionary with domain statistics.
     """
-    return await discovery.get_domain_stats(domain, crawl_id, sample_size)
+    return await _discovery_tools().get_domain_stats(domain, crawl_id, sample_size)
 
 
 @mcp.tool()
@@ -274,9 +379,10 @@ async def compare_crawls(
     Returns:
         Dictionary with comparison results.
     """
-    return await discovery.compare_crawls(domain, crawl_id_1, crawl_id_2)
+    return await _discovery_tools().compare_crawls(domain, crawl_id_1, crawl_id_2)
 
 
+# Data Fetching & Extraction Tools
 @mcp.tool()
 async def fetch_page_content(
     url: str,
@@ -291,7 +397,7 @@ async def fetch_page_content(
     Returns:
         Dictionary with page content and metadata.
     """
-    return await fetching.fetch_page_content(url, crawl_id)
+    return await _fetching_tools().fetch_page_content(url, crawl_id)
 
 
 @mcp.tool()
@@ -310,7 +416,7 @@ async def batch_fetch_pages(
     Returns:
         Dictionary with results for all URLs.
     """
-    return await fetching.batch_fetch_pages(urls, crawl_id, max_concurrent)
+    return await _fetching_tools().batch_fetch_pages(urls, crawl_id, max_concurrent)
 
 
 @mcp.tool()
@@ -327,7 +433,7 @@ async def fetch_warc_records(
     Returns:
         Dictionary with WARC records.
     """
-    return await fetching.fetch_warc_records(urls, crawl_id)
+    return await _fetching_tools().fetch_warc_records(urls, crawl_id)
 
 
 @mcp.tool()
@@ -344,7 +450,7 @@ async def fetch_wat_metadata(
     Returns:
         Dictionary with extracted metadata.
     """
-    return await fetching.fetch_wat_metadata(url, crawl_id)
+    return await _fetching_tools().fetch_wat_metadata(url, crawl_id)
 
 
 @mcp.tool()
@@ -361,7 +467,7 @@ async def fetch_wet_text(
     Returns:
         Dictionary with extracted plain text.
     """
-    return await fetching.fetch_wet_text(url, crawl_id)
+    return await _fetching_tools().fetch_wet_text(url, crawl_id)
 
 
 # Parsing & Analysis Tools
@@ -376,8 +482,8 @@ async def parse_html(url: str, crawl_id: str = "CC-MAIN-2024-10") -> dict[str, A
     Returns:
         Dictionary with parsed HTML data (title, meta, headings, links, text).
     """
-    result = await parsing.parse_html_content(url, crawl_id)
-    return result.model_dump()
+    result = await _parsing_tools().parse_html_content(url, crawl_id)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -391,8 +497,8 @@ async def extract_links(url: str, crawl_id: str = "CC-MAIN-2024-10") -> dict[str
     Returns:
         Dictionary with link analysis (internal/external classification).
     """
-    result = await parsing.extract_links_analysis(url, crawl_id)
-    return result.model_dump()
+    result = await _parsing_tools().extract_links_analysis(url, crawl_id)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -406,8 +512,8 @@ async def analyze_technologies(url: str, crawl_id: str = "CC-MAIN-2024-10") -> d
     Returns:
         Dictionary with detected technologies and confidence scores.
     """
-    result = await parsing.analyze_technologies(url, crawl_id)
-    return result.model_dump()
+    result = await _parsing_tools().analyze_technologies(url, crawl_id)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -421,8 +527,8 @@ async def extract_structured_data(url: str, crawl_id: str = "CC-MAIN-2024-10") -
     Returns:
         Dictionary with extracted structured data.
     """
-    result = await parsing.extract_structured_data_from_page(url, crawl_id)
-    return result.model_dump()
+    result = await _parsing_tools().extract_structured_data_from_page(url, crawl_id)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -436,8 +542,8 @@ async def analyze_seo(url: str, crawl_id: str = "CC-MAIN-2024-10") -> dict[str,
     Returns:
         Dictionary with SEO analysis, score, issues, and recommendations.
     """
-    result = await parsing.analyze_seo_metrics(url, crawl_id)
-    return result.model_dump()
+    result = await _parsing_tools().analyze_seo_metrics(url, crawl_id)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -451,8 +557,8 @@ async def detect_language(url: str, crawl_id: str = "CC-MAIN-2024-10") -> dict[s
     Returns:
         Dictionary with language detection result and confidence.
     """
-    result = await parsing.detect_language(url, crawl_id)
-    return result.model_dump()
+    result = await _parsing_tools().detect_language(url, crawl_id)
+    return _to_dict(result)
 
 
 # Aggregation & Statistics Tools
@@ -470,8 +576,8 @@ async def domain_technology_report(
     Returns:
         Dictionary with aggregated technology usage across domain.
     """
-    result = await aggregation.domain_technology_report(domain, crawl_id, sample_size)
-    return result.model_dump()
+    result = await _aggregation_tools().domain_technology_report(domain, crawl_id, sample_size)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -492,8 +598,8 @@ async def domain_link_graph(
     Returns:
         Dictionary with graph structure (nodes, edges, hub pages, PageRank).
     """
-    result = await aggregation.domain_link_graph(domain, crawl_id, sample_size, depth)
-    return result.model_dump()
+    result = await _aggregation_tools().domain_link_graph(domain, crawl_id, sample_size, depth)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -516,10 +622,10 @@ async def keyword_frequency_analysis(
     Returns:
         Dictionary with keyword frequencies and TF-IDF scores.
     """
-    result = await aggregation.keyword_frequency_analysis(
+    result = await _aggregation_tools().keyword_frequency_analysis(
         domain, keywords, crawl_id, sample_size, case_sensitive
     )
-    return result.model_dump()
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -538,8 +644,8 @@ async def domain_evolution_timeline(
     Returns:
         Dictionary with evolution metrics (page counts, technologies added/removed).
     """
-    result = await aggregation.domain_evolution_timeline(domain, crawl_ids, sample_size)
-    return result.model_dump()
+    result = await _aggregation_tools().domain_evolution_timeline(domain, crawl_ids, sample_size)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -558,8 +664,8 @@ async def header_analysis(
     Returns:
         Dictionary with security header adoption rates and security score.
     """
-    result = await aggregation.header_analysis(domain, crawl_id, sample_size)
-    return result.model_dump()
+    result = await _aggregation_tools().header_analysis(domain, crawl_id, sample_size)
+    return _to_dict(result)
 
 
 # ============================================================================
@@ -581,10 +687,8 @@ async def export_to_csv(
     Returns:
         Export statistics and file information
     """
-    from .tools import export as export_tools
-
-    result = await export_tools.export_to_csv(data, output_path, fields=fields)
-    return result.model_dump()
+    result = await _export_tools().export_to_csv(data, output_path, fields=fields)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -598,10 +702,8 @@ async def export_to_jsonl(data: list[dict], output_path: str) -> dict[str, Any]:
     Returns:
         Export statistics and file information
     """
-    from .tools import export as export_tools
-
-    result = await export_tools.export_to_jsonl(data, output_path)
-    return result.model_dump()
+    result = await _export_tools().export_to_jsonl(data, output_path)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -622,10 +724,8 @@ async def create_dataset(
     Returns:
         Dataset information including ID and record count
     """
-    from .tools import export as export_tools
-
-    result = await export_tools.create_dataset(name, description, data, metadata=metadata)
-    return result.model_dump()
+    result = await _export_tools().create_dataset(name, description, data, metadata=metadata)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -646,10 +746,8 @@ async def generate_report(
     Returns:
         Report generation statistics
     """
-    from .tools import export as export_tools
-
-    result = await export_tools.generate_report(report_type, data, output_path, format=format)
-    return result.model_dump()
+    result = await _export_tools().generate_report(report_type, data, output_path, format=format)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -664,18 +762,14 @@ async def export_warc_subset(urls: list[str], crawl_id: str, output_path: str) -
     Returns:
         Export statistics including records exported and errors
     """
-    from .tools import export as export_tools
-
-    result = await export_tools.export_warc_subset(urls, crawl_id, output_path)
-    return result.model_dump()
+    result = await _export_tools().export_warc_subset(urls, crawl_id, output_path)
+    return _to_dict(result)
 
 
 # ============================================================================
 # Phase 9: Advanced Analysis Tools
 # ============================================================================
 
-from .tools import advanced
-
 
 @mcp.tool()
 async def classify_content(url: str, crawl_id: str = "CC-MAIN-2024-10") -> dict[str, Any]:
@@ -698,8 +792,8 @@ async def classify_content(url: str, crawl_id: str = "CC-MAIN-2024-10") -> dict[
         >>> print(result["page_type"])
         'blog'
     """
-    result = await advanced.content_classification(url, crawl_id)
-    return result.model_dump()
+    result = await _advanced_tools().content_classification(url, crawl_id)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -724,8 +818,8 @@ async def detect_spam(url: str, crawl_id: str = "CC-MAIN-2024-10") -> dict[str,
         >>> print(result["recommendation"])
         'likely_legitimate'
     """
-    result = await advanced.spam_detection(url, crawl_id)
-    return result.model_dump()
+    result = await _advanced_tools().spam_detection(url, crawl_id)
+    return _to_dict(result)
 
 
 @mcp.tool()
@@ -754,8 +848,8 @@ async def analyze_trends(
         >>> print(result["insights"])
         ['Domain is growing: 25.5% increase in indexed pages']
     """
-    result = await advanced.trend_analysis(domain, crawl_ids, sample_size=sample_size)
-    return result.model_dump()
+    result = await _advanced_tools().trend_analysis(domain, crawl_ids, sample_size=sample_size)
+    return _to_dict(result)
 
 
 # ============================================================================
@@ -770,6 +864,14 @@ def get_server_info() -> dict[str, Any]:
     Returns:
         Dictionary containing server capabilities and configuration.
     """
+    return _server_info()
+
+
+# The server info and config resource only depend on the configuration,
+# which is fixed once loaded, so each is built once per process
+@functools.cache
+def _server_info() -> dict[str, Any]:
+    """Build the get_server_info payload."""
     return {
         "name": config.server.server_name,
         "version": config.server.server_version,
@@ -851,9 +953,13 @@ def get_server_config() -> str:
     Returns:
         JSON string containing server configuration.
     """
-    import json
+    return _server_config_json()
 
-    return json.dumps(
+
+@functools.cache
+def _server_config_json() -> str:
+    """Render the server configuration resource."""
+    return dumps(
         {
             "server": {
                 "name": config.server.server_name,
@@ -873,7 +979,7 @@ def get_server_config() -> str:
                 "requests_per_second": config.rate_limit.requests_per_second,
             },
         },
-        indent=2,
+        indent=True,
     )
 
 
@@ -898,6 +1004,12 @@ def main():
     logger.info(f"S3 bucket: {config.s3.commoncrawl_bucket}")
     logger.info(f"CDX server: {config.cdx.cdx_server_url}")
 
+    # Models defer building their core schemas; build the one every session
+    # starts with (crawl listing) before the first request arrives
+    from .models.schemas import CrawlInfo
+
+    CrawlInfo.model_rebuild()
+
     # Run the server
     try:
         mcp.run()
@@ -4,14 +4,72 @@ This module provides intelligent classification, spam detection, and trend
 analysis by composing existing tool primitives.
 """
 
+import asyncio
 import logging
-from typing import Any
+import re
+from typing import Any, Optional
 
 from ..models.schemas import (ContentClassification, SpamAnalysis, Trend,
                               TrendAnalysis)
 
 logger = logging.getLogger(__name__)
 
+# URL path segments hinting at a page type. One pass finds every hinted
+# type; the lookahead leaves the closing slash for an adjacent segment.
+_URL_PATTERN_RE = re.compile(
+    r"/(?:(?P<blog>blog|post|article)"
+    r"|(?P<product>product|shop|item)"
+    r"|(?P<documentation>docs|documentation|api)"
+    r"|(?P<news>news))(?=/)"
+)
+
+# Page types in priority order, for URLs hinting at more than one
+_URL_PATTERN_PRIORITY = ("blog", "product", "documentation", "news")
+
+# Schema.org types marking a blog post
+_BLOG_SCHEMA_TYPES = frozenset({"BlogPosting", "Article"})
+
+# Response headers (lowercase) that a maintained site usually sets
+_SECURITY_HEADERS = frozenset(
+    {
+        "strict-transport-security",
+        "content-security-policy",
+        "x-frame-options",
+        "x-content-type-options",
+        "referrer-policy",
+        "permissions-policy",
+        "x-xss-protection",
+    }
+)
+
+
+def _url_pattern(url: str) -> Optional[str]:
+    """Get the page type hinted at by a URL's path segments, if any."""
+    found = {match.lastgroup for match in _URL_PATTERN_RE.finditer(url.lower())}
+    return next((page_type for page_type in _URL_PATTERN_PRIORITY if page_type in found), None)
+
+
+async def _gather_signals(url: str, **signals: Any) -> dict[str, Optional[Any]]:
+    """Run independent signal tools concurrently.
+
+    Args:
+        url: URL being analyzed (for logging)
+        **signals: Signal name -> awaitable producing it
+
+    Returns:
+        Signal name -> result, or None for signals that failed
+    """
+    results = await asyncio.gather(*signals.values(), return_exceptions=True)
+
+    gathered = {}
+    for name, result in zip(signals, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Signal '{name}' unavailable for {url}: {result}")
+            result = None
+        gathered[name] = result
+    return gathered
+
+
 __all__ = [
     "content_classification",
     "spam_detection",
@@ -50,28 +108,29 @@ async def content_classification(
                           extract_structured_data_from_page)
 
     try:
-        # Gather signals from existing tools
-        seo = await analyze_seo_metrics(url, crawl_id)
-        lang = await detect_language(url, crawl_id)
-        structured = await extract_structured_data_from_page(url, crawl_id)
+        # Gather signals from existing tools concurrently; a failed signal
+        # degrades the classification instead of aborting it
+        gathered = await _gather_signals(
+            url,
+            seo=analyze_seo_metrics(url, crawl_id),
+            lang=detect_language(url, crawl_id),
+            structured=extract_structured_data_from_page(url, crawl_id),
+        )
+        seo = gathered["seo"]
+        lang = gathered["lang"]
+        structured = gathered["structured"]
 
         signals = {}
 
         # URL pattern signals
-        url_lower = url.lower()
-        if "/blog/" in url_lower or "/post/" in url_lower or "/article/" in url_lower:
-            signals["url_pattern"] = "blog"
-        elif "/product/" in url_lower or "/shop/" in url_lower or "/item/" in url_lower:
-            signals["url_pattern"] = "product"
-        elif "/docs/" in url_lower or "/documentation/" in url_lower or "/api/" in url_lower:
-            signals["url_pattern"] = "documentation"
-        elif "/news/" in url_lower:
-            signals["url_pattern"] = "news"
+        url_pattern = _url_pattern(url)
+        if url_pattern:
+            signals["url_pattern"] = url_pattern
 
         # Structured data signals
-        if structured.schema_org:
-            schema_types = str(structured.schema_org)
-            if "BlogPosting" in schema_types or "Article" in schema_types:
+        if structured and structured.schema_types:
+            schema_types = set(structured.schema_types)
+            if schema_types & _BLOG_SCHEMA_TYPES:
                 signals["schema_org"] = "blog"
             elif "Product" in schema_types:
                 signals["schema_org"] = "product"
@@ -79,8 +138,8 @@ async def content_classification(
                 signals["schema_org"] = "news"
 
         # Content structure signals
-        if seo.headings:
-            h1_count = len(seo.headings.get("h1", []))
+        if seo and seo.heading_structure:
+            h1_count = seo.heading_structure.get("h1", 0)
             if h1_count == 1:
                 signals["heading_structure"] = "well_structured"
             elif h1_count > 1:
@@ -116,7 +175,7 @@ async def content_classification(
 
         # Landing pages typically lack blog/product patterns
         if not signals.get("url_pattern") and signals.get("heading_structure") == "well_structured":
-            if seo.seo_score > 70:
+            if seo and seo.score > 70:
                 page_type = "landing_page"
                 confidence = 0.6
 
@@ -127,8 +186,8 @@ async def content_classification(
             page_type=page_type,
             confidence=confidence,
             signals=signals,
-            language=lang.language,
-            content_quality_score=seo.seo_score,
+            language=lang.detected_language if lang else "unknown",
+            content_quality_score=seo.score if seo else 0.0,
         )
 
     except Exception as e:
@@ -173,19 +232,30 @@ async def spam_detection(
     """
     logger.info(f"Analyzing spam signals for URL: {url}")
 
-    from .parsing import analyze_technologies, parse_html_content
+    from .parsing import _fetch_page, analyze_technologies, parse_html_content
 
     try:
-        # Gather signals from existing tools
-        parsed = await parse_html_content(url, crawl_id)
-        tech = await analyze_technologies(url, crawl_id)
+        # Gather signals from existing tools concurrently
+        gathered = await _gather_signals(
+            url,
+            parsed=parse_html_content(url, crawl_id),
+            tech=analyze_technologies(url, crawl_id),
+            page=_fetch_page(url, crawl_id),
+        )
+        parsed = gathered["parsed"]
+        tech = gathered["tech"]
+        page = gathered["page"]
+
+        # The parsed page is required; technologies only add a quality signal
+        if parsed is None:
+            raise ValueError(f"Could not parse {url}")
 
         spam_signals = []
         quality_signals = []
         spam_score = 0
 
-        # Security header signals
-        if not parsed.headers or len(parsed.headers) == 0:
+        # Security header signals (from the page's HTTP response)
+        if page and not _SECURITY_HEADERS.intersection(name.lower() for name in page.headers):
             spam_signals.append("missing_security_headers")
             spam_score += 20
 
@@ -199,24 +269,18 @@ async def spam_detection(
             spam_score += 10
 
         # Link spam signals
-        if parsed.links:
-            external_links = [
-                link
-                for link in parsed.links
-                if link.get("href") and url not in link.get("href", "")
-            ]
-            if len(external_links) > 50:
-                spam_signals.append("excessive_external_links")
-                spam_score += 20
+        if parsed.external_link_count > 50:
+            spam_signals.append("excessive_external_links")
+            spam_score += 20
 
         # Technology signals (legitimate sites use known tech)
-        if tech.technologies and len(tech.technologies) > 0:
+        if tech and tech.technologies and len(tech.technologies) > 0:
             quality_signals.append("uses_known_technologies")
             spam_score -= 10
 
         # Keyword stuffing detection
-        if parsed.text:
-            words = parsed.text.lower().split()
+        if parsed.text_content:
+            words = parsed.text_content.lower().split()
             if len(words) > 100:  # Only check for longer content
                 unique_words = set(words)
                 repetition_ratio = 1 - (len(unique_words) / len(words))
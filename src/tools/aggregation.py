@@ -7,6 +7,7 @@ multiple pages to generate comprehensive reports, link graphs, and statistics.
 import asyncio
 import logging
 import re
+from array import array
 from collections import Counter, defaultdict
 from typing import Any, Callable, Optional
 from urllib.parse import urlparse
@@ -14,7 +15,7 @@ from urllib.parse import urlparse
 from ..core.cache import CacheManager
 from ..core.cc_client import CDXClient
 from ..models.schemas import (HeaderReport, KeywordStats, LinkGraph,
-                              TechReport, Timeline)
+                              TechReport, Timeline, construct_trusted)
 from .fetching import fetch_page_content as fetch_page_dict
 from .parsing import (analyze_technologies, extract_links_analysis,
                       parse_html_content)
@@ -156,7 +157,8 @@ async def domain_technology_report(
         categories_dict[category] = dict(tech_counts)
 
     # Create report
-    report = TechReport(
+    report = construct_trusted(
+        TechReport,
         domain=domain,
         crawl_id=crawl_id,
         pages_analyzed=pages_analyzed,
@@ -299,7 +301,8 @@ async def domain_link_graph(
     pagerank = _calculate_pagerank(nodes_list, edges, iterations=20)
 
     # Create graph
-    graph = LinkGraph(
+    graph = construct_trusted(
+        LinkGraph,
         domain=domain,
         crawl_id=crawl_id,
         nodes=nodes_list,
@@ -334,41 +337,46 @@ def _calculate_pagerank(
     if not nodes:
         return {}
 
-    # Initialize PageRank scores
     num_nodes = len(nodes)
-    scores = {node: 1.0 / num_nodes for node in nodes}
+    index = {node: i for i, node in enumerate(nodes)}
 
-    # Build outbound links map
-    outbound = defaultdict(list)
+    # Store the graph as parallel arrays of node indices rather than a
+    # url -> [urls] map. A duplicate edge adds to the source's out-degree
+    # but passes rank to its target only once.
+    out_degree = [0] * num_nodes
+    links = set()
     for source, target in edges:
-        if source in scores and target in scores:  # Only include nodes in our set
-            outbound[source].append(target)
-
-    # Calculate PageRank iteratively
-    for _ in range(iterations):
-        new_scores = {}
-
-        for node in nodes:
-            # Base probability (random surfer)
-            rank = (1 - damping) / num_nodes
-
-            # Add contributions from inbound links
-            for source, targets in outbound.items():
-                if node in targets:
-                    # Distribute source's PageRank across its outbound links
-                    contribution = scores[source] / len(targets)
-                    rank += damping * contribution
+        source_idx = index.get(source)
+        target_idx = index.get(target)
+        if source_idx is None or target_idx is None:  # Only include nodes in our set
+            continue
+        out_degree[source_idx] += 1
+        links.add((source_idx, target_idx))
 
-            new_scores[node] = rank
+    links = sorted(links)
+    edges_from = array("i", [link[0] for link in links])
+    edges_to = array("i", [link[1] for link in links])
 
+    # Calculate PageRank iteratively, pushing each source's share along its
+    # edges: O(edges) per iteration
+    scores = [1.0 / num_nodes] * num_nodes
+    base = (1 - damping) / num_nodes
+    for _ in range(iterations):
+        shares = [
+            damping * (score / degree) if degree else 0.0
+            for score, degree in zip(scores, out_degree)
+        ]
+        new_scores = [base] * num_nodes
+        for source_idx, target_idx in zip(edges_from, edges_to):
+            new_scores[target_idx] += shares[source_idx]
         scores = new_scores
 
     # Normalize scores to sum to 1.0
-    total = sum(scores.values())
+    total = sum(scores)
     if total > 0:
-        scores = {node: score / total for node, score in scores.items()}
+        return {node: scores[i] / total for i, node in enumerate(nodes)}
 
-    return scores
+    return dict(zip(nodes, scores))
 
 
 async def keyword_frequency_analysis(
@@ -466,6 +474,15 @@ async def keyword_frequency_analysis(
     total_occurrences = {kw: 0 for kw in keywords}
     document_frequencies = {kw: 0 for kw in keywords}  # Number of documents containing keyword
 
+    # Compile one word-boundary pattern per keyword up front instead of per page
+    patterns = [
+        (
+            keyword,
+            re.compile(r"\b" + re.escape(keyword if case_sensitive else keyword.lower()) + r"\b"),
+        )
+        for keyword in keywords
+    ]
+
     for result in valid_results:
         url = result["url"]
         text = result["text"]
@@ -473,13 +490,9 @@ async def keyword_frequency_analysis(
         # Normalize text for matching
         search_text = text if case_sensitive else text.lower()
 
-        for keyword in keywords:
-            search_keyword = keyword if case_sensitive else keyword.lower()
-
+        for keyword, pattern in patterns:
             # Count occurrences using word boundary matching
-            pattern = r"\b" + re.escape(search_keyword) + r"\b"
-            matches = re.findall(pattern, search_text)
-            count = len(matches)
+            count = len(pattern.findall(search_text))
 
             if count > 0:
                 frequencies[keyword][url] = count
@@ -490,7 +503,8 @@ async def keyword_frequency_analysis(
     tfidf_scores = _calculate_tfidf(frequencies, document_frequencies, total_pages)
 
     # Create stats
-    stats = KeywordStats(
+    stats = construct_trusted(
+        KeywordStats,
         keywords=keywords,
         frequencies=frequencies,
         total_occurrences=total_occurrences,
@@ -588,14 +602,25 @@ async def domain_evolution_timeline(
     technologies_by_crawl = {}
 
     total_crawls = len(crawl_ids)
+    completed_crawls = 0
 
-    # Step 1: Analyze each crawl
-    for crawl_index, crawl_id in enumerate(crawl_ids):
-        logger.info(f"Analyzing crawl {crawl_index + 1}/{total_crawls}: {crawl_id}")
+    # Shared by all crawls, so analyzing them concurrently keeps the same
+    # page analysis load as analyzing them one at a time
+    semaphore = asyncio.Semaphore(5)  # Lower concurrency for cross-crawl analysis
 
-        # Report progress
-        if progress_callback:
-            progress_callback(crawl_index + 1, total_crawls)
+    async def analyze_tech_with_semaphore(url: str, crawl_id: str) -> Optional[set]:
+        """Analyze technologies for single page."""
+        async with semaphore:
+            try:
+                result = await analyze_technologies(url, crawl_id)
+                return {tech.name for tech in result.technologies}
+            except Exception as e:
+                logger.debug(f"Error analyzing {url}: {e}")
+                return set()
+
+    async def analyze_crawl(crawl_id: str) -> None:
+        """Sample a domain's pages in one crawl."""
+        nonlocal completed_crawls
 
         # Get page count
         search_results = await cdx.search_index(
@@ -607,48 +632,46 @@ async def domain_evolution_timeline(
             page_counts[crawl_id] = 0
             size_bytes[crawl_id] = 0
             technologies_by_crawl[crawl_id] = set()
-            continue
-
-        # Extract unique URLs
-        urls = list(set(result.url for result in search_results))
-        urls = urls[:sample_size]
+        else:
+            # Extract unique URLs
+            urls = list(set(result.url for result in search_results))
+            urls = urls[:sample_size]
 
-        page_counts[crawl_id] = len(urls)
+            page_counts[crawl_id] = len(urls)
 
-        # Calculate total size (approximation from CDX records)
-        total_size = sum(getattr(result, "length", 0) for result in search_results[:sample_size])
-        size_bytes[crawl_id] = total_size
+            # Calculate total size (approximation from CDX records)
+            size_bytes[crawl_id] = sum(
+                getattr(result, "length", 0) for result in search_results[:sample_size]
+            )
 
-        # Analyze technologies (sample first 10 pages for performance)
-        sample_urls = urls[:10]
-        technologies = set()
+            # Analyze technologies concurrently (sample first 10 pages for performance)
+            tasks = [analyze_tech_with_semaphore(url, crawl_id) for url in urls[:10]]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        semaphore = asyncio.Semaphore(5)  # Lower concurrency for cross-crawl analysis
+            # Collect all technologies
+            technologies = set()
+            for tech_set in results:
+                if tech_set and not isinstance(tech_set, Exception):
+                    technologies.update(tech_set)
 
-        async def analyze_tech_with_semaphore(url: str) -> Optional[set]:
-            """Analyze technologies for single page."""
-            async with semaphore:
-                try:
-                    result = await analyze_technologies(url, crawl_id)
-                    return {tech.name for tech in result.technologies}
-                except Exception as e:
-                    logger.debug(f"Error analyzing {url}: {e}")
-                    return set()
+            technologies_by_crawl[crawl_id] = technologies
 
-        # Analyze technologies concurrently
-        tasks = [analyze_tech_with_semaphore(url) for url in sample_urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(
+                f"Crawl {crawl_id}: {page_counts[crawl_id]} pages, {len(technologies)} technologies"
+            )
 
-        # Collect all technologies
-        for tech_set in results:
-            if tech_set and not isinstance(tech_set, Exception):
-                technologies.update(tech_set)
+        # Report progress
+        completed_crawls += 1
+        if progress_callback:
+            progress_callback(completed_crawls, total_crawls)
 
-        technologies_by_crawl[crawl_id] = technologies
+    # Step 1: Analyze all crawls concurrently (CDX searches are bounded by
+    # the client's own rate limiter)
+    await asyncio.gather(*(analyze_crawl(crawl_id) for crawl_id in crawl_ids))
 
-        logger.info(
-            f"Crawl {crawl_id}: {page_counts[crawl_id]} pages, {len(technologies)} technologies"
-        )
+    # Results arrive out of order; key them in crawl order
+    page_counts = {crawl_id: page_counts[crawl_id] for crawl_id in crawl_ids}
+    size_bytes = {crawl_id: size_bytes[crawl_id] for crawl_id in crawl_ids}
 
     # Step 2: Calculate technology changes
     technologies_added = {}
@@ -670,7 +693,8 @@ async def domain_evolution_timeline(
         technologies_removed[next_crawl] = sorted(list(removed))
 
     # Create timeline
-    timeline = Timeline(
+    timeline = construct_trusted(
+        Timeline,
         domain=domain,
         crawls=crawl_ids,
         page_counts=page_counts,
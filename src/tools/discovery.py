@@ -6,12 +6,16 @@ querying the index, and analyzing domain statistics.
 
 import json
 import logging
+import time
 from typing import Any, Optional
 
+from pydantic import ValidationError
+
 from ..config import get_config
 from ..core.cache import CacheManager
 from ..core.cc_client import CDXClient
 from ..core.s3_manager import S3Manager
+from ..models.internal import IndexEntry
 from ..models.schemas import CrawlInfo, CrawlStats, DomainStats, IndexRecord
 
 logger = logging.getLogger(__name__)
@@ -23,6 +27,30 @@ _cache: Optional[CacheManager] = None
 _cdx_client: Optional[CDXClient] = None
 _s3_manager: Optional[S3Manager] = None
 
+# Crawl listing and its {crawl ID: crawl} lookup table, as
+# (expiry, listing, by_id). Kept for the same 24h as the cached listing and
+# dropped when the listing is force-refreshed.
+_CRAWL_INDEX_TTL_SECONDS = 24 * 3600
+_crawl_index: Optional[tuple[float, dict[str, Any], dict[str, dict[str, Any]]]] = None
+
+
+def _index_records(entries: list[IndexEntry]) -> list[dict[str, Any]]:
+    """Validate index rows for a tool response, skipping malformed ones.
+
+    Args:
+        entries: Index rows from the CDX client
+
+    Returns:
+        List of ``IndexRecord`` dicts
+    """
+    records = []
+    for entry in entries:
+        try:
+            records.append(IndexRecord.from_internal(entry).model_dump())
+        except ValidationError as e:
+            logger.warning(f"Skipping malformed CDX record for {entry.url}: {e}")
+    return records
+
 
 def _get_cache() -> CacheManager:
     """Get cache manager instance."""
@@ -55,9 +83,12 @@ def _get_s3_manager() -> S3Manager:
 
 
 # Tool 2.1: List Crawls
-async def list_crawls() -> dict[str, Any]:
+async def list_crawls(force_refresh: bool = False) -> dict[str, Any]:
     """List all available Common Crawl datasets.
 
+    Args:
+        force_refresh: Bypass cached results and re-fetch from the CDX server
+
     Returns:
         Dictionary with list of crawls and metadata.
 
@@ -65,18 +96,24 @@ async def list_crawls() -> dict[str, Any]:
         >>> result = await list_crawls()
         >>> print(f"Found {len(result['crawls'])} crawls")
     """
+    global _crawl_index
+
     try:
         cache = _get_cache()
         cache_key = "crawls:list"
+        cdx = _get_cdx_client()
 
-        # Check cache (24h TTL)
-        cached = await cache.get(cache_key)
-        if cached:
-            logger.info("Returning cached crawl list")
-            return cached
+        if force_refresh:
+            cdx.invalidate_crawls()
+            _crawl_index = None
+        else:
+            # Check cache (24h TTL)
+            cached = await cache.get(cache_key)
+            if cached:
+                logger.info("Returning cached crawl list")
+                return cached
 
         # Fetch from CDX
-        cdx = _get_cdx_client()
         crawls = await cdx.list_crawls()
 
         # Format response
@@ -107,6 +144,33 @@ async def list_crawls() -> dict[str, Any]:
         }
 
 
+async def crawl_index() -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Get the crawl listing together with a lookup table by crawl ID.
+
+    Both are built once and shared by every caller until they expire or the
+    listing is force-refreshed, so they must not be modified. Failed
+    listings are not kept.
+
+    Returns:
+        Tuple of (``list_crawls`` result, crawl ID -> crawl dict)
+
+    Example:
+        >>> listing, by_id = await crawl_index()
+        >>> print(by_id["CC-MAIN-2024-10"]["name"])
+    """
+    global _crawl_index
+
+    now = time.monotonic()
+    if _crawl_index is not None and _crawl_index[0] > now:
+        return _crawl_index[1], _crawl_index[2]
+
+    listing = await list_crawls()
+    by_id = {crawl["id"]: crawl for crawl in listing.get("crawls", [])}
+    if "error" not in listing:
+        _crawl_index = (now + _CRAWL_INDEX_TTL_SECONDS, listing, by_id)
+    return listing, by_id
+
+
 # Tool 2.2: Get Crawl Stats
 async def get_crawl_stats(crawl_id: str) -> dict[str, Any]:
     """Get detailed statistics for a specific crawl.
@@ -221,24 +285,13 @@ async def search_index(
         )
 
         # Format response
+        records = _index_records(results)
         result = {
             "query": query,
             "crawl_id": crawl_id,
             "match_type": match_type,
-            "count": len(results),
-            "results": [
-                {
-                    "url": record.url,
-                    "timestamp": record.timestamp,
-                    "status_code": record.status_code,
-                    "mime_type": record.mime_type,
-                    "length": record.length,
-                    "digest": record.digest,
-                    "filename": record.filename,
-                    "offset": record.offset,
-                }
-                for record in results
-            ],
+            "count": len(records),
+            "results": records,
         }
 
         # Cache for 1 hour
@@ -4,6 +4,7 @@ This module provides tools for exporting query results to various formats
 and managing datasets.
 """
 
+import asyncio
 import csv
 import io
 import json
@@ -16,19 +17,30 @@ from pathlib import Path
 from typing import Any, Callable, Optional
 
 import httpx
-import jsonlines
 from jinja2 import Template
 from pydantic import BaseModel, Field
-from warcio.warcwriter import WARCWriter
+
+from ..config import get_config
+from ..utils.json_encoding import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
+# File exports are written in batches of this many records through a
+# buffer of this many bytes, so large exports make few write() calls.
+EXPORT_BATCH_SIZE = 4096
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Downloaded WARC records held in memory while waiting for the writer
+WARC_EXPORT_QUEUE_SIZE = 64
+
 
 # Database configuration
 DB_PATH = Path("./data/commoncrawl.db")
 
 # Database schema
 SCHEMA_SQL = """
+BEGIN IMMEDIATE;
+
 CREATE TABLE IF NOT EXISTS datasets (
     id TEXT PRIMARY KEY,
     name TEXT UNIQUE NOT NULL,
@@ -48,13 +60,15 @@ CREATE TABLE IF NOT EXISTS dataset_records (
 
 CREATE TABLE IF NOT EXISTS investigation_sessions (
     id TEXT PRIMARY KEY,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
     state JSON NOT NULL
 );
 
 CREATE INDEX IF NOT EXISTS idx_dataset_records_dataset_id ON dataset_records(dataset_id);
 CREATE INDEX IF NOT EXISTS idx_investigation_sessions_created_at ON investigation_sessions(created_at DESC);
+
+COMMIT;
 """
 
 
@@ -164,21 +178,23 @@ async def export_to_csv(
     output_path_obj = Path(output_path)
     output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path_obj.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
+    with output_path_obj.open("w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fields or [])
 
-        for i, record in enumerate(data):
-            try:
-                flattened = _flatten_dict(record)
-                # Fill in missing fields with empty strings
-                row = {field: flattened.get(field, "") for field in fields}
-                writer.writerow(row)
+        for start in range(0, len(data), EXPORT_BATCH_SIZE):
+            rows = []
+            for i, record in enumerate(data[start : start + EXPORT_BATCH_SIZE], start):
+                try:
+                    flattened = _flatten_dict(record)
+                    # Fill in missing fields with empty strings
+                    rows.append([flattened.get(field, "") for field in fields])
+                except Exception as e:
+                    errors.append(f"Row {i}: {str(e)}")
+            writer.writerows(rows)
 
-                if progress_callback and (i + 1) % 100 == 0:
-                    progress_callback(i + 1, len(data))
-            except Exception as e:
-                errors.append(f"Row {i}: {str(e)}")
+            if progress_callback:
+                progress_callback(min(start + EXPORT_BATCH_SIZE, len(data)), len(data))
 
     file_size = output_path_obj.stat().st_size
     duration = time.time() - start_time
@@ -226,15 +242,24 @@ async def export_to_jsonl(
     output_path_obj = Path(output_path)
     output_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-    with jsonlines.open(output_path_obj, mode="w") as writer:
-        for i, record in enumerate(data):
+    with output_path_obj.open("wb", buffering=EXPORT_BUFFER_SIZE) as f:
+        for start in range(0, len(data), EXPORT_BATCH_SIZE):
+            batch = data[start : start + EXPORT_BATCH_SIZE]
             try:
-                writer.write(record)
-
-                if progress_callback and (i + 1) % 100 == 0:
-                    progress_callback(i + 1, len(data))
-            except Exception as e:
-                errors.append(f"Record {i}: {str(e)}")
+                lines = [dumps_bytes(record) for record in batch]
+            except Exception:
+                # Fall back to one record at a time to report which ones failed
+                lines = []
+                for i, record in enumerate(batch, start):
+                    try:
+                        lines.append(dumps_bytes(record))
+                    except Exception as e:
+                        errors.append(f"Record {i}: {str(e)}")
+            if lines:
+                f.write(b"\n".join(lines) + b"\n")
+
+            if progress_callback:
+                progress_callback(min(start + EXPORT_BATCH_SIZE, len(data)), len(data))
 
     file_size = output_path_obj.stat().st_size
     duration = time.time() - start_time
@@ -256,10 +281,21 @@ def _init_database() -> None:
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     cursor.executescript(SCHEMA_SQL)
-    conn.commit()
     conn.close()
 
 
+# DB_PATH the schema was last initialized for in this process
+_initialized_path: Optional[Path] = None
+
+
+def _ensure_database() -> None:
+    """Initialize the database schema once per process instead of on every call."""
+    global _initialized_path
+    if _initialized_path != DB_PATH:
+        _init_database()
+        _initialized_path = DB_PATH
+
+
 # Dataset management functions
 async def create_dataset(
     name: str,
@@ -283,7 +319,7 @@ async def create_dataset(
         sqlite3.IntegrityError: If dataset name already exists
     """
     # Initialize database
-    _init_database()
+    _ensure_database()
 
     # Generate IDs and timestamp
     dataset_id = str(uuid.uuid4())
@@ -351,7 +387,7 @@ async def get_dataset(name: str) -> Optional[Dataset]:
         Dataset if found, None otherwise
     """
     # Initialize database
-    _init_database()
+    _ensure_database()
 
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
@@ -376,24 +412,32 @@ async def get_dataset(name: str) -> Optional[Dataset]:
     )
 
 
-async def get_dataset_records(dataset_id: str) -> list[dict[str, Any]]:
-    """Retrieve all records from a dataset.
+async def get_dataset_records(
+    dataset_id: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> list[dict[str, Any]]:
+    """Retrieve records from a dataset.
 
     Args:
         dataset_id: UUID of the dataset
+        limit: Maximum number of records to return (None for all)
+        offset: Number of records to skip
 
     Returns:
         List of record data dictionaries
     """
     # Initialize database
-    _init_database()
+    _ensure_database()
 
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
 
     rows = cursor.execute(
-        "SELECT data FROM dataset_records WHERE dataset_id = ? ORDER BY created_at",
-        (dataset_id,),
+        """SELECT data FROM dataset_records WHERE dataset_id = ?
+           ORDER BY created_at LIMIT ? OFFSET ?""",
+        # A negative LIMIT means no limit in SQLite
+        (dataset_id, -1 if limit is None else limit, offset),
     ).fetchall()
 
     conn.close()
@@ -408,7 +452,7 @@ async def get_all_datasets() -> list[Dataset]:
         List of all datasets ordered by creation date (newest first)
     """
     # Initialize database
-    _init_database()
+    _ensure_database()
 
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
@@ -443,7 +487,7 @@ async def get_dataset_by_id(dataset_id: str) -> Optional[Dataset]:
         Dataset if found, None otherwise
     """
     # Initialize database
-    _init_database()
+    _ensure_database()
 
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
@@ -480,7 +524,9 @@ async def export_warc_subset(
 
     This function queries the CDX API to locate WARC files for the given URLs,
     then downloads the relevant WARC records and combines them into a single
-    output WARC file.
+    output WARC file. Up to ``rate_limit.max_concurrent_requests`` URLs are
+    fetched at once while a single writer appends finished records, so
+    records appear in the order their downloads complete.
 
     Args:
         urls: List of URLs to export
@@ -500,6 +546,7 @@ async def export_warc_subset(
     start_time = time.time()
     errors = []
     records_written = 0
+    processed = 0
 
     # Ensure output directory exists
     output_path_obj = Path(output_path)
@@ -511,76 +558,105 @@ async def export_warc_subset(
     # Create HTTP client for downloading WARC records
     http_client = httpx.AsyncClient(timeout=60.0)
 
-    try:
-        # Open output WARC file
-        with output_path_obj.open("wb") as output_file:
-            writer = WARCWriter(output_file, gzip=True)
+    # Downloaded records waiting to be written; a full queue makes the
+    # fetchers wait for the writer so memory use stays bounded
+    queue: asyncio.Queue[Optional[tuple[str, bytes]]] = asyncio.Queue(
+        maxsize=WARC_EXPORT_QUEUE_SIZE
+    )
+    pending_urls = iter(enumerate(urls))
 
-            # Process each URL
-            for i, url in enumerate(urls):
-                try:
-                    logger.info(f"Processing URL {i+1}/{len(urls)}: {url}")
-
-                    # Query CDX for this URL
-                    index_records = await cdx_client.search_index(
-                        query=url,
-                        crawl_id=crawl_id,
-                        limit=1,
-                        match_type="exact",
-                    )
-
-                    if not index_records:
-                        error_msg = f"URL not found in index: {url}"
-                        logger.warning(error_msg)
-                        errors.append(error_msg)
-                        if progress_callback:
-                            progress_callback(i + 1, len(urls))
-                        continue
-
-                    # Get the first (most recent) record
-                    record = index_records[0]
-
-                    # Construct WARC download URL
-                    # Common Crawl provides HTTP access to WARC files
-                    warc_url = f"https://data.commoncrawl.org/{record.filename}"
-
-                    # Download the specific WARC record using byte range
-                    # The CDX index provides offset and length
-                    headers = {
-                        "Range": f"bytes={record.offset}-{record.offset + record.length - 1}"
-                    }
-
-                    logger.debug(
-                        f"Downloading WARC record from {warc_url} "
-                        f"(offset={record.offset}, length={record.length})"
-                    )
-
-                    response = await http_client.get(warc_url, headers=headers)
-                    response.raise_for_status()
-
-                    warc_data = response.content
-
-                    # Write the WARC record directly to output
-                    # The downloaded data is already in WARC format
-                    output_file.write(warc_data)
-                    records_written += 1
-
-                    logger.info(
-                        f"Successfully exported WARC record for {url} " f"({len(warc_data)} bytes)"
-                    )
-
-                except httpx.HTTPError as e:
-                    error_msg = f"HTTP error downloading {url}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                except Exception as e:
-                    error_msg = f"Error processing {url}: {str(e)}"
-                    logger.error(error_msg)
+    def url_done():
+        nonlocal processed
+        processed += 1
+        if progress_callback:
+            progress_callback(processed, len(urls))
+
+    async def fetch_records():
+        for i, url in pending_urls:
+            try:
+                logger.info(f"Processing URL {i+1}/{len(urls)}: {url}")
+
+                # Query CDX for this URL
+                index_records = await cdx_client.search_index(
+                    query=url,
+                    crawl_id=crawl_id,
+                    limit=1,
+                    match_type="exact",
+                )
+
+                if not index_records:
+                    error_msg = f"URL not found in index: {url}"
+                    logger.warning(error_msg)
                     errors.append(error_msg)
+                    url_done()
+                    continue
+
+                # Get the first (most recent) record
+                record = index_records[0]
+
+                # Construct WARC download URL
+                # Common Crawl provides HTTP access to WARC files
+                warc_url = f"https://data.commoncrawl.org/{record.filename}"
+
+                # Download the specific WARC record using byte range
+                # The CDX index provides offset and length
+                headers = {"Range": f"bytes={record.offset}-{record.offset + record.length - 1}"}
+
+                logger.debug(
+                    f"Downloading WARC record from {warc_url} "
+                    f"(offset={record.offset}, length={record.length})"
+                )
 
-                # Call progress callback
-                if progress_callback:
-                    progress_callback(i + 1, len(urls))
+                response = await http_client.get(warc_url, headers=headers)
+                response.raise_for_status()
+
+                await queue.put((url, response.content))
+
+            except httpx.HTTPError as e:
+                error_msg = f"HTTP error downloading {url}: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+                url_done()
+            except Exception as e:
+                error_msg = f"Error processing {url}: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+                url_done()
+
+    async def write_records(output_file):
+        nonlocal records_written
+        while (item := await queue.get()) is not None:
+            url, warc_data = item
+            try:
+                # Write the WARC record directly to output
+                # The downloaded data is already in WARC format
+                output_file.write(warc_data)
+                records_written += 1
+
+                logger.info(
+                    f"Successfully exported WARC record for {url} " f"({len(warc_data)} bytes)"
+                )
+            except Exception as e:
+                error_msg = f"Error processing {url}: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+            url_done()
+
+    try:
+        # Open output WARC file
+        with output_path_obj.open("wb", buffering=EXPORT_BUFFER_SIZE) as output_file:
+            writer_task = asyncio.create_task(write_records(output_file))
+            fetchers = [
+                asyncio.create_task(fetch_records())
+                for _ in range(min(get_config().rate_limit.max_concurrent_requests, len(urls)))
+            ]
+            try:
+                await asyncio.gather(*fetchers)
+                await queue.put(None)
+                await writer_task
+            finally:
+                for task in (*fetchers, writer_task):
+                    task.cancel()
 
     finally:
         await http_client.aclose()
@@ -117,23 +117,14 @@ async def fetch_page_content(
 
         record = results[0]
 
-        # Step 2: Download WARC file from S3
+        # Step 2: Download only this record from S3
+        # WARC files can be 1GB+, so we use a range request for the record
         s3 = _get_s3_manager()
-        warc_path = record.filename
-
-        # Download only the relevant segment using byte range
-        # WARC files can be 1GB+, so we use range requests
-        start_offset = record.offset
-        end_offset = start_offset + record.length
-
-        logger.info(f"Downloading WARC segment: {warc_path} bytes {start_offset}-{end_offset}")
-
-        # For now, download the full file (TODO: implement range requests)
-        warc_content = await s3.download_and_decompress(warc_path)
+        record_bytes = await s3.get_record_bytes(record.filename, record.offset, record.length)
 
         # Step 3: Parse WARC to extract HTTP response
         parser = _get_warc_parser()
-        warc_record = parser.find_record_by_url(warc_content, url)
+        warc_record = await asyncio.to_thread(parser.parse_record_at, record_bytes)
 
         if not warc_record:
             return {
@@ -158,7 +149,7 @@ async def fetch_page_content(
             "crawl_id": crawl_id,
             "status_code": http_response["status_code"],
             "headers": http_response["headers"],
-            "html": http_response["body"],
+            "html": http_response["body"].decode("utf-8", errors="replace"),
             "mime_type": record.mime_type,
             "timestamp": record.timestamp,
             "length": record.length,
@@ -202,7 +193,14 @@ async def batch_fetch_pages(
     try:
         semaphore = asyncio.Semaphore(max_concurrent)
 
+        # Look up all already-cached pages in one batch
+        cache_keys = {f"page:{url}:{crawl_id}": url for url in urls}
+        cached = await _get_cache().get_many(list(cache_keys))
+        cached_pages = {cache_keys[key]: page for key, page in cached.items() if page}
+
         async def fetch_with_semaphore(url: str) -> tuple[str, dict]:
+            if url in cached_pages:
+                return url, cached_pages[url]
             async with semaphore:
                 result = await fetch_page_content(url, crawl_id)
                 return url, result
@@ -290,11 +288,13 @@ async def fetch_warc_records(
 
                 index_record = index_results[0]
 
-                # Download WARC
-                warc_content = await s3.download_and_decompress(index_record.filename)
+                # Download only this record
+                record_bytes = await s3.get_record_bytes(
+                    index_record.filename, index_record.offset, index_record.length
+                )
 
                 # Parse WARC
-                warc_record = parser.find_record_by_url(warc_content, url)
+                warc_record = await asyncio.to_thread(parser.parse_record_at, record_bytes)
 
                 if not warc_record:
                     records.append(
@@ -4,9 +4,13 @@ This module provides tools for parsing HTML, analyzing technologies, extracting
 structured data, and performing SEO analysis on archived web pages.
 """
 
+import asyncio
 import json
 import logging
 import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any, Optional
 from urllib.parse import urljoin, urlparse
 
@@ -15,7 +19,8 @@ from bs4 import BeautifulSoup
 from ..core.cache import CacheManager
 from ..models.schemas import (LanguageInfo, LinkAnalysis, PageContent,
                               ParsedHtml, SeoAnalysis, SeoIssue,
-                              StructuredData, Technology, TechStack)
+                              StructuredData, Technology, TechStack,
+                              cdx_timestamp_to_epoch, construct_trusted)
 from ..utils.html_parser import (extract_clean_text, extract_headings,
                                  extract_links, extract_meta_tags, parse_html)
 from ..utils.technology_detector import TechnologyDetector
@@ -38,15 +43,87 @@ def _get_cache() -> CacheManager:
     return _cache
 
 
+@dataclass(slots=True)
+class _PageContext:
+    """A fetched page plus its parsed tree, shared by the tools analyzing it."""
+
+    page: PageContent
+    expires: float
+    _soup: Optional[BeautifulSoup] = field(default=None, repr=False)
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Parsed HTML, built on first use. Shared, so it must not be modified."""
+        if self._soup is None:
+            self._soup = parse_html(self.page.html or "")
+        return self._soup
+
+
+# Recently fetched pages by (url, crawl_id). Composed tools (e.g. the
+# signals gathered by the advanced tools) analyze the same page one after
+# another or at the same time; they share one fetch and one parse.
+_PAGE_CONTEXT_TTL_SECONDS = 60
+_PAGE_CONTEXT_MAX_ENTRIES = 16
+_page_contexts: OrderedDict[tuple[str, str], _PageContext] = OrderedDict()
+
+# In-flight page fetches by (url, crawl_id), joined by concurrent callers
+# instead of each missing the page cache and downloading the page
+_pending_fetches: dict[tuple[str, str], "asyncio.Future[_PageContext]"] = {}
+
+
+async def _fetch_page_context(url: str, crawl_id: str) -> _PageContext:
+    """Get a recently fetched page, or fetch it (joining an identical fetch in flight)."""
+    key = (url, crawl_id)
+    now = time.monotonic()
+
+    context = _page_contexts.get(key)
+    if context is not None and context.expires > now:
+        return context
+
+    pending = _pending_fetches.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(_load_page_context(key))
+        _pending_fetches[key] = pending
+        pending.add_done_callback(lambda _: _pending_fetches.pop(key, None))
+
+    # Shielded so that one cancelled caller does not cancel the others' fetch
+    return await asyncio.shield(pending)
+
+
+async def _load_page_context(key: tuple[str, str]) -> _PageContext:
+    """Fetch a page and remember it, dropping expired and least recent entries.
+
+    Failed fetches are returned to the callers waiting on them but not
+    remembered, so the next request retries instead of reusing the error.
+    """
+    page_dict = await fetch_page_dict(*key)
+    now = time.monotonic()
+    context = _PageContext(
+        page=_to_page_content(*key, page_dict), expires=now + _PAGE_CONTEXT_TTL_SECONDS
+    )
+    if "error" in page_dict:
+        return context
+
+    _page_contexts.pop(key, None)
+    _page_contexts[key] = context
+    while _page_contexts and (
+        len(_page_contexts) > _PAGE_CONTEXT_MAX_ENTRIES
+        or next(iter(_page_contexts.values())).expires <= now
+    ):
+        _page_contexts.popitem(last=False)
+    return context
+
+
 async def _fetch_page(url: str, crawl_id: str) -> PageContent:
-    """Fetch page and convert dict to PageContent model."""
-    page_dict = await fetch_page_dict(url, crawl_id)
+    """Fetch page as a PageContent model."""
+    return (await _fetch_page_context(url, crawl_id)).page
+
 
+def _to_page_content(url: str, crawl_id: str, page_dict: dict[str, Any]) -> PageContent:
+    """Convert a fetched page dict to a PageContent model."""
     # Handle error case
     if "error" in page_dict:
         # Return empty PageContent
-        from datetime import datetime, timezone
-
         return PageContent(
             url=url,
             crawl_id=crawl_id,
@@ -56,11 +133,28 @@ async def _fetch_page(url: str, crawl_id: str) -> PageContent:
             headers={},
             mime_type="text/html",
             length=0,
-            timestamp=datetime.now(timezone.utc),
+            timestamp_epoch=int(time.time()),
         )
 
-    # Convert dict to PageContent
-    return PageContent(**page_dict)
+    # Convert dict to PageContent; the CDX timestamp is converted once here
+    fields = {key: value for key, value in page_dict.items() if key != "timestamp"}
+    return PageContent(**fields, timestamp_epoch=cdx_timestamp_to_epoch(page_dict["timestamp"]))
+
+
+def _collect_schema_types(data: Any, types: set[str]) -> None:
+    """Add every ``@type`` in a JSON-LD document (including nested items) to ``types``."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == "@type":
+                for type_name in value if isinstance(value, list) else [value]:
+                    if isinstance(type_name, str):
+                        # "https://schema.org/Article" -> "Article"
+                        types.add(type_name.rsplit("/", 1)[-1])
+            else:
+                _collect_schema_types(value, types)
+    elif isinstance(data, list):
+        for item in data:
+            _collect_schema_types(item, types)
 
 
 async def parse_html_content(url: str, crawl_id: str = "CC-MAIN-2024-10") -> ParsedHtml:
@@ -87,13 +181,14 @@ async def parse_html_content(url: str, crawl_id: str = "CC-MAIN-2024-10") -> Par
         return ParsedHtml(**cached)
 
     # Fetch page content
-    page = await _fetch_page(url, crawl_id)
+    context = await _fetch_page_context(url, crawl_id)
+    page = context.page
 
     if not page.html:
         logger.warning(f"No HTML content for {url}")
         return ParsedHtml(url=url)
 
-    soup = parse_html(page.html)
+    soup = context.soup
 
     # Extract title
     title = None
@@ -102,15 +197,24 @@ async def parse_html_content(url: str, crawl_id: str = "CC-MAIN-2024-10") -> Par
         title = title_tag.get_text(strip=True)
 
     # Extract meta tags
-    meta_tags = extract_meta_tags(page.html)
+    meta_tags = extract_meta_tags(soup)
 
     # Extract headings
-    headings = extract_headings(page.html)
+    headings = extract_headings(soup)
 
     # Extract links
-    link_list = extract_links(page.html, base_url=url)
+    link_list = extract_links(soup, base_url=url)
     links = [link["href"] for link in link_list if link.get("href")]
 
+    # Count links to other hosts while the links are at hand (relative links
+    # were resolved against the page URL above)
+    page_host = urlparse(url).netloc
+    external_link_count = 0
+    for href in links:
+        host = urlparse(href).netloc
+        if host and host != page_host:
+            external_link_count += 1
+
     # Extract scripts
     scripts = []
     for script in soup.find_all("script", src=True):
@@ -142,12 +246,14 @@ async def parse_html_content(url: str, crawl_id: str = "CC-MAIN-2024-10") -> Par
     # Extract clean text
     text_content = extract_clean_text(page.html, preserve_paragraphs=False)
 
-    result = ParsedHtml(
+    result = construct_trusted(
+        ParsedHtml,
         url=url,
         title=title,
         meta_tags=meta_tags,
         headings=headings,
         links=links,
+        external_link_count=external_link_count,
         scripts=scripts,
         styles=styles,
         images=images,
@@ -182,13 +288,13 @@ async def extract_links_analysis(url: str, crawl_id: str = "CC-MAIN-2024-10") ->
         return LinkAnalysis(**cached)
 
     # Fetch page
-    page = await _fetch_page(url, crawl_id)
+    context = await _fetch_page_context(url, crawl_id)
 
-    if not page.html:
+    if not context.page.html:
         return LinkAnalysis(url=url)
 
     # Extract links with metadata
-    links = extract_links(page.html, base_url=url)
+    links = extract_links(context.soup, base_url=url)
 
     # Parse base domain
     parsed_url = urlparse(url)
@@ -218,7 +324,8 @@ async def extract_links_analysis(url: str, crawl_id: str = "CC-MAIN-2024-10") ->
             logger.debug(f"Failed to parse link {href}: {e}")
             broken_links.append(href)
 
-    result = LinkAnalysis(
+    result = construct_trusted(
+        LinkAnalysis,
         url=url,
         internal_links=list(set(internal_links)),  # Deduplicate
         external_links=list(set(external_links)),
@@ -309,19 +416,21 @@ async def extract_structured_data_from_page(
         return StructuredData(**cached)
 
     # Fetch page
-    page = await _fetch_page(url, crawl_id)
+    context = await _fetch_page_context(url, crawl_id)
 
-    if not page.html:
+    if not context.page.html:
         return StructuredData(url=url)
 
-    soup = parse_html(page.html)
+    soup = context.soup
 
-    # Extract JSON-LD
+    # Extract JSON-LD, collecting the schema.org types it declares
     json_ld = []
+    schema_types: set[str] = set()
     for script in soup.find_all("script", type="application/ld+json"):
         try:
             data = json.loads(script.string)
             json_ld.append(data)
+            _collect_schema_types(data, schema_types)
         except (json.JSONDecodeError, TypeError) as e:
             logger.debug(f"Failed to parse JSON-LD: {e}")
 
@@ -345,9 +454,11 @@ async def extract_structured_data_from_page(
     # For now, return empty list
     microdata = []
 
-    result = StructuredData(
+    result = construct_trusted(
+        StructuredData,
         url=url,
         json_ld=json_ld,
+        schema_types=sorted(schema_types),
         microdata=microdata,
         open_graph=open_graph,
         twitter_card=twitter_card,
@@ -578,12 +689,13 @@ async def detect_language(url: str, crawl_id: str = "CC-MAIN-2024-10") -> Langua
         return LanguageInfo(**cached)
 
     # Fetch page
-    page = await _fetch_page(url, crawl_id)
+    context = await _fetch_page_context(url, crawl_id)
+    page = context.page
 
     if not page.html:
         return LanguageInfo(url=url, detected_language="unknown", confidence=0.0)
 
-    soup = parse_html(page.html)
+    soup = context.soup
 
     # Check HTML lang attribute (most reliable)
     html_lang = None
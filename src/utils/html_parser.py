@@ -6,7 +6,7 @@ including clean text extraction, table parsing, and common selector operations.
 
 import logging
 import re
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from bs4 import BeautifulSoup, Comment
 
@@ -218,11 +218,16 @@ def sanitize_html(html: str, allowed_tags: Optional[list[str]] = None) -> str:
         return ""
 
 
-def extract_meta_tags(html: str) -> dict[str, str]:
+def _as_soup(html: Union[str, BeautifulSoup]) -> BeautifulSoup:
+    """Parse HTML unless it is already a parsed tree."""
+    return html if isinstance(html, BeautifulSoup) else parse_html(html)
+
+
+def extract_meta_tags(html: Union[str, BeautifulSoup]) -> dict[str, str]:
     """Extract all meta tags from HTML.
 
     Args:
-        html: HTML content
+        html: HTML content, or an already parsed tree (which is not modified)
 
     Returns:
         Dictionary of meta tag name/property to content
@@ -232,7 +237,7 @@ def extract_meta_tags(html: str) -> dict[str, str]:
         >>> extract_meta_tags(html)
         {'description': 'A great page'}
     """
-    soup = parse_html(html)
+    soup = _as_soup(html)
     meta_tags = {}
 
     for meta in soup.find_all("meta"):
@@ -246,11 +251,11 @@ def extract_meta_tags(html: str) -> dict[str, str]:
     return meta_tags
 
 
-def extract_headings(html: str) -> dict[str, list[str]]:
+def extract_headings(html: Union[str, BeautifulSoup]) -> dict[str, list[str]]:
     """Extract all heading tags (h1-h6) from HTML.
 
     Args:
-        html: HTML content
+        html: HTML content, or an already parsed tree (which is not modified)
 
     Returns:
         Dictionary mapping heading level to list of heading texts
@@ -260,7 +265,7 @@ def extract_headings(html: str) -> dict[str, list[str]]:
         >>> extract_headings(html)
         {'h1': ['Title'], 'h2': ['Section']}
     """
-    soup = parse_html(html)
+    soup = _as_soup(html)
     headings = {f"h{i}": [] for i in range(1, 7)}
 
     for level in range(1, 7):
@@ -272,11 +277,13 @@ def extract_headings(html: str) -> dict[str, list[str]]:
     return headings
 
 
-def extract_links(html: str, base_url: Optional[str] = None) -> list[dict[str, str]]:
+def extract_links(
+    html: Union[str, BeautifulSoup], base_url: Optional[str] = None
+) -> list[dict[str, str]]:
     """Extract all links from HTML.
 
     Args:
-        html: HTML content
+        html: HTML content, or an already parsed tree (which is not modified)
         base_url: Base URL for resolving relative links
 
     Returns:
@@ -287,7 +294,7 @@ def extract_links(html: str, base_url: Optional[str] = None) -> list[dict[str, s
         >>> extract_links(html)
         [{'href': '/page', 'text': 'Click', 'title': 'Go'}]
     """
-    soup = parse_html(html)
+    soup = _as_soup(html)
     links = []
 
     for a_tag in soup.find_all("a", href=True):
@@ -0,0 +1,46 @@
+"""JSON encoding for MCP resource payloads."""
+
+from typing import Any
+
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def dumps(data: Any, indent: bool = False) -> str:
+    """Encode data as JSON text.
+
+    Uses orjson when installed and pydantic-core's encoder otherwise. The
+    result parses to the same value as ``json.dumps`` output but is not
+    byte-identical: non-ASCII characters are written as UTF-8 instead of
+    ``\\uXXXX`` escapes, and compact output has no spaces after ``,`` and
+    ``:``. Indented output uses the same two-space layout as
+    ``json.dumps(data, indent=2)``.
+
+    Args:
+        data: JSON-compatible data to encode
+        indent: Whether to indent with two spaces
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    return to_json(data, indent=2 if indent else None).decode()
+
+
+def dumps_bytes(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-compatible data to encode
+
+    Returns:
+        JSON bytes without a trailing newline
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return to_json(data)
@@ -0,0 +1,113 @@
+"""Integration tests for advanced analysis tools (Phase 9)."""
+
+import time
+
+import pytest
+
+from src.models.schemas import (
+    LanguageInfo,
+    PageContent,
+    ParsedHtml,
+    SeoAnalysis,
+    StructuredData,
+    Technology,
+    TechStack,
+)
+from src.tools import parsing
+from src.tools.advanced import content_classification, spam_detection
+
+
+def stub_signal(monkeypatch, name: str, result):
+    """Replace a parsing tool with a coroutine returning ``result``."""
+
+    async def signal(url: str, crawl_id: str = "CC-MAIN-2024-10"):
+        return result
+
+    monkeypatch.setattr(parsing, name, signal)
+
+
+@pytest.mark.asyncio
+async def test_content_classification_uses_signals(monkeypatch):
+    """Test classification combines schema.org, heading and language signals."""
+    url = "https://example.com/blog/first-post"
+
+    stub_signal(
+        monkeypatch,
+        "analyze_seo_metrics",
+        SeoAnalysis(url=url, score=85.0, heading_structure={"h1": 1, "h2": 3}),
+    )
+    stub_signal(
+        monkeypatch,
+        "detect_language",
+        LanguageInfo(url=url, detected_language="en", confidence=0.9),
+    )
+    stub_signal(
+        monkeypatch,
+        "extract_structured_data_from_page",
+        StructuredData(url=url, schema_types=["BlogPosting", "Person"]),
+    )
+
+    result = await content_classification(url)
+
+    assert "error" not in result.signals
+    assert result.page_type == "blog"
+    assert result.confidence == 0.9
+    assert result.signals == {
+        "url_pattern": "blog",
+        "schema_org": "blog",
+        "heading_structure": "well_structured",
+    }
+    assert result.language == "en"
+    assert result.content_quality_score == 85.0
+
+
+@pytest.mark.asyncio
+async def test_spam_detection_uses_signals(monkeypatch):
+    """Test spam scoring reads the parsed page, technologies and response headers."""
+    url = "https://example.com/offer"
+
+    stub_signal(
+        monkeypatch,
+        "parse_html_content",
+        ParsedHtml(
+            url=url,
+            title="Buy",
+            external_link_count=80,
+            text_content=" ".join(["cheap"] * 150 + ["pills"] * 50),
+        ),
+    )
+    stub_signal(
+        monkeypatch,
+        "analyze_technologies",
+        TechStack(
+            url=url, technologies=[Technology(name="nginx", category="Server", confidence=0.9)]
+        ),
+    )
+    stub_signal(
+        monkeypatch,
+        "_fetch_page",
+        PageContent(
+            url=url,
+            crawl_id="CC-MAIN-2024-10",
+            html="<html></html>",
+            status_code=200,
+            headers={"Content-Type": "text/html"},
+            mime_type="text/html",
+            length=13,
+            timestamp_epoch=int(time.time()),
+        ),
+    )
+
+    result = await spam_detection(url)
+
+    assert result.spam_signals == [
+        "missing_security_headers",
+        "poor_title",
+        "missing_meta_description",
+        "excessive_external_links",
+        "keyword_stuffing",
+    ]
+    assert result.quality_signals == ["uses_known_technologies"]
+    # 20 + 15 + 10 + 20 + 25 - 10
+    assert result.spam_score == 80
+    assert result.recommendation == "likely_spam"
@@ -4,15 +4,43 @@ This module tests the integration between CDX client, S3 manager,
 WARC parser, and caching system.
 """
 
+import asyncio
+import gzip
+import io
+from datetime import datetime, timezone
 from pathlib import Path
 
+import httpx
 import pytest
+from pydantic import ValidationError
 
-from src.config import get_config
-from src.core.cache import CacheManager
-from src.core.cc_client import CDXClient
+from src.config import Config, get_config
+from src.core.cache import CacheManager, _hash_key
+from src.core.cc_client import CDXClient, TokenBucket, _parse_cdx_line
 from src.core.s3_manager import S3Manager
 from src.core.warc_parser import WarcParser
+from src.models.schemas import CrawlInfo, IndexRecord, cdx_timestamp_to_epoch
+
+
+def build_warc(count: int, compress: bool = True) -> bytes:
+    """Build a WARC file with ``count`` response records."""
+    from warcio.statusandheaders import StatusAndHeaders
+    from warcio.warcwriter import WARCWriter
+
+    buffer = io.BytesIO()
+    writer = WARCWriter(buffer, gzip=compress)
+    for i in range(count):
+        http_headers = StatusAndHeaders(
+            "200 OK", [("Content-Type", "text/html")], protocol="HTTP/1.1"
+        )
+        record = writer.create_warc_record(
+            f"https://example.com/{i}",
+            "response",
+            payload=io.BytesIO(f"<html>{i}</html>".encode()),
+            http_headers=http_headers,
+        )
+        writer.write_record(record)
+    return buffer.getvalue()
 
 
 @pytest.fixture
@@ -71,6 +99,19 @@ class TestConfiguration:
         # Should not have critical errors
         assert isinstance(warnings, list)
 
+    def test_config_ignores_bare_section_variables(self, monkeypatch, tmp_path):
+        """Test env vars named after a section are not parsed as that section."""
+        monkeypatch.setenv("DATABASE", "prod")
+        monkeypatch.setenv("SERVER", "web01")
+        monkeypatch.setenv("CACHE", "/tmp")
+        monkeypatch.setenv("CACHE_DIR", str(tmp_path / "flat"))
+        monkeypatch.setenv("SERVER__SERVER_NAME", "nested-name")
+
+        loaded = Config()
+
+        assert loaded.cache.cache_dir == tmp_path / "flat"
+        assert loaded.server.server_name == "nested-name"
+
 
 class TestCacheManager:
     """Test cache manager functionality."""
@@ -94,6 +135,151 @@ class TestCacheManager:
         result = await cache_manager.get("nonexistent_key")
         assert result is None
 
+        # A miss must not create shard directories
+        hash_key = _hash_key("nonexistent_key")
+        assert not (cache_manager.cache_dir / hash_key[:2]).exists()
+
+    @pytest.mark.asyncio
+    async def test_cache_negative_hit(self, cache_manager):
+        """Test repeated misses are short-circuited until the key is set."""
+        assert await cache_manager.get("missing_key") is None
+        assert await cache_manager.get("missing_key") is None
+        assert cache_manager.get_stats()["negative_hits"] == 1
+
+        await cache_manager.set("missing_key", "now present")
+        assert await cache_manager.get("missing_key") == "now present"
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_hit(self, cache_manager):
+        """Test hot keys are served from the in-process LRU."""
+        await cache_manager.set("hot_key", {"data": "hot"})
+
+        # Remove the disk copy; the memory tier should still answer
+        cache_manager._disk_delete(_hash_key("hot_key"))
+
+        assert await cache_manager.get("hot_key") == {"data": "hot"}
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_returns_copies(self, cache_manager):
+        """Test changing a stored or returned value does not change the cached one."""
+        value = {"items": [1, 2]}
+        await cache_manager.set("mutable_key", value)
+        value["items"].append(3)
+
+        cached = await cache_manager.get("mutable_key")
+        cached["items"].append(4)
+
+        assert await cache_manager.get("mutable_key") == {"items": [1, 2]}
+        assert await cache_manager.get_many(["mutable_key"]) == {"mutable_key": {"items": [1, 2]}}
+
+    @pytest.mark.asyncio
+    async def test_cache_get_many(self, cache_manager):
+        """Test batched get/set across tiers."""
+        await cache_manager.set_many({"many_1": [1, 2], "many_2": "two"})
+
+        # Force one key to come from disk
+        cache_manager._mem.clear()
+        await cache_manager.get("many_2")
+
+        found = await cache_manager.get_many(["many_1", "many_2", "many_missing"])
+        assert found == {"many_1": [1, 2], "many_2": "two"}
+
+    @pytest.mark.asyncio
+    async def test_cache_codec_round_trip(self, cache_manager):
+        """Test values keep their types across the JSON and pickle codecs."""
+        values = {
+            "json_key": {"urls": ["https://example.com"], "count": 2, "ok": True},
+            "tuple_key": {"pair": (1, 2)},
+            "bytes_key": b"\x00warc",
+        }
+        for key, value in values.items():
+            await cache_manager.set(key, value)
+
+        # Drop the memory tier so values are decoded from disk
+        cache_manager._mem.clear()
+
+        for key, value in values.items():
+            assert await cache_manager.get(key) == value
+
+    @pytest.mark.asyncio
+    async def test_cache_eviction(self, cache_manager):
+        """Test least recently used entries are evicted for frequently requested keys."""
+        cache_manager.max_size_bytes = 4096
+
+        for i in range(4):
+            await cache_manager.set(f"evict_{i}", b"x" * 1000)
+
+        # A key requested repeatedly wins admission over the LRU entry
+        for _ in range(3):
+            await cache_manager.get("popular")
+        await cache_manager.set("popular", b"x" * 1000)
+
+        assert cache_manager.get_cache_size() <= cache_manager.max_size_bytes
+        assert cache_manager._disk_get(_hash_key("evict_0")) is None
+        assert cache_manager._disk_get(_hash_key("popular")) is not None
+
+    @pytest.mark.asyncio
+    async def test_cache_admission_rejects_cold_keys(self, cache_manager):
+        """Test a one-off key does not displace entries from a full disk cache."""
+        cache_manager.max_size_bytes = 4096
+
+        for i in range(4):
+            await cache_manager.set(f"warm_{i}", b"x" * 1000)
+            await cache_manager.get(f"warm_{i}")
+        await cache_manager.set("cold", b"x" * 1000)
+
+        assert cache_manager._disk_get(_hash_key("cold")) is None
+        assert cache_manager._disk_get(_hash_key("warm_0")) is not None
+        assert cache_manager.get_stats()["admission_rejections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_rejected_overwrite_drops_stale_entry(self, cache_manager):
+        """Test a rejected rewrite of a key does not leave the old value on disk."""
+        cache_manager.max_size_bytes = 2048
+
+        await cache_manager.set("cold", b"x" * 1000)
+        await cache_manager.set("hot", b"1" * 1000)
+        for _ in range(20):
+            await cache_manager.get("cold")
+        await cache_manager.set("hot", b"2" * 1000)
+
+        assert cache_manager.get_stats()["admission_rejections"] == 1
+        cache_manager._mem.clear()
+        assert await cache_manager.get("hot") is None
+
+    @pytest.mark.asyncio
+    async def test_lmdb_metadata_backend(self, tmp_path):
+        """Test the disk tier with LMDB metadata instead of SQLite."""
+        pytest.importorskip("lmdb")
+        config = get_config()
+        original = (config.cache.cache_dir, config.cache.cache_metadata_backend)
+        config.cache.cache_dir = tmp_path / "cache"
+        config.cache.cache_metadata_backend = "lmdb"
+
+        try:
+            manager = CacheManager()
+            manager.max_size_bytes = 4096
+
+            for i in range(4):
+                await manager.set(f"lmdb_{i}", b"x" * 1000)
+            manager._mem.clear()
+            assert await manager.get("lmdb_1") == b"x" * 1000
+
+            # Frequently requested key evicts the least recently used entry
+            for _ in range(3):
+                await manager.get("lmdb_popular")
+            await manager.set("lmdb_popular", b"y" * 1000)
+
+            assert manager.get_cache_size() <= manager.max_size_bytes
+            assert manager._disk_get(_hash_key("lmdb_0")) is None
+            assert manager._disk_get(_hash_key("lmdb_1")) is not None
+
+            await manager.clear()
+            assert manager.get_stats()["entries"] == 0
+            manager.close()
+        finally:
+            config.cache.cache_dir, config.cache.cache_metadata_backend = original
+
     @pytest.mark.asyncio
     async def test_cache_stats(self, cache_manager):
         """Test cache statistics."""
@@ -122,6 +308,7 @@ class TestCacheManager:
         # Verify cleared
         result = await cache_manager.get("key1")
         assert result is None
+        assert cache_manager.get_cache_size() == 0
 
 
 class TestCDXClient:
@@ -166,6 +353,160 @@ class TestCDXClient:
 
         assert len(results) <= 3
 
+    @pytest.mark.asyncio
+    async def test_list_crawls_cached(self, cdx_client):
+        """Test the crawl list is fetched once and reused."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json=[
+                    {"id": "CC-MAIN-2023-50", "name": "December 2023"},
+                    {"id": "CC-MAIN-2024-10", "name": "March 2024"},
+                ],
+            )
+
+        cdx_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await asyncio.gather(*(cdx_client.list_crawls() for _ in range(3)))
+        assert await cdx_client.get_latest_crawl() == "CC-MAIN-2024-10"
+        assert len(requests) == 1
+
+        cdx_client.invalidate_crawls()
+        await cdx_client.list_crawls()
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_list_crawls_dates(self, cdx_client):
+        """Test crawl dates come from the ISO week, defaulting to week 1 without one."""
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                json=[
+                    {"id": "CC-MAIN-2024-10", "name": "March 2024"},
+                    {"id": "CC-MAIN-2012", "name": "2012"},
+                ],
+            )
+
+        cdx_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        dates = {crawl.id: crawl.date for crawl in await cdx_client.list_crawls()}
+        assert dates == {
+            "CC-MAIN-2024-10": datetime(2024, 3, 4),
+            "CC-MAIN-2012": datetime(2012, 1, 2),
+        }
+
+    @pytest.mark.asyncio
+    async def test_list_crawls_skips_invalid_ids(self, cdx_client):
+        """Test one unexpected crawl ID does not empty the whole crawl list."""
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                json=[
+                    {"id": "CC-NEWS-2024-10", "name": "News"},
+                    {"id": "CC-MAIN-2024-10", "name": "March 2024"},
+                ],
+            )
+
+        cdx_client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert [crawl.id for crawl in await cdx_client.list_crawls()] == ["CC-MAIN-2024-10"]
+
+    def test_parse_cdx_line_to_index_record(self):
+        """Test CDX lines parse to internal entries that convert to the API model."""
+        line = (
+            b'["com,example)/", "20240301120000", "https://example.com/", "text/html", '
+            b'"200", "SHA1:ABC", "1234", "5678", "crawl-data/file.warc.gz"]'
+        )
+
+        entry = _parse_cdx_line(line)
+        record = IndexRecord.from_internal(entry)
+
+        assert record.url == "https://example.com/"
+        assert (record.status_code, record.length, record.offset) == (200, 1234, 5678)
+        assert _parse_cdx_line(line.replace(b'"200"', b'"-"')) is None
+
+    def test_pattern_fields_reject_malformed_values(self):
+        """Test CDX timestamps and crawl IDs are checked against their patterns."""
+        entry = _parse_cdx_line(
+            b'["com,example)/", "2024-03-01", "https://example.com/", "text/html", '
+            b'"200", "SHA1:ABC", "1234", "5678", "crawl-data/file.warc.gz"]'
+        )
+
+        with pytest.raises(ValidationError):
+            IndexRecord.from_internal(entry)
+        with pytest.raises(ValidationError):
+            CrawlInfo(id="2024-10", name="2024-10", date=datetime(2024, 3, 4))
+        assert CrawlInfo(id="CC-MAIN-2012", name="2012", date=datetime(2012, 1, 1)).id
+
+    @pytest.mark.asyncio
+    async def test_search_index_tool_validates_records(self, cache_manager, monkeypatch):
+        """Test the search tool returns validated records and drops malformed rows."""
+        from src.tools import discovery
+
+        good = b'"20240301120000", "https://example.com/", "text/html", "200"'
+        bad = b'"2024-03-01", "https://example.com/bad", "text/html", "200"'
+        entries = [
+            _parse_cdx_line(
+                b'["com,example)/", ' + fields + b', "SHA1:ABC", "1234", "5678", "file.warc.gz"]'
+            )
+            for fields in (good, bad)
+        ]
+
+        class StubCDXClient:
+            async def search_index(self, **kwargs):
+                return entries
+
+        monkeypatch.setattr(discovery, "_cache", cache_manager)
+        monkeypatch.setattr(discovery, "_cdx_client", StubCDXClient())
+
+        result = await discovery.search_index("example.com", crawl_id="CC-MAIN-2024-10")
+
+        assert result["count"] == 1
+        assert result["results"] == [IndexRecord.from_internal(entries[0]).model_dump()]
+
+    @pytest.mark.asyncio
+    async def test_crawl_index_reused(self, monkeypatch):
+        """Test the crawl ID lookup table is built once per listing, not per call."""
+        from src.tools import discovery
+
+        calls = []
+
+        async def list_crawls(force_refresh: bool = False):
+            calls.append(force_refresh)
+            return {"count": 1, "crawls": [{"id": "CC-MAIN-2024-10", "name": "March 2024"}]}
+
+        monkeypatch.setattr(discovery, "list_crawls", list_crawls)
+        monkeypatch.setattr(discovery, "_crawl_index", None)
+
+        first = await discovery.crawl_index()
+        second = await discovery.crawl_index()
+
+        assert len(calls) == 1
+        assert first[1] is second[1]
+        assert first[1]["CC-MAIN-2024-10"]["name"] == "March 2024"
+
+    def test_cdx_timestamp_to_epoch(self):
+        """Test CDX timestamps convert to UTC epoch seconds."""
+        epoch = cdx_timestamp_to_epoch("20240301120000")
+
+        assert epoch == 1709294400
+        assert datetime.fromtimestamp(epoch, tz=timezone.utc) == datetime(
+            2024, 3, 1, 12, tzinfo=timezone.utc
+        )
+
+    def test_token_bucket_allows_burst_then_throttles(self):
+        """Test the rate limiter admits a burst and then spaces requests."""
+        bucket = TokenBucket(rate=10.0, capacity=3)
+
+        assert [bucket.consume() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.consume() == pytest.approx(0.1, abs=0.01)
+        assert bucket.consume() == pytest.approx(0.2, abs=0.01)
+
 
 class TestS3Manager:
     """Test S3 manager functionality."""
@@ -193,6 +534,96 @@ class TestS3Manager:
             assert "403" in str(e) or "Forbidden" in str(e) or "404" in str(e)
             pytest.skip(f"S3 access test skipped due to: {e}")
 
+    @pytest.mark.asyncio
+    async def test_download_file_returns_bytes(self, s3_manager):
+        """Test a download is returned as immutable bytes, trimmed to what arrived."""
+        data = b"warc" * 1000
+
+        class FakeClient:
+            def get_object(self, Bucket, Key):
+                # Body shorter than the advertised length
+                return {"Body": io.BytesIO(data), "ContentLength": len(data) + 10}
+
+        s3_manager.client = FakeClient()
+
+        content = await s3_manager.download_file("some/key")
+
+        assert type(content) is bytes
+        assert content == data
+
+    @pytest.mark.asyncio
+    async def test_download_file_parallel(self, s3_manager):
+        """Test ranged parts are reassembled in order."""
+        data = bytes(range(256)) * 40
+
+        class FakeClient:
+            def get_object(self, Bucket, Key, Range=None):
+                start, end = (int(n) for n in Range[len("bytes=") :].split("-"))
+                return {
+                    "Body": io.BytesIO(data[start : end + 1]),
+                    "ContentRange": f"bytes {start}-{end}/{len(data)}",
+                }
+
+        s3_manager.client = FakeClient()
+
+        content = await s3_manager.download_file_parallel("some/key", parts=3)
+
+        assert type(content) is bytes
+        assert content == data
+        assert s3_manager.bytes_downloaded == len(data)
+
+    @pytest.mark.asyncio
+    async def test_get_record_bytes(self, s3_manager, warc_parser):
+        """Test a single record is read with one ranged GET."""
+        content = build_warc(3)
+        columns = warc_parser.parse_file_soa(content)
+        ranges = []
+
+        class FakeClient:
+            def get_object(self, Bucket, Key, Range=None):
+                ranges.append(Range)
+                start, end = (int(n) for n in Range[len("bytes=") :].split("-"))
+                return {"Body": io.BytesIO(content[start : end + 1])}
+
+        s3_manager.client = FakeClient()
+
+        data = await s3_manager.get_record_bytes(
+            "some/file.warc.gz", columns["offsets"][1], columns["lengths"][1]
+        )
+
+        assert len(ranges) == 1
+        assert warc_parser.parse_record_at(data).target_uri == "https://example.com/1"
+
+    @pytest.mark.asyncio
+    async def test_download_and_decompress_to_parser(self, s3_manager, warc_parser):
+        """Test WARC records are parsed from a streamed, gunzipped body."""
+        content = build_warc(3)
+
+        class FakeClient:
+            def get_object(self, Bucket, Key, Range=None):
+                return {"Body": io.BytesIO(content)}
+
+        s3_manager.client = FakeClient()
+
+        records = await s3_manager.download_and_decompress_to_parser("some/key", warc_parser)
+
+        assert [r.payload for r in records] == [f"<html>{i}</html>".encode() for i in range(3)]
+        assert s3_manager.bytes_downloaded == len(content)
+
+    @pytest.mark.asyncio
+    async def test_stream_and_decompress_multi_member(self, s3_manager):
+        """Test streaming decompression across gzip member boundaries."""
+        data = gzip.compress(b"a" * 100_000) + gzip.compress(b"b" * 50_000)
+
+        async def fake_stream_file(key, chunk_size):
+            for i in range(0, len(data), 777):
+                yield data[i : i + 777]
+
+        s3_manager.stream_file = fake_stream_file
+
+        chunks = [chunk async for chunk in s3_manager.stream_and_decompress("some/key.gz")]
+        assert b"".join(chunks) == b"a" * 100_000 + b"b" * 50_000
+
     def test_cost_tracking(self, s3_manager):
         """Test cost tracking functionality."""
         initial_cost = s3_manager.estimated_cost_usd
@@ -225,6 +656,54 @@ class TestWarcParser:
         assert isinstance(counts, dict)
         assert len(counts) == 0
 
+    def test_parse_file_soa(self, warc_parser):
+        """Test columnar header parsing and record lookup without payloads."""
+        content = build_warc(3)
+
+        columns = warc_parser.parse_file_soa(content)
+        assert columns["target_uris"] == [f"https://example.com/{i}" for i in range(3)]
+        assert columns["record_types"] == ["response"] * 3
+        assert columns["offsets"][0] == 0
+        assert sum(columns["lengths"]) == len(content)
+
+        record = warc_parser.find_record_by_url(content, "https://example.com/1")
+        assert record.payload.endswith(b"<html>1</html>")
+
+    def test_parse_multimember_and_record_at(self, warc_parser):
+        """Test per-member parsing and random access by CDX-style offsets."""
+        content = build_warc(3)
+        columns = warc_parser.parse_file_soa(content)
+
+        members = list(warc_parser.parse_file_multimember(content))
+        assert [offset for offset, _ in members] == columns["offsets"]
+
+        record = warc_parser.parse_record_at(
+            content, columns["offsets"][2], columns["lengths"][2]
+        )
+        assert record.target_uri == "https://example.com/2"
+        assert record.payload == b"<html>2</html>"
+
+    def test_extract_http_response(self, warc_parser):
+        """Test HTTP responses are extracted as undecoded bytes."""
+        content = build_warc(2)
+        record = warc_parser.find_record_by_url(content, "https://example.com/1")
+
+        response = warc_parser.extract_http_response(record)
+        assert response["status_code"] == 200
+        assert response["body"] == b"<html>1</html>"
+
+        # Payloads that still carry the HTTP status line and headers
+        raw = record.model_copy(
+            update={
+                "http_headers": None,
+                "payload": b"HTTP/1.1 404 Not Found\r\nContent-Length: 4\r\n\r\ngone",
+            }
+        )
+        response = warc_parser.extract_http_response(raw)
+        assert response["status_code"] == 404
+        assert response["headers"]["Content-Length"] == "4"
+        assert response["body"] == b"gone"
+
 
 class TestIntegration:
     """Test integration between components."""
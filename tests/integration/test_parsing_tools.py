@@ -2,6 +2,7 @@
 
 import pytest
 
+from src.tools import parsing
 from src.tools.parsing import (analyze_seo_metrics, analyze_technologies,
                                detect_language, extract_links_analysis,
                                extract_structured_data_from_page,
@@ -155,6 +156,45 @@ async def test_caching_works():
     assert result1.meta_tags == result2.meta_tags
 
 
+@pytest.mark.asyncio
+async def test_failed_fetch_not_remembered(monkeypatch):
+    """Test a failed page fetch is retried instead of served from the page cache."""
+    url = "https://example.com/flaky"
+    crawl_id = "CC-MAIN-2024-10"
+    responses = [
+        {"error": "Page not found"},
+        {
+            "url": url,
+            "crawl_id": crawl_id,
+            "html": "<html><title>Back</title></html>",
+            "status_code": 200,
+            "headers": {},
+            "mime_type": "text/html",
+            "length": 32,
+            "timestamp": "20240301120000",
+        },
+    ]
+    calls = []
+
+    async def fake_fetch_page_dict(url: str, crawl_id: str):
+        calls.append(url)
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(parsing, "fetch_page_dict", fake_fetch_page_dict)
+    monkeypatch.setattr(parsing, "_page_contexts", type(parsing._page_contexts)())
+
+    failed = await parsing._fetch_page(url, crawl_id)
+    assert failed.html is None
+
+    page = await parsing._fetch_page(url, crawl_id)
+    assert page.status_code == 200
+    assert len(calls) == 2
+
+    # The successful fetch is remembered
+    await parsing._fetch_page(url, crawl_id)
+    assert len(calls) == 2
+
+
 @pytest.mark.asyncio
 async def test_error_handling_invalid_url():
     """Test graceful error handling for invalid URLs."""
@@ -111,6 +111,59 @@ async def test_update_session(clean_database):
     assert updated_session.updated_at > original_updated_at
 
 
+@pytest.mark.asyncio
+async def test_bulk_update_sessions(clean_database):
+    """Test updating several sessions at once, all or nothing."""
+    session1 = await investigation_state.create_session()
+    session2 = await investigation_state.create_session()
+    session1.queries_run.append({"query": "one"})
+    session2.analysis_summary["total_pages"] = 2
+
+    await investigation_state.bulk_update_sessions([session1, session2])
+
+    assert (await investigation_state.get_session(session1.id)).queries_run == [{"query": "one"}]
+    assert (await investigation_state.get_session(session2.id)).analysis_summary == {
+        "total_pages": 2
+    }
+
+    session1.queries_run.append({"query": "two"})
+    missing = investigation_state.InvestigationSession(
+        id="nonexistent-id",
+        created_at=session1.created_at,
+        updated_at=session1.updated_at,
+    )
+    with pytest.raises(ValueError):
+        await investigation_state.bulk_update_sessions([session1, missing])
+
+    investigation_state._session_cache.clear()
+    assert len((await investigation_state.get_session(session1.id)).queries_run) == 1
+
+
+@pytest.mark.asyncio
+async def test_mutate_session(clean_database):
+    """Test concurrent read-modify-write changes are all kept."""
+    import asyncio
+
+    session = await investigation_state.create_session()
+
+    await asyncio.gather(
+        *(
+            investigation_state.mutate_session(
+                session.id, lambda s, i=i: s.queries_run.append({"query": f"q{i}"})
+            )
+            for i in range(10)
+        )
+    )
+
+    investigation_state._session_cache.clear()
+    stored = await investigation_state.get_session(session.id)
+    assert sorted(q["query"] for q in stored.queries_run) == sorted(f"q{i}" for i in range(10))
+    assert stored.updated_at > session.updated_at
+
+    with pytest.raises(ValueError):
+        await investigation_state.mutate_session("nonexistent-id", lambda s: None)
+
+
 @pytest.mark.asyncio
 async def test_get_all_sessions(clean_database):
     """Test retrieving all investigation sessions."""
@@ -251,6 +304,118 @@ async def test_session_persistence(clean_database):
     assert retrieved.id == session_id
 
 
+@pytest.mark.asyncio
+async def test_get_all_sessions_summary(clean_database):
+    """Test session summaries are counted in SQL and paginated."""
+    older = await investigation_state.create_session()
+    newer = await investigation_state.create_session()
+    newer.queries_run.extend([{"query": "a"}, {"query": "b"}])
+    newer.cached_results["a"] = {"data": 1}
+    await investigation_state.update_session(newer)
+
+    summaries = await investigation_state.get_all_sessions_summary()
+
+    assert [s["id"] for s in summaries] == [newer.id, older.id]
+    assert summaries[0]["queries_count"] == 2
+    assert summaries[0]["has_cached_results"] is True
+    assert summaries[0]["has_analysis"] is False
+    assert summaries[1]["queries_count"] == 0
+
+    page = await investigation_state.get_all_sessions_summary(limit=1, offset=1)
+    assert [s["id"] for s in page] == [older.id]
+
+    listing = json.loads(await investigation_state.list_investigations())
+    assert listing == {"total_sessions": 2, "sessions": summaries}
+
+
+@pytest.mark.asyncio
+async def test_timestamps_stored_as_epoch_microseconds(clean_database):
+    """Test timestamps are stored as integers, and legacy ISO rows are converted."""
+    session = await investigation_state.create_session()
+    legacy = investigation_state.InvestigationSession(
+        id="legacy",
+        created_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        updated_at=datetime(2024, 1, 2, 3, 4, 6, tzinfo=timezone.utc),
+    )
+    conn = sqlite3.connect(test_db_path)
+    conn.execute(
+        "INSERT INTO investigation_sessions VALUES (?, ?, ?, ?)",
+        (
+            legacy.id,
+            legacy.created_at.isoformat(),
+            legacy.updated_at.isoformat(),
+            legacy.model_dump_json(),
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+    investigation_state._init_database()
+
+    rows = investigation_state._get_connection().execute(
+        "SELECT typeof(created_at), typeof(updated_at) FROM investigation_sessions"
+    )
+    assert set(rows) == {("integer", "integer")}
+
+    summaries = await investigation_state.get_all_sessions_summary()
+    assert [s["id"] for s in summaries] == [session.id, legacy.id]
+    assert summaries[0]["created_at"] == session.created_at.isoformat()
+    assert summaries[1]["created_at"] == legacy.created_at.isoformat()
+    assert summaries[1]["updated_at"] == legacy.updated_at.isoformat()
+
+
+@pytest.mark.asyncio
+async def test_connection_reused_until_reinitialized(clean_database):
+    """Test CRUD calls share one connection that is reopened after re-initialization."""
+    session = await investigation_state.create_session()
+    conn = investigation_state._get_connection()
+
+    await investigation_state.get_session(session.id)
+    assert investigation_state._get_connection() is conn
+
+    investigation_state._init_database()
+    assert investigation_state._get_connection() is not conn
+    assert await investigation_state.get_session(session.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_session_cache(clean_database):
+    """Test cached sessions are independent copies kept in step with writes."""
+    session = await investigation_state.create_session()
+    assert session.id in investigation_state._session_cache
+
+    first = await investigation_state.get_session(session.id)
+    first.queries_run.append({"query": "unsaved"})
+    second = await investigation_state.get_session(session.id)
+    assert second.queries_run == []
+
+    second.queries_run.append({"query": "saved"})
+    await investigation_state.update_session(second)
+    assert (await investigation_state.get_session(session.id)).queries_run == [
+        {"query": "saved"}
+    ]
+
+    await investigation_state.delete_session(session.id)
+    assert session.id not in investigation_state._session_cache
+    assert await investigation_state.get_session(session.id) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_session_calls(clean_database):
+    """Test concurrent calls share the connection safely from worker threads."""
+    import asyncio
+
+    sessions = await asyncio.gather(*(investigation_state.create_session() for _ in range(20)))
+    for i, session in enumerate(sessions):
+        session.queries_run.append({"query": f"q{i}"})
+    await asyncio.gather(*(investigation_state.update_session(s) for s in sessions))
+
+    investigation_state._session_cache.clear()
+    retrieved = await asyncio.gather(*(investigation_state.get_session(s.id) for s in sessions))
+
+    assert [r.queries_run for r in retrieved] == [s.queries_run for s in sessions]
+
+
 @pytest.mark.asyncio
 async def test_session_ordering(clean_database):
     """Test that sessions are returned in creation order (newest first)."""